@@ -9,7 +9,7 @@ Or mixin only: class MyAdmin(DJNextAdminMixin, admin.ModelAdmin): ...
 from django.contrib import admin
 from django.utils.html import format_html
 
-from .models import AuditLog
+from .models import AuditLog, Job
 
 
 class DJNextAdminMixin:
@@ -52,6 +52,16 @@ class DJNextModelAdmin(DJNextAdminMixin, admin.ModelAdmin):
         display string for each record in global search results. If unset,
         uses the model's __str__.
 
+      - djnext_label_fields: List of field names whose values label this
+        model's options in relation widgets (autocomplete), e.g.
+        ['name', 'code']. Only these columns are fetched. If unset, uses
+        the model's __str__.
+
+      - djnext_autocomplete_index: True to serve autocomplete for this model
+        from an in-process index instead of the database (small lookup tables:
+        categories, countries, ...). Rebuilt when a row is saved or deleted.
+        Ignored when get_queryset or djnext_row_scope is customized.
+
       - djnext_media: Dict like Django's ModelAdmin.Media for custom CSS/JS
         on this model's pages: {'css': ['url1', 'url2'], 'js': ['url1']}.
         URLs are loaded when the user is on list/detail/create for this model.
@@ -112,6 +122,20 @@ class DJNextModelAdmin(DJNextAdminMixin, admin.ModelAdmin):
                 return {'preview_html': obj.render_preview()}
             preview.detail = True
             preview.methods = ['GET']
+
+      - background: Set `.background = True` on an admin action, object tool
+        or custom view to run it as a background job instead of inside the
+        request. The endpoint answers 202 with {job_id, status, status_url};
+        poll /api/jobs/{job_id}/ for status and progress and read the return
+        value from /api/jobs/{job_id}/result/ (for an action run in several
+        chunks, the return values are under 'results'). Permissions are checked before
+        the job is queued. See JOB_RUNNER, JOB_WORKERS and
+        JOB_MAX_CONCURRENT_PER_MODEL.
+
+        Example:
+            def recalculate_prices(self, request, queryset):
+                ...
+            recalculate_prices.background = True
     """
     pass
 
@@ -167,3 +191,27 @@ class AuditLogAdmin(admin.ModelAdmin):
                 parts.append(field)
         return '; '.join(parts[:5]) + ('…' if len(parts) > 5 else '') if parts else '—'
     changes_summary.short_description = 'Changes'
+
+
+@admin.register(Job)
+class JobAdmin(admin.ModelAdmin):
+    """Background jobs – status of actions, object tools and views run with background = True."""
+    list_display = ['id', 'status', 'kind', 'name', 'app_label', 'model_name', 'object_id', 'progress', 'user', 'created_at', 'finished_at']
+    list_filter = ['status', 'kind', 'app_label', 'model_name', 'created_at']
+    search_fields = ['id', 'name', 'app_label', 'model_name', 'object_id', 'user__email', 'user__username']
+    readonly_fields = ['id', 'user', 'app_label', 'model_name', 'kind', 'name', 'object_id', 'status', 'progress_done', 'progress_total', 'result', 'error', 'created_at', 'started_at', 'finished_at']
+    date_hierarchy = 'created_at'
+    ordering = ['-created_at']
+    list_per_page = 50
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+    def progress(self, obj):
+        if not obj.progress_total:
+            return '—'
+        return f'{obj.progress_done} / {obj.progress_total}'
+    progress.short_description = 'Progress'
@@ -6,26 +6,38 @@ Included under path('api/', ...) from the main urls.py, so the API is at
 Do not include api_urls in your project; use only include('djnext_admin.urls').
 """
 
-from django.urls import path, include
+from django.urls import path, re_path, include
 from rest_framework.routers import DefaultRouter
 
 from .views.schema import GlobalSchemaView, ModelSchemaView, SiteInfoView
 from .views.auth import AuthViewSet
 from .views.search import GlobalSearchView
 from .views.health import HealthView
-from .views.relation_options import RelationOptionsView
+from .views.relation_options import RelationLabelsView, RelationOptionsView
+from .views.jobs import JobDetailView, JobListView, JobResultView
 from .views.factory import ViewSetFactory
-from .core.registry import get_registered_models
+from .views.dispatch import LazyModelDispatcher, get_model_routes, route_template
+from .core.registry import get_registered_models, get_registry_index
+from .settings import djnext_settings
 
 
 class DJNextRouter(DefaultRouter):
-    """Router for DJNext Admin API. Registers all models from Django admin."""
+    """
+    Router for DJNext Admin API. Registers all models from Django admin.
+
+    With LAZY_ROUTING, no ViewSet is built at import time: a single dispatcher
+    route serves /<app_label>/<model_name>/... and materializes each model's
+    ViewSet on its first request (see views.dispatch).
+    """
 
     def __init__(self):
         super().__init__()
         self._registered = False
+        self.lazy_dispatcher = None
 
     def get_urls(self):
+        if djnext_settings.LAZY_ROUTING:
+            return self._get_lazy_urls()
         if not self._registered:
             self._register_models()
             self._registered = True
@@ -42,6 +54,47 @@ class DJNextRouter(DefaultRouter):
                 basename=f'{app_label}_{model_name}'
             )
 
+    def _get_lazy_urls(self):
+        """
+        API root, named list/detail and @action routes per model (for reverse())
+        and one catch-all route for every other model URL, all served by the
+        dispatcher.
+        """
+        dispatcher = self.lazy_dispatcher = LazyModelDispatcher()
+
+        api_root_dict = {}
+        urls = []
+        for (app_label, model_name), (_, model_admin) in get_registry_index().by_label.items():
+            prefix = f'{app_label}/{model_name}'
+            basename = f'{app_label}_{model_name}'
+            api_root_dict[prefix] = f'{basename}-list'
+            kwargs = {'app_label': app_label, 'model_name': model_name}
+            urls.append(re_path(
+                rf'^{prefix}/$', dispatcher, kwargs=kwargs, name=f'{basename}-list'
+            ))
+            urls.append(re_path(
+                rf'^{prefix}/(?P<pk>[^/.]+)/$', dispatcher, kwargs=kwargs, name=f'{basename}-detail'
+            ))
+            for url_name, url_path, detail in get_model_routes(model_admin):
+                if detail:
+                    url_path = rf'(?P<pk>[^/.]+)/{url_path}'
+                urls.append(re_path(
+                    rf'^{prefix}/{url_path}/$',
+                    dispatcher,
+                    kwargs={**kwargs, 'route': f'{route_template(url_path)}/'},
+                    name=f'{basename}-{url_name}',
+                ))
+
+        urls.append(re_path(
+            r'^(?P<app_label>[^/.]+)/(?P<model_name>[^/.]+)(?P<rest>[/.].*)$',
+            dispatcher,
+            name='model-dispatch',
+        ))
+        urls.insert(0, re_path(
+            r'^$', self.APIRootView.as_view(api_root_dict=api_root_dict), name=self.root_view_name
+        ))
+        return urls
+
 
 router = DJNextRouter()
 
@@ -53,6 +106,10 @@ urlpatterns = [
     path('schema/', GlobalSchemaView.as_view(), name='global-schema'),
     path('search/', GlobalSearchView.as_view(), name='global-search'),
     path('relation-options/', RelationOptionsView.as_view(), name='relation-options'),
+    path('relation-labels/', RelationLabelsView.as_view(), name='relation-labels'),
+    path('jobs/', JobListView.as_view(), name='job-list'),
+    path('jobs/<uuid:job_id>/', JobDetailView.as_view(), name='job-detail'),
+    path('jobs/<uuid:job_id>/result/', JobResultView.as_view(), name='job-result'),
     path('auth/login/', AuthViewSet.as_view({'post': 'login'}), name='auth-login'),
     path('auth/logout/', AuthViewSet.as_view({'post': 'logout'}), name='auth-logout'),
     path('auth/user/', AuthViewSet.as_view({'get': 'user', 'patch': 'profile_update'}), name='auth-user'),
@@ -17,9 +17,48 @@ class DjnextAdminConfig(AppConfig):
     def ready(self):
         """
         Called when Django starts.
-        Validates settings after all apps are loaded.
+        Validates settings after all apps are loaded and connects
+        cache invalidation signals.
         """
         self._validate_dependencies()
+        self._connect_signals()
+        self._load_schema_artifact()
+        self._start_warm_up()
+
+    def _connect_signals(self):
+        """
+        Connect receivers that keep DJNext caches in sync.
+        """
+        from . import signals
+        from .core.registry import install_registry_hooks
+        signals.connect()
+        install_registry_hooks()
+
+    def _load_schema_artifact(self):
+        """
+        Read the precompiled schema (SCHEMA_ARTIFACT_PATH) for warm starts.
+        """
+        from .core.schema_artifact import load_artifact
+        load_artifact()
+
+    def _start_warm_up(self):
+        """
+        Pre-build ViewSets and serializers in the background (WARM_UP_FACTORIES).
+        Waits for the app registry so admin registrations of later apps are included.
+        """
+        from .settings import djnext_settings
+        if not djnext_settings.WARM_UP_FACTORIES:
+            return
+
+        import threading
+        from django.apps import apps
+
+        def warm_up():
+            apps.ready_event.wait(timeout=60)
+            from .views.factory import ViewSetFactory
+            ViewSetFactory.warm_up()
+
+        threading.Thread(target=warm_up, name='djnext-warm-up', daemon=True).start()
 
     def _validate_dependencies(self):
         """
@@ -2,9 +2,12 @@
 Audit logging – record create/update/delete for every model in DJNext Admin.
 
 Call log_audit from viewset perform_create, perform_update, perform_destroy
-so that AuditLog is written without touching host app models.
+so that AuditLog is written without touching host app models. Bulk endpoints
+call log_audit_bulk to write all their entries in one INSERT.
 """
 
+from django.db import router, transaction
+
 from .models import AuditLog
 
 
@@ -52,3 +55,40 @@ def log_audit(action, request, instance=None, object_id=None, object_repr=None,
         )
     except Exception:
         pass  # do not break CRUD if logging fails (e.g. table not migrated yet)
+
+
+def log_audit_bulk(action, request, entries):
+    """
+    Write audit log entries for many objects with one bulk_create. Safe to
+    call even if AuditLog table does not exist yet.
+
+    Args:
+        action: 'create' | 'update' | 'delete'
+        request: HttpRequest (for user)
+        entries: iterable of (instance, changes) or (instance, changes, object_repr);
+            changes may be None
+    """
+    if action not in ('create', 'update', 'delete'):
+        return
+    try:
+        user = getattr(request, 'user', None)
+        user = user if (user and getattr(user, 'is_authenticated', True)) else None
+        logs = []
+        for instance, changes, *rest in entries:
+            opts = instance._meta
+            logs.append(AuditLog(
+                user=user,
+                action=action,
+                app_label=opts.app_label,
+                model_name=opts.model_name,
+                table_name=getattr(opts, 'db_table', '') or '',
+                object_id=str(instance.pk),
+                object_repr=(rest[0] if rest else str(instance))[:255],
+                changes=changes or {},
+            ))
+        if logs:
+            # Savepoint: a failed insert must not break the caller's transaction
+            with transaction.atomic(using=router.db_for_write(AuditLog)):
+                AuditLog.objects.bulk_create(logs)
+    except Exception:
+        pass  # do not break CRUD if logging fails (e.g. table not migrated yet)
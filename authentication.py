@@ -0,0 +1,140 @@
+"""
+Authentication classes for DJNext Admin.
+
+DJNextJWTAuthentication accepts the same SimpleJWT tokens as AuthViewSet.login
+issues, but resolves the user from the Django cache instead of the database.
+Entries are keyed by the token's user id and a per-user version that is bumped
+whenever the user is saved or deleted (see djnext_admin.signals), so password,
+is_active, is_staff and is_superuser changes take effect on the next request.
+Writes that bypass signals (QuerySet.update(is_active=False), raw SQL) are only
+seen once the entry expires, after at most AUTH_CACHE_TIMEOUT seconds; call
+invalidate_user() after them to apply them at once.
+
+Only the fields in CACHED_USER_FIELDS (plus the pk and USERNAME_FIELD) are
+cached; the user is rebuilt with every other field deferred, loaded from the
+database on first access. The password hash is never cached, only the digest
+REVOKE_TOKEN_CLAIM is compared with. The user's permission matrix is cached
+alongside and reused while the permission versions still match.
+"""
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+
+from .core import permission_matrix
+from .settings import djnext_settings
+
+
+CACHE_PREFIX = 'djnext_admin:auth'
+
+# User fields the authentication and permission checks read on every request
+CACHED_USER_FIELDS = ('is_active', 'is_staff', 'is_superuser')
+
+try:
+    from rest_framework_simplejwt.authentication import JWTAuthentication
+    from rest_framework_simplejwt.exceptions import AuthenticationFailed
+    from rest_framework_simplejwt.settings import api_settings as jwt_settings
+    from rest_framework_simplejwt.utils import get_md5_hash_password
+except ImportError:
+    JWTAuthentication = None
+
+
+def _version_key(user_id) -> str:
+    return f'{CACHE_PREFIX}:user:{user_id}:version'
+
+
+def _get_user_id(user):
+    """Value of the token's user id claim for this user."""
+    if JWTAuthentication is not None:
+        return getattr(user, jwt_settings.USER_ID_FIELD, user.pk)
+    return user.pk
+
+
+def invalidate_user(user):
+    """Drop the cached authentication entry of a user (on save/delete)."""
+    key = _version_key(_get_user_id(user))
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, 1, None)
+
+
+if JWTAuthentication is not None:
+
+    class DJNextJWTAuthentication(JWTAuthentication):
+        """
+        SimpleJWT authentication with a cached user lookup.
+
+        Set AUTH_CACHE_TIMEOUT to 0 to disable caching (plain JWTAuthentication).
+        """
+
+        def get_user(self, validated_token):
+            timeout = djnext_settings.AUTH_CACHE_TIMEOUT
+            if not timeout:
+                return super().get_user(validated_token)
+
+            try:
+                user_id = validated_token[jwt_settings.USER_ID_CLAIM]
+            except KeyError:
+                # Let SimpleJWT raise its usual error
+                return super().get_user(validated_token)
+
+            key = f'{CACHE_PREFIX}:{user_id}:{cache.get(_version_key(user_id), 0)}'
+            entry = cache.get(key)
+            if entry is None:
+                user = super().get_user(validated_token)
+                cache.set(key, self._build_entry(user), timeout)
+                return user
+
+            user = self._load_user(entry)
+            self._check_user(entry, validated_token)
+            if entry['perms'] is not None and entry['versions'] == permission_matrix.get_versions(user.pk):
+                permission_matrix.prime_permission_matrix(user, entry['perms'])
+            return user
+
+        def _build_entry(self, user):
+            """
+            Cache entry: the cached user fields, the password digest the token
+            check needs, and the user's permissions with their versions.
+            """
+            versions = permission_matrix.get_versions(user.pk)
+            matrix = permission_matrix.get_permission_matrix(user)
+            perms = None
+            if matrix is not None and not matrix.superuser:
+                perms = sorted(matrix.perms)
+
+            names = {user._meta.pk.attname, user.USERNAME_FIELD, *CACHED_USER_FIELDS}
+            fields = {
+                field.attname: getattr(user, field.attname)
+                for field in user._meta.concrete_fields
+                if field.attname in names
+            }
+            password_digest = None
+            if jwt_settings.CHECK_REVOKE_TOKEN:
+                password_digest = get_md5_hash_password(user.password)
+            return {
+                'fields': fields,
+                'db': user._state.db,
+                'password_digest': password_digest,
+                'versions': versions,
+                'perms': perms,
+            }
+
+        def _load_user(self, entry):
+            """User instance from a cache entry; uncached fields are deferred."""
+            user_model = get_user_model()
+            fields = entry['fields']
+            names = [f.attname for f in user_model._meta.concrete_fields if f.attname in fields]
+            return user_model.from_db(entry['db'], names, [fields[name] for name in names])
+
+        def _check_user(self, entry, validated_token):
+            """The checks JWTAuthentication.get_user runs after loading the user."""
+            if jwt_settings.CHECK_USER_IS_ACTIVE and not entry['fields'].get('is_active', True):
+                raise AuthenticationFailed('User is inactive', code='user_inactive')
+
+            if jwt_settings.CHECK_REVOKE_TOKEN:
+                if validated_token.get(
+                    jwt_settings.REVOKE_TOKEN_CLAIM
+                ) != entry['password_digest']:
+                    raise AuthenticationFailed(
+                        "The user's password has been changed.", code='password_changed'
+                    )
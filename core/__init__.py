@@ -8,16 +8,23 @@ from .registry import (
     get_registered_models,
     get_model_admin,
     get_models_by_app,
+    get_registry_index,
+    invalidate_registry_index,
     is_model_registered,
 )
 from .introspection import ModelIntrospector, FieldIntrospector
+from .row_scope import apply_row_scope, get_row_scope
 
 __all__ = [
     'get_registry',
     'get_registered_models',
     'get_model_admin',
     'get_models_by_app',
+    'get_registry_index',
+    'invalidate_registry_index',
     'is_model_registered',
     'ModelIntrospector',
     'FieldIntrospector',
+    'apply_row_scope',
+    'get_row_scope',
 ]
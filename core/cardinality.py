@@ -0,0 +1,146 @@
+"""
+Estimated field cardinality.
+
+How many options a relation widget or list filter would offer:
+- relations: rows of the related model
+- choices and booleans: from the field definition
+- other columns: distinct values
+
+On PostgreSQL estimates come from planner statistics (pg_class.reltuples,
+pg_stats.n_distinct) without scanning; elsewhere from a bounded COUNT and a
+sampled COUNT(DISTINCT). Estimates are cached per model for
+CARDINALITY_CACHE_TIMEOUT seconds.
+"""
+
+import hashlib
+import logging
+from typing import Dict, Iterable, Optional
+
+from django.core.cache import cache
+from django.db import DatabaseError, connections, router, transaction
+from django.db.models import BooleanField, Count
+
+from ..settings import djnext_settings
+
+
+logger = logging.getLogger('djnext_admin')
+
+CACHE_PREFIX = 'djnext_admin:cardinality'
+# Upper bound of exact counts on backends without statistics
+MAX_COUNT = 100000
+# Rows sampled for COUNT(DISTINCT) on backends without statistics
+SAMPLE_SIZE = 10000
+
+
+def _connection(model):
+    return connections[router.db_for_read(model)]
+
+
+def _pg_row_estimate(model) -> Optional[int]:
+    """pg_class.reltuples, or None when the table was never analyzed."""
+    connection = _connection(model)
+    with connection.cursor() as cursor:
+        cursor.execute(
+            'SELECT reltuples FROM pg_class WHERE oid = to_regclass(%s)',
+            [connection.ops.quote_name(model._meta.db_table)],
+        )
+        row = cursor.fetchone()
+    if row is None or row[0] is None or row[0] < 0:
+        return None
+    return int(row[0])
+
+
+def _pg_distinct_estimate(model, column) -> Optional[int]:
+    """pg_stats.n_distinct (negative = fraction of rows), or None without statistics."""
+    connection = _connection(model)
+    with connection.cursor() as cursor:
+        cursor.execute(
+            'SELECT n_distinct FROM pg_stats '
+            'WHERE schemaname = ANY(current_schemas(false)) AND tablename = %s AND attname = %s',
+            [model._meta.db_table, column],
+        )
+        row = cursor.fetchone()
+    if row is None or row[0] is None:
+        return None
+    n_distinct = row[0]
+    if n_distinct >= 0:
+        return int(n_distinct)
+    rows = _pg_row_estimate(model)
+    return int(-n_distinct * rows) if rows is not None else None
+
+
+def estimate_rows(model) -> int:
+    """Estimated number of rows of a model (capped at MAX_COUNT without statistics)."""
+    if _connection(model).vendor == 'postgresql':
+        estimate = _pg_row_estimate(model)
+        if estimate is not None:
+            return estimate
+    return model._default_manager.order_by().values('pk')[:MAX_COUNT].count()
+
+
+def estimate_distinct(model, field) -> int:
+    """Estimated number of distinct values of a concrete column."""
+    if _connection(model).vendor == 'postgresql':
+        estimate = _pg_distinct_estimate(model, field.column)
+        if estimate is not None:
+            return estimate
+
+    manager = model._default_manager
+    sample = manager.order_by().values('pk')[:SAMPLE_SIZE]
+    distinct = manager.filter(pk__in=sample).aggregate(n=Count(field.name, distinct=True))['n']
+    sampled = sample.count()
+    if sampled < SAMPLE_SIZE:
+        # The sample was the whole table
+        return distinct
+    if distinct < sampled // 2:
+        # Low-cardinality column: the sample already saw (nearly) every value
+        return distinct
+    return round(distinct / sampled * estimate_rows(model))
+
+
+def estimate_field(model, field) -> Optional[int]:
+    """Estimated options of a field, or None when it cannot be estimated."""
+    if field.is_relation:
+        related_model = field.related_model
+        return estimate_rows(related_model) if related_model is not None else None
+    if field.choices:
+        return len(field.flatchoices)
+    if isinstance(field, BooleanField):
+        return 3 if field.null else 2
+    if getattr(field, 'concrete', False):
+        return estimate_distinct(model, field)
+    return None
+
+
+def get_cardinality(model, fields: Iterable) -> Dict[str, int]:
+    """
+    {field name: estimated options} for the given model fields, cached per
+    model and field set. Fields whose estimate fails are omitted.
+    """
+    fields = list(fields)
+    if not fields:
+        return {}
+
+    names = ','.join(sorted(f.name for f in fields))
+    key = f'{CACHE_PREFIX}:{model._meta.label_lower}:{hashlib.sha1(names.encode()).hexdigest()[:12]}'
+    timeout = djnext_settings.CARDINALITY_CACHE_TIMEOUT
+    if timeout:
+        result = cache.get(key)
+        if result is not None:
+            return result
+
+    result = {}
+    for field in fields:
+        try:
+            # Savepoint: a failed statistics query must not break the request's transaction
+            with transaction.atomic(using=router.db_for_read(model)):
+                estimate = estimate_field(model, field)
+        except DatabaseError:
+            logger.warning('DJNext could not estimate cardinality of %s.%s', model._meta.label, field.name)
+            continue
+        if estimate is not None:
+            result[field.name] = estimate
+
+    if timeout:
+        cache.set(key, result, timeout)
+    return result
@@ -0,0 +1,99 @@
+"""
+Thread-safe build-once cache for dynamically created classes.
+
+Used by ViewSetFactory, SerializerFactory and the lazy router. Concurrent first
+requests for the same key wait on a per-key lock instead of building duplicate
+classes; hits, misses and build time are counted for monitoring
+(see get_factory_stats and the health endpoint).
+"""
+
+import threading
+import time
+from typing import Any, Callable, Dict, Hashable, List
+
+
+# All caches, for get_factory_stats()
+_caches: List['FactoryCache'] = []
+
+
+class FactoryCache:
+    """
+    Dict-like cache where each key is built at most once.
+
+    Args:
+        name: Label used in monitoring output.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self._data = {}
+        self._locks = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.build_time = 0.0
+        _caches.append(self)
+
+    def get_or_build(self, key: Hashable, builder: Callable[[], Any]) -> Any:
+        """Return the cached value for key, building it with builder() on first use."""
+        try:
+            value = self._data[key]
+        except KeyError:
+            pass
+        else:
+            self.hits += 1
+            return value
+
+        with self._get_key_lock(key):
+            # Another thread may have built it while we waited
+            if key in self._data:
+                self.hits += 1
+                return self._data[key]
+
+            start = time.perf_counter()
+            value = builder()
+            elapsed = time.perf_counter() - start
+
+            with self._lock:
+                self._data[key] = value
+                self._locks.pop(key, None)
+                self.misses += 1
+                self.build_time += elapsed
+        return value
+
+    def _get_key_lock(self, key):
+        with self._lock:
+            lock = self._locks.get(key)
+            if lock is None:
+                lock = self._locks[key] = threading.Lock()
+            return lock
+
+    def __contains__(self, key) -> bool:
+        return key in self._data
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def keys(self) -> List[Hashable]:
+        return list(self._data)
+
+    def pop(self, key, default=None):
+        with self._lock:
+            return self._data.pop(key, default)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            'size': len(self._data),
+            'hits': self.hits,
+            'misses': self.misses,
+            'build_time_ms': round(self.build_time * 1000, 2),
+        }
+
+
+def get_factory_stats() -> Dict[str, Dict[str, Any]]:
+    """Counters of every factory cache: {name: {size, hits, misses, build_time_ms}}."""
+    return {cache.name: cache.stats() for cache in _caches}
@@ -7,6 +7,8 @@ JSON schema for frontend consumption.
 
 from typing import Dict, List, Any, Optional
 
+from ..settings import djnext_settings
+
 
 def _title_name(s):
     """Capitalize model/verbose name for display (e.g. 'user address' -> 'User Address')."""
@@ -113,12 +115,17 @@ class FieldIntrospector:
                 schema['default'] = default
             schema['has_default'] = True
 
-        # Add choices
+        # Add choices (long lists are searched via the choices/<field>/ endpoint)
         if field.choices:
-            schema['choices'] = [
-                {'value': value, 'label': str(label)}
-                for value, label in field.choices
-            ]
+            choices_count = len(field.flatchoices)
+            if choices_count > djnext_settings.CHOICES_INLINE_LIMIT:
+                schema['remote_choices'] = True
+                schema['choices_count'] = choices_count
+            else:
+                schema['choices'] = [
+                    {'value': value, 'label': str(label)}
+                    for value, label in field.choices
+                ]
             schema['widget'] = 'select'
 
         # Handle relations
@@ -135,10 +142,11 @@ class FieldIntrospector:
         """Get field's default value (if not callable)."""
         if not self._has_default(field):
             return None
-        default = field.get_default()
-        if callable(default):
-            return None  # Don't include callable defaults
-        return default
+        if callable(field.default):
+            # Don't include callable defaults (get_default() would call them,
+            # e.g. timezone.now, and the value would be frozen in cached schemas)
+            return None
+        return field.get_default()
 
     def _get_relation_schema(self) -> Dict[str, Any]:
         """Get schema for relation field."""
@@ -0,0 +1,149 @@
+"""
+In-process lookup index for small lookup tables and long choice lists.
+
+A LookupIndex holds (key, label) entries with their searchable texts in a
+sorted array: prefix matches are found with bisect, substring matches with a
+scan, so autocomplete on a few thousand rows needs no database query.
+
+Model indexes are built on first use and kept per process, tagged with the
+model's data version (see core.model_version): saving or deleting a row makes
+every worker rebuild its copy on its next lookup. Choice indexes are built
+once per field and language (choices are part of the code).
+"""
+
+import threading
+from bisect import bisect_left
+from typing import Callable, Iterable, Optional, Tuple
+
+from django.utils import translation
+
+from .model_version import bump_model_version, get_model_version
+
+# {model label: (version, LookupIndex or None)}; None = model over the row limit
+_indexes = {}
+# {(model label, field name, language): LookupIndex}
+_choice_indexes = {}
+_lock = threading.Lock()
+
+
+def normalize(text) -> str:
+    return str(text).casefold()
+
+
+class LookupIndex:
+    """
+    Immutable searchable set of entries.
+
+    Args:
+        entries: Iterable of (position, key, label, texts). position orders
+            results within a rank (pk for models, declaration order for choices);
+            texts are the values matched against the query.
+    """
+
+    __slots__ = ('_entries', '_positions', '_terms', '_term_keys')
+
+    def __init__(self, entries: Iterable[Tuple]):
+        self._entries = {}
+        terms = []
+        for position, key, label, texts in entries:
+            self._entries[position] = (key, label)
+            for text in texts:
+                if text not in (None, ''):
+                    terms.append((normalize(text), position))
+        terms.sort()
+        self._positions = sorted(self._entries)
+        self._terms = terms
+        self._term_keys = [term for term, _ in terms]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, position) -> Optional[Tuple]:
+        """(key, label) of the entry at position, or None."""
+        return self._entries.get(position)
+
+    def search(self, query: str, limit: int, after: Optional[Tuple] = None):
+        """
+        Matches ranked like the database autocomplete: prefix matches (rank 0)
+        before substring matches (rank 1), each ordered by position.
+
+        Args:
+            query: Search text; empty matches every entry with rank 0.
+            limit: Page size.
+            after: (rank, position) of the last row of the previous page.
+
+        Returns:
+            tuple: ([(rank, position, key, label)], has_more)
+        """
+        query = normalize(query)
+        if not query:
+            ranked = [(0, position) for position in self._positions]
+        else:
+            prefix = set()
+            start = bisect_left(self._term_keys, query)
+            for i in range(start, len(self._terms)):
+                term, position = self._terms[i]
+                if not term.startswith(query):
+                    break
+                prefix.add(position)
+            contains = {
+                position for term, position in self._terms
+                if query in term and position not in prefix
+            }
+            ranked = [(0, p) for p in sorted(prefix)] + [(1, p) for p in sorted(contains)]
+
+        if after is not None:
+            ranked = [row for row in ranked if row > after]
+
+        rows = [(rank, position) + self._entries[position] for rank, position in ranked[:limit]]
+        return rows, len(ranked) > limit
+
+
+def get_index(model, builder: Callable[[], Optional[LookupIndex]]) -> Optional[LookupIndex]:
+    """
+    The model's index for the current version, built with builder() when
+    missing or stale. builder may return None (e.g. too many rows); that is
+    remembered until the next invalidation.
+    """
+    label = model._meta.label_lower
+    version = get_model_version(model)
+    current = _indexes.get(label)
+    if current is not None and current[0] == version:
+        return current[1]
+
+    with _lock:
+        current = _indexes.get(label)
+        if current is not None and current[0] == version:
+            return current[1]
+        index = builder()
+        _indexes[label] = (version, index)
+    return index
+
+
+def get_choice_index(field) -> LookupIndex:
+    """
+    Index of a field's flat choices in declaration order (position = index,
+    key = value), matched on label and value. Labels are translated, so there
+    is one index per active language.
+    """
+    key = (field.model._meta.label_lower, field.name, translation.get_language())
+    index = _choice_indexes.get(key)
+    if index is None:
+        index = LookupIndex(
+            (position, value, str(label), (label, value))
+            for position, (value, label) in enumerate(field.flatchoices)
+        )
+        _choice_indexes[key] = index
+    return index
+
+
+def invalidate(model):
+    """Drop the model's index in every process."""
+    bump_model_version(model)
+
+
+def clear():
+    """Forget every index in this process."""
+    _indexes.clear()
+    _choice_indexes.clear()
+
@@ -0,0 +1,59 @@
+"""
+Per-model data versions.
+
+A counter in the Django cache, bumped by post_save/post_delete of the model.
+Receivers are connected at startup for every registered model and every
+AUTOCOMPLETE_INDEX_MODELS entry (and on later admin registrations), so a
+process that only writes (another worker, manage.py, a task queue) still
+bumps the version; other models are tracked when first read. Caches of
+query results (lookup indexes, facets, date hierarchy) include it in their
+keys, so a write makes every worker recompute. A process-local counter is
+part of the version too, so the writing process is consistent even when the
+cache is not shared (DummyCache). Bulk writes that bypass signals
+(QuerySet.update, bulk_create) need an explicit bump_model_version().
+"""
+
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_save
+
+
+CACHE_PREFIX = 'djnext_admin:model_version'
+
+# {model label: local write counter}; presence means receivers are connected
+_local_versions = {}
+
+
+def _version_key(label: str) -> str:
+    return f'{CACHE_PREFIX}:{label}'
+
+
+def get_model_version(model) -> str:
+    """Current data version of a model."""
+    label = model._meta.label_lower
+    if label not in _local_versions:
+        track_model(model)
+    return f'{cache.get(_version_key(label), 0)}.{_local_versions[label]}'
+
+
+def bump_model_version(model):
+    """Mark cached results for this model stale in every process."""
+    label = model._meta.label_lower
+    _local_versions[label] = _local_versions.get(label, 0) + 1
+    key = _version_key(label)
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, 1, None)
+
+
+def track_model(model):
+    """Bump the model's version on every save and delete. Safe to call more than once."""
+    label = model._meta.label_lower
+    uid = f'djnext_admin_model_version_{label}'
+    post_save.connect(_row_changed, sender=model, dispatch_uid=uid)
+    post_delete.connect(_row_changed, sender=model, dispatch_uid=uid)
+    _local_versions.setdefault(label, 0)
+
+
+def _row_changed(sender, **kwargs):
+    bump_model_version(sender)
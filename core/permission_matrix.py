@@ -0,0 +1,154 @@
+"""
+Per-user permission matrix.
+
+Resolves every model permission of a user with one query over user and group
+permissions and keeps the result in the Django cache, so schema, search and
+permission checks do set lookups instead of repeated has_perm() calls.
+
+Cache entries are versioned: changing a user's permissions or groups bumps that
+user's version, changing a group's permissions bumps a global version
+(see djnext_admin.signals).
+"""
+
+from functools import lru_cache
+from typing import Dict, Optional
+
+from django.core.cache import cache
+from django.db.models import Q
+
+from ..settings import djnext_settings
+
+
+CACHE_PREFIX = 'djnext_admin:perms'
+GLOBAL_VERSION_KEY = f'{CACHE_PREFIX}:version'
+
+# Backends whose permissions are fully described by user/group permission rows
+_MODEL_BACKENDS = (
+    'django.contrib.auth.backends.ModelBackend',
+    'django.contrib.auth.backends.AllowAllUsersModelBackend',
+)
+
+
+class PermissionMatrix:
+    """Set of 'app_label.codename' permissions granted to one user."""
+
+    __slots__ = ('perms', 'superuser')
+
+    def __init__(self, perms=(), superuser=False):
+        self.perms = frozenset(perms)
+        self.superuser = superuser
+
+    def has_perm(self, perm: str) -> bool:
+        return self.superuser or perm in self.perms
+
+    def has_model_perm(self, model, perm_type: str) -> bool:
+        opts = model._meta
+        return self.has_perm(f'{opts.app_label}.{perm_type}_{opts.model_name}')
+
+
+@lru_cache(maxsize=1)
+def matrix_supported() -> bool:
+    """
+    True when only Django's model backends are configured. Custom backends
+    (object permissions, LDAP groups, ...) may grant permissions that are not
+    stored as rows, so those projects keep using user.has_perm().
+    """
+    from django.conf import settings as django_settings
+    backends = getattr(django_settings, 'AUTHENTICATION_BACKENDS', _MODEL_BACKENDS)
+    return all(path in _MODEL_BACKENDS for path in backends)
+
+
+def _user_version_key(user_pk) -> str:
+    return f'{CACHE_PREFIX}:user:{user_pk}:version'
+
+
+def get_versions(user_pk):
+    """Return (global_version, user_version) for cache keys."""
+    user_key = _user_version_key(user_pk)
+    values = cache.get_many([GLOBAL_VERSION_KEY, user_key])
+    return values.get(GLOBAL_VERSION_KEY, 0), values.get(user_key, 0)
+
+
+def get_permission_matrix(user) -> Optional[PermissionMatrix]:
+    """
+    Get the permission matrix for a user, or None when it cannot be computed
+    (custom auth backends, user model without PermissionsMixin).
+
+    Memoized on the user object for the rest of the request.
+    """
+    matrix = getattr(user, '_djnext_perm_matrix', None)
+    if matrix is not None:
+        return matrix
+
+    if not matrix_supported():
+        return None
+    if not hasattr(user, 'user_permissions') or not hasattr(user, 'groups'):
+        return None
+
+    if not user.is_active or not user.is_authenticated:
+        matrix = PermissionMatrix()
+    elif user.is_superuser:
+        matrix = PermissionMatrix(superuser=True)
+    else:
+        global_version, user_version = get_versions(user.pk)
+        key = f'{CACHE_PREFIX}:{user.pk}:{global_version}:{user_version}'
+        perms = cache.get(key)
+        if perms is None:
+            perms = _load_permissions(user)
+            cache.set(key, perms, djnext_settings.PERMISSION_CACHE_TIMEOUT)
+        matrix = PermissionMatrix(perms)
+
+    try:
+        user._djnext_perm_matrix = matrix
+    except AttributeError:
+        pass
+    return matrix
+
+
+def prime_permission_matrix(user, perms):
+    """Memoize a matrix built from permissions loaded elsewhere (e.g. the auth cache)."""
+    try:
+        user._djnext_perm_matrix = PermissionMatrix(perms)
+    except AttributeError:
+        pass
+
+
+def _load_permissions(user):
+    """All user and group permissions in one query."""
+    from django.contrib.auth.models import Permission
+
+    rows = (
+        Permission.objects
+        .filter(Q(user=user) | Q(group__user=user))
+        .values_list('content_type__app_label', 'codename')
+        .distinct()
+    )
+    return sorted(f'{app_label}.{codename}' for app_label, codename in rows)
+
+
+def get_model_permission_map(user, model) -> Optional[Dict[str, bool]]:
+    """{add, change, delete, view} from the matrix, or None to fall back to has_perm."""
+    matrix = get_permission_matrix(user)
+    if matrix is None:
+        return None
+    return {
+        perm_type: matrix.has_model_perm(model, perm_type)
+        for perm_type in ('add', 'change', 'delete', 'view')
+    }
+
+
+def invalidate_user(user_pk):
+    """Drop cached permissions of one user."""
+    _bump(_user_version_key(user_pk))
+
+
+def invalidate_all():
+    """Drop cached permissions of every user (e.g. a group's permissions changed)."""
+    _bump(GLOBAL_VERSION_KEY)
+
+
+def _bump(key):
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, 1, None)
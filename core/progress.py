@@ -0,0 +1,43 @@
+"""
+Progress of long-running operations (chunked admin actions).
+
+The client picks an operation id, passes it with the request and polls the
+progress endpoint while the request runs. Progress lives in the Django cache,
+per user, so any worker can answer the poll when the cache is shared.
+"""
+
+import re
+from typing import Optional
+
+from django.core.cache import cache
+
+
+CACHE_PREFIX = 'djnext_admin:progress'
+PROGRESS_TIMEOUT = 3600
+OPERATION_ID_RE = re.compile(r'^[\w-]{1,64}$')
+
+
+def is_valid_operation_id(operation_id) -> bool:
+    return isinstance(operation_id, str) and bool(OPERATION_ID_RE.match(operation_id))
+
+
+def _progress_key(user, operation_id: str) -> str:
+    return f'{CACHE_PREFIX}:{getattr(user, "pk", None)}:{operation_id}'
+
+
+def set_progress(user, operation_id: Optional[str], done: int, total: int, status: str = 'running', **extra):
+    """Record progress; no-op without a valid operation id."""
+    if not is_valid_operation_id(operation_id):
+        return
+    cache.set(
+        _progress_key(user, operation_id),
+        {'status': status, 'done': done, 'total': total, **extra},
+        PROGRESS_TIMEOUT,
+    )
+
+
+def get_progress(user, operation_id: str) -> Optional[dict]:
+    """{status, done, total, ...} of the user's operation, or None if unknown."""
+    if not is_valid_operation_id(operation_id):
+        return None
+    return cache.get(_progress_key(user, operation_id))
@@ -5,11 +5,15 @@ This is the KEY file that enables "no separate registration" -
 we read directly from django.contrib.admin.site._registry
 """
 
-from typing import Generator, Tuple, Type, Optional, Dict, List
+from types import MappingProxyType
+from typing import Generator, Tuple, Type, Optional, Dict, Mapping
 from django.contrib import admin
 from django.apps import apps
+from django.db.models.base import ModelBase
 
 from ..settings import djnext_settings
+from .model_version import track_model
+from .permission_matrix import get_model_permission_map
 
 
 def get_admin_site():
@@ -30,11 +34,133 @@ def get_registry() -> Dict:
     return get_admin_site()._registry
 
 
+class RegistryIndex:
+    """
+    Immutable snapshot of the exposed admin registry, with EXCLUDE_APPS,
+    EXCLUDE_MODELS and INCLUDE_ONLY_MODELS already applied.
+
+    Attributes:
+        models: ((Model, ModelAdmin), ...) in registry order
+        by_label: {(app_label, model_name): (Model, ModelAdmin)}
+        by_app: {app_label: ((Model, ModelAdmin), ...)} in registry order
+        registry_size: len(admin registry) when built, to detect changes
+    """
+
+    __slots__ = ('models', 'by_label', 'by_app', 'registry_size')
+
+    def __init__(self, registry):
+        exclude_apps = djnext_settings.EXCLUDE_APPS
+        exclude_models = djnext_settings.EXCLUDE_MODELS
+        include_only = djnext_settings.INCLUDE_ONLY_MODELS
+
+        models = []
+        by_app = {}
+        for model, model_admin in list(registry.items()):
+            # Get model info
+            app_label = model._meta.app_label
+            model_path = f'{app_label}.{model._meta.object_name}'
+
+            # Check app exclusions
+            if app_label in exclude_apps:
+                continue
+
+            # Check model exclusions
+            if model_path in exclude_models:
+                continue
+
+            # Check include-only filter
+            if include_only and model_path not in include_only:
+                continue
+
+            models.append((model, model_admin))
+            by_app.setdefault(app_label, []).append((model, model_admin))
+
+        set_ = object.__setattr__
+        set_(self, 'models', tuple(models))
+        set_(self, 'by_label', MappingProxyType({
+            (model._meta.app_label, model._meta.model_name): (model, model_admin)
+            for model, model_admin in models
+        }))
+        set_(self, 'by_app', MappingProxyType({
+            app_label: tuple(items) for app_label, items in by_app.items()
+        }))
+        set_(self, 'registry_size', len(registry))
+
+    def __setattr__(self, name, value):
+        raise AttributeError('RegistryIndex is immutable')
+
+
+_index = None
+
+
+def get_registry_index() -> RegistryIndex:
+    """
+    The current registry index, built on first use and rebuilt after
+    invalidate_registry_index() (called when admin.site registrations or
+    DJNEXT_ADMIN settings change).
+    """
+    global _index
+    index = _index
+    registry = get_registry()
+    # Registrations made before the hooks were installed change the size
+    if index is None or index.registry_size != len(registry):
+        index = _index = RegistryIndex(registry)
+    return index
+
+
+def invalidate_registry_index():
+    """Drop the registry index and everything derived from the registry."""
+    global _index
+    _index = None
+
+    from .schema_cache import clear_fingerprints
+    from .schema_artifact import reset
+    clear_fingerprints()
+    reset()
+
+
+def install_registry_hooks(site=None):
+    """
+    Wrap site.register/unregister so every registration change invalidates
+    the registry index (and newly registered models get data versions).
+    Called once from DjnextAdminConfig.ready().
+    """
+    site = site or get_admin_site()
+    if getattr(site, '_djnext_hooks_installed', False):
+        return
+
+    register = site.register
+    unregister = site.unregister
+
+    def hooked_register(model_or_iterable, *args, **kwargs):
+        if isinstance(model_or_iterable, ModelBase):
+            models = [model_or_iterable]
+        else:
+            models = model_or_iterable = list(model_or_iterable)
+        try:
+            return register(model_or_iterable, *args, **kwargs)
+        finally:
+            invalidate_registry_index()
+            for model in models:
+                if model in site._registry:
+                    track_model(model)
+
+    def hooked_unregister(*args, **kwargs):
+        try:
+            return unregister(*args, **kwargs)
+        finally:
+            invalidate_registry_index()
+
+    site.register = hooked_register
+    site.unregister = hooked_unregister
+    site._djnext_hooks_installed = True
+
+
 def get_registered_models() -> Generator[Tuple[Type, object], None, None]:
     """
     Generator yielding (Model, ModelAdmin) tuples for all registered models.
 
-    Applies exclusion filters from settings.
+    Applies exclusion filters from settings (precomputed in the registry index).
 
     Yields:
         Tuple[Model, ModelAdmin]: Each registered model and its admin instance
@@ -43,28 +169,7 @@ def get_registered_models() -> Generator[Tuple[Type, object], None, None]:
         for model, admin_instance in get_registered_models():
             print(f"{model.__name__}: {admin_instance.__class__.__name__}")
     """
-    registry = get_registry()
-
-    for model, model_admin in registry.items():
-        # Get model info
-        app_label = model._meta.app_label
-        model_name = model._meta.object_name
-        model_path = f'{app_label}.{model_name}'
-
-        # Check app exclusions
-        if app_label in djnext_settings.EXCLUDE_APPS:
-            continue
-
-        # Check model exclusions
-        if model_path in djnext_settings.EXCLUDE_MODELS:
-            continue
-
-        # Check include-only filter
-        include_only = djnext_settings.INCLUDE_ONLY_MODELS
-        if include_only and model_path not in include_only:
-            continue
-
-        yield model, model_admin
+    yield from get_registry_index().models
 
 
 def get_model_admin(app_label: str, model_name: str) -> Optional[Tuple[Type, object]]:
@@ -76,27 +181,9 @@ def get_model_admin(app_label: str, model_name: str) -> Optional[Tuple[Type, obj
         model_name: Model name in lowercase (e.g., 'product')
 
     Returns:
-        Tuple[Model, ModelAdmin] or None if not found/registered
+        Tuple[Model, ModelAdmin] or None if not found/registered/excluded
     """
-    try:
-        model = apps.get_model(app_label, model_name)
-    except LookupError:
-        return None
-
-    registry = get_registry()
-    model_admin = registry.get(model)
-
-    if model_admin is None:
-        return None
-
-    # Check exclusions
-    model_path = f'{app_label}.{model._meta.object_name}'
-    if app_label in djnext_settings.EXCLUDE_APPS:
-        return None
-    if model_path in djnext_settings.EXCLUDE_MODELS:
-        return None
-
-    return model, model_admin
+    return get_registry_index().by_label.get((app_label, model_name.lower()))
 
 
 def is_model_registered(model) -> bool:
@@ -108,24 +195,14 @@ def is_model_registered(model) -> bool:
     return model in get_registry()
 
 
-def get_models_by_app() -> Dict[str, List[Tuple[Type, object]]]:
+def get_models_by_app() -> Mapping[str, Tuple[Tuple[Type, object], ...]]:
     """
-    Get registered models grouped by app.
+    Get registered models grouped by app (read-only, from the registry index).
 
     Returns:
-        dict: {app_label: [(Model, ModelAdmin), ...]}
+        mapping: {app_label: ((Model, ModelAdmin), ...)}
     """
-    by_app = {}
-
-    for model, model_admin in get_registered_models():
-        app_label = model._meta.app_label
-
-        if app_label not in by_app:
-            by_app[app_label] = []
-
-        by_app[app_label].append((model, model_admin))
-
-    return by_app
+    return get_registry_index().by_app
 
 
 def get_app_config(app_label: str):
@@ -165,6 +242,11 @@ def get_model_permissions(user, model) -> Dict[str, bool]:
             'view': True,
         }
 
+    # One cached matrix lookup instead of four has_perm() calls
+    permissions = get_model_permission_map(user, model)
+    if permissions is not None:
+        return permissions
+
     return {
         'add': user.has_perm(f'{app_label}.add_{model_name}'),
         'change': user.has_perm(f'{app_label}.change_{model_name}'),
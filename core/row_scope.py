@@ -0,0 +1,59 @@
+"""
+Row-level scoping.
+
+A ModelAdmin may define djnext_row_scope(request) returning a Q object (or
+None for no restriction). DJNext Admin applies it in SQL wherever it reads
+the model: list/detail/update/delete, autocomplete, date hierarchy, bulk
+actions, global search and relation options. The hook runs once per request
+and model.
+"""
+
+from typing import Optional
+
+from django.contrib.admin.options import BaseModelAdmin
+from django.db.models import Q, QuerySet
+
+
+ROW_SCOPE_ATTR = 'djnext_row_scope'
+
+
+def get_row_scope(request, model, model_admin) -> Optional[Q]:
+    """
+    The admin's row scope for this request, or None when the admin has no
+    djnext_row_scope hook or the hook returned None.
+    """
+    hook = getattr(model_admin, ROW_SCOPE_ATTR, None) if model_admin is not None else None
+    if hook is None:
+        return None
+
+    # Store on the HttpRequest so DRF and plain Django views share the cache
+    base_request = getattr(request, '_request', request)
+    scopes = getattr(base_request, '_djnext_row_scopes', None)
+    if scopes is None:
+        scopes = base_request._djnext_row_scopes = {}
+
+    label = model._meta.label_lower
+    if label not in scopes:
+        scopes[label] = hook(request)
+    return scopes[label]
+
+
+def apply_row_scope(queryset: QuerySet, request, model_admin) -> QuerySet:
+    """Filter queryset by the admin's row scope, if any."""
+    scope = get_row_scope(request, queryset.model, model_admin)
+    if scope is None:
+        return queryset
+    return queryset.filter(scope)
+
+
+def is_request_scoped(model_admin) -> bool:
+    """
+    True when the rows an admin exposes may depend on the request: it has a
+    row scope or overrides get_queryset. Results that are not request scoped
+    can be cached and shared across users.
+    """
+    if model_admin is None:
+        return False
+    if getattr(model_admin, ROW_SCOPE_ATTR, None) is not None:
+        return True
+    return type(model_admin).get_queryset is not BaseModelAdmin.get_queryset
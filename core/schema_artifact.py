@@ -0,0 +1,130 @@
+"""
+Precompiled schema artifact.
+
+`manage.py djnext_compile_schema` serializes every ModelIntrospector schema and
+the global app skeleton into a versioned JSON file at deploy time. When
+SCHEMA_ARTIFACT_PATH is set, the file is read at startup and served instead of
+live introspection, as long as its registry fingerprint matches the running
+registry and the active language matches the compiled one. Otherwise the
+schema views fall back to live introspection.
+"""
+
+import copy
+import json
+import logging
+from typing import Any, Dict, Optional
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.utils import translation
+
+from ..settings import djnext_settings
+
+
+logger = logging.getLogger('djnext_admin')
+
+ARTIFACT_FORMAT = 1
+
+# Loaded artifact and whether it matches the running registry (None = not checked yet)
+_artifact = None
+_artifact_valid = None
+
+
+def build_artifact(language: str) -> Dict[str, Any]:
+    """Introspect every exposed model and the app skeleton in the given language."""
+    from .. import __version__
+    from .introspection import ModelIntrospector
+    from .registry import get_registered_models
+    from .schema_cache import build_app_skeleton, get_registry_fingerprint
+
+    with translation.override(language):
+        models = {
+            model._meta.label_lower: ModelIntrospector(model, model_admin).get_schema()
+            for model, model_admin in get_registered_models()
+        }
+        skeleton = build_app_skeleton()
+
+    artifact = {
+        'format': ARTIFACT_FORMAT,
+        'version': __version__,
+        'fingerprint': get_registry_fingerprint(),
+        'language': language,
+        'models': models,
+        'skeleton': skeleton,
+    }
+    # Round-trip through JSON so lazy strings, dates and decimals match what is loaded
+    return json.loads(json.dumps(artifact, cls=DjangoJSONEncoder))
+
+
+def write_artifact(path: str, language: str) -> Dict[str, Any]:
+    """Build the artifact and write it to path. Returns the artifact."""
+    artifact = build_artifact(language)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(artifact, f, separators=(',', ':'))
+    return artifact
+
+
+def load_artifact(path: Optional[str] = None) -> bool:
+    """
+    Read the artifact from path (default: SCHEMA_ARTIFACT_PATH).
+    Validation against the registry is deferred to first use, since admin
+    registrations may not be complete at startup.
+    """
+    global _artifact, _artifact_valid
+    path = path or djnext_settings.SCHEMA_ARTIFACT_PATH
+    _artifact, _artifact_valid = None, None
+    if not path:
+        return False
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            artifact = json.load(f)
+    except (OSError, ValueError) as e:
+        logger.warning('DJNext schema artifact %s could not be loaded: %s', path, e)
+        return False
+    if artifact.get('format') != ARTIFACT_FORMAT:
+        logger.warning('DJNext schema artifact %s has an unsupported format.', path)
+        return False
+    _artifact = artifact
+    return True
+
+
+def _get_valid_artifact() -> Optional[Dict[str, Any]]:
+    """The loaded artifact if it matches the registry and active language."""
+    global _artifact_valid
+    if _artifact is None:
+        return None
+    if _artifact_valid is None:
+        from .schema_cache import get_registry_fingerprint
+        _artifact_valid = _artifact.get('fingerprint') == get_registry_fingerprint()
+        if not _artifact_valid:
+            logger.warning(
+                'DJNext schema artifact does not match the admin registry; '
+                'using live introspection. Re-run djnext_compile_schema.'
+            )
+    if not _artifact_valid:
+        return None
+    if _artifact.get('language') != (translation.get_language() or ''):
+        return None
+    return _artifact
+
+
+def get_artifact_model_schema(model) -> Optional[Dict[str, Any]]:
+    """Copy of the compiled schema for a model, or None."""
+    artifact = _get_valid_artifact()
+    if artifact is None:
+        return None
+    schema = artifact['models'].get(model._meta.label_lower)
+    return copy.deepcopy(schema) if schema is not None else None
+
+
+def get_artifact_skeleton():
+    """Compiled app skeleton, or None."""
+    artifact = _get_valid_artifact()
+    if artifact is None:
+        return None
+    return artifact['skeleton']
+
+
+def reset():
+    """Re-check the loaded artifact against the registry on next use."""
+    global _artifact_valid
+    _artifact_valid = None
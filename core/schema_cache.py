@@ -0,0 +1,230 @@
+"""
+Cached model schema.
+
+The permission-independent part of ModelIntrospector.get_schema() is stored in
+the Django cache for SCHEMA_CACHE_TIMEOUT seconds. Keys include the package
+version, the model label, a fingerprint of the admin configuration, model
+fields and schema settings, and the active language, so a deploy that changes
+an admin, a model or CHOICES_INLINE_LIMIT never serves a stale schema.
+
+Per-user parts (permissions, absolute media URLs, endpoints) are merged on top
+by the views for each request.
+"""
+
+import hashlib
+from typing import Any, Dict
+
+from django.core.cache import cache
+from django.utils import translation
+from django.utils.functional import Promise
+
+from ..settings import djnext_settings
+from .introspection import ModelIntrospector, _title_name
+from .registry import get_app_config, get_models_by_app, get_registered_models
+
+
+CACHE_PREFIX = 'djnext_admin:schema'
+
+# ModelAdmin attributes that shape the schema
+SCHEMA_ADMIN_ATTRS = (
+    'list_display',
+    'list_display_links',
+    'list_editable',
+    'list_filter',
+    'search_fields',
+    'ordering',
+    'date_hierarchy',
+    'readonly_fields',
+    'exclude',
+    'fields',
+    'fieldsets',
+    'actions',
+    'inlines',
+    'djnext_object_tools',
+    'djnext_custom_views',
+)
+
+# Settings that shape the cached schema
+SCHEMA_SETTINGS = (
+    'CHOICES_INLINE_LIMIT',
+)
+
+# {(model label, id(model_admin)): fingerprint} - admin config is fixed per process
+_fingerprints = {}
+
+
+def _stable_repr(value) -> str:
+    """repr() that is identical across processes (no memory addresses)."""
+    if isinstance(value, (list, tuple)):
+        return '[' + ','.join(_stable_repr(v) for v in value) + ']'
+    if isinstance(value, dict):
+        return '{' + ','.join(
+            f'{_stable_repr(k)}:{_stable_repr(v)}'
+            for k, v in sorted(value.items(), key=lambda kv: str(kv[0]))
+        ) + '}'
+    if isinstance(value, type) or callable(value):
+        module = getattr(value, '__module__', '')
+        name = getattr(value, '__qualname__', None) or getattr(value, '__name__', '')
+        attrs = ''
+        if callable(value) and not isinstance(value, type):
+            # Display attributes set on admin methods (short_description, icon, ...)
+            attrs = _stable_repr({
+                k: v for k, v in getattr(value, '__dict__', {}).items()
+                if isinstance(v, (str, int, float, bool, list, tuple, type(None)))
+            })
+        return f'{module}.{name}{attrs}'
+    if isinstance(value, Promise):
+        value = str(value)
+    elif hasattr(value, 'deconstruct'):
+        # Validators, Q objects, ...: their constructor arguments, not the instance repr
+        return _stable_repr(value.deconstruct())
+    return repr(value)
+
+
+def get_admin_fingerprint(model, model_admin) -> str:
+    """
+    Short hash of the admin configuration, the model's fields (as
+    deconstructed for migrations: choices, max_length, null, ...) and the
+    settings that shape the schema. Computed once per process for each
+    (model, admin) pair.
+    """
+    key = (model._meta.label, id(model_admin))
+    fingerprint = _fingerprints.get(key)
+    if fingerprint is not None:
+        return fingerprint
+
+    parts = [model._meta.label]
+    if model_admin is not None:
+        admin_class = model_admin.__class__
+        parts.append(f'{admin_class.__module__}.{admin_class.__qualname__}')
+        for attr in SCHEMA_ADMIN_ATTRS:
+            parts.append(f'{attr}={_stable_repr(getattr(model_admin, attr, None))}')
+    for field in model._meta.get_fields():
+        if hasattr(field, 'deconstruct'):
+            _, path, args, kwargs = field.deconstruct()
+            parts.append(f'{field.name}:{path}{_stable_repr(args)}{_stable_repr(kwargs)}')
+        else:
+            # Reverse relations
+            parts.append(f'{field.name}:{field.__class__.__name__}')
+    for name in SCHEMA_SETTINGS:
+        parts.append(f'{name}={_stable_repr(getattr(djnext_settings, name))}')
+
+    fingerprint = hashlib.sha1('|'.join(parts).encode()).hexdigest()[:16]
+    _fingerprints[key] = fingerprint
+    return fingerprint
+
+
+def get_registry_fingerprint() -> str:
+    """
+    Hash of the package version and every exposed model (in registry order)
+    with its admin fingerprint. Identifies a compiled schema artifact.
+    """
+    from .. import __version__
+    parts = [__version__]
+    for model, model_admin in get_registered_models():
+        parts.append(f'{model._meta.label_lower}:{get_admin_fingerprint(model, model_admin)}')
+    return hashlib.sha1('|'.join(parts).encode()).hexdigest()
+
+
+def get_schema_cache_key(model, model_admin, language=None) -> str:
+    """Cache key for the base schema of a model in the given (or active) language."""
+    from .. import __version__
+    language = language or translation.get_language() or ''
+    fingerprint = get_admin_fingerprint(model, model_admin)
+    return f'{CACHE_PREFIX}:{__version__}:{model._meta.label_lower}:{fingerprint}:{language}'
+
+
+def get_model_schema(model, model_admin, request=None) -> Dict[str, Any]:
+    """
+    Permission-independent schema for a model, from cache when possible.
+    Always returns a fresh dict the caller may mutate.
+    """
+    from .schema_artifact import get_artifact_model_schema
+    schema = get_artifact_model_schema(model)
+    if schema is not None:
+        return schema
+
+    timeout = djnext_settings.SCHEMA_CACHE_TIMEOUT
+    if not timeout:
+        return ModelIntrospector(model, model_admin).get_schema(request)
+
+    key = get_schema_cache_key(model, model_admin)
+    schema = cache.get(key)
+    if schema is None:
+        schema = ModelIntrospector(model, model_admin).get_schema(request)
+        cache.set(key, schema, timeout)
+    return schema
+
+
+def build_app_skeleton():
+    """
+    Permission- and URL-independent structure of the global schema:
+    apps in registry order with a summary of each model.
+
+    Returns:
+        list: [{app_label, verbose_name, models: [{label, name, model_name,
+               verbose_name, verbose_name_plural, list_display, icon?}]}]
+    """
+    skeleton = []
+    for app_label, models in get_models_by_app().items():
+        app_config = get_app_config(app_label)
+        app_entry = {
+            'app_label': app_label,
+            'verbose_name': str(app_config.verbose_name) if app_config else app_label.title(),
+            'models': [],
+        }
+        for model, model_admin in models:
+            opts = model._meta
+
+            # Get list_display from admin
+            list_display = ['id', '__str__']
+            if model_admin:
+                ld = getattr(model_admin, 'list_display', None)
+                if ld:
+                    list_display = [f for f in ld if f != '__str__']
+                    if 'id' not in list_display:
+                        list_display = ['id'] + list_display
+
+            entry = {
+                'label': opts.label_lower,
+                'name': opts.object_name,
+                'model_name': opts.model_name,
+                'verbose_name': _title_name(opts.verbose_name),
+                'verbose_name_plural': _title_name(opts.verbose_name_plural),
+                'list_display': [getattr(f, '__name__', None) or str(f) for f in list_display],
+            }
+            # Optional: icon name from admin (e.g. Lucide name: Users, ShoppingCart)
+            icon = getattr(model_admin, 'djnext_icon', None) if model_admin else None
+            if icon:
+                entry['icon'] = str(icon)
+            app_entry['models'].append(entry)
+        skeleton.append(app_entry)
+    return skeleton
+
+
+def get_app_skeleton():
+    """
+    App skeleton from the compiled artifact when it matches the registry,
+    else from the Django cache, else built live.
+    """
+    from .schema_artifact import get_artifact_skeleton
+    skeleton = get_artifact_skeleton()
+    if skeleton is not None:
+        return skeleton
+
+    timeout = djnext_settings.SCHEMA_CACHE_TIMEOUT
+    if not timeout:
+        return build_app_skeleton()
+
+    language = translation.get_language() or ''
+    key = f'{CACHE_PREFIX}:skeleton:{get_registry_fingerprint()}:{language}'
+    skeleton = cache.get(key)
+    if skeleton is None:
+        skeleton = build_app_skeleton()
+        cache.set(key, skeleton, timeout)
+    return skeleton
+
+
+def clear_fingerprints():
+    """Forget computed fingerprints (e.g. after admin registrations change)."""
+    _fingerprints.clear()
@@ -19,6 +19,7 @@ import { ConfirmDialog } from '@/components/ui/ConfirmDialog';
 import { Skeleton } from '@/components/ui/Skeleton';
 import { Plus, ChevronDown } from 'lucide-react';
 import { api } from '@/lib/api';
+import type { DeletePreview } from '@/types';
 import { titleName } from '@/lib/utils';
 import { logBasePath, logLoading } from '@/lib/debug';
 
@@ -47,11 +48,16 @@ export default function ModelListPageClient({
   const [filterSidebarOpen, setFilterSidebarOpen] = useState(true);
   const [selectedIds, setSelectedIds] = useState<Set<string>>(new Set());
   const [selectedAction, setSelectedAction] = useState('');
+  // Every row matching the filters, not just the selected page rows
+  const [selectAllMatching, setSelectAllMatching] = useState(false);
+  const [actionProgress, setActionProgress] = useState<{ done: number; total: number } | null>(null);
   const [actionDropdownOpen, setActionDropdownOpen] = useState(false);
   const [actionRunning, setActionRunning] = useState(false);
   const [deleteTarget, setDeleteTarget] = useState<{ id: string; repr: string } | null>(null);
   const [deleting, setDeleting] = useState(false);
   const [deleteError, setDeleteError] = useState<string | null>(null);
+  const [deletePreview, setDeletePreview] = useState<DeletePreview | null>(null);
+  const [bulkDeleteOpen, setBulkDeleteOpen] = useState(false);
   const [dateHierarchy, setDateHierarchy] = useState<{
     year?: number;
     month?: number;
@@ -60,6 +66,7 @@ export default function ModelListPageClient({
 
   useEffect(() => {
     setPage(1);
+    setSelectAllMatching(false);
   }, [filters, search, dateHierarchy]);
 
   const listParams = useMemo(
@@ -88,6 +95,16 @@ export default function ModelListPageClient({
     [page, search, filters, dateHierarchy, schema?.date_hierarchy]
   );
 
+  // List filters and search (no paging or date selection) for date hierarchy counts
+  const hierarchyFilters = useMemo(() => {
+    const params: Record<string, string> = {};
+    if (search.trim()) params.search = search.trim();
+    Object.entries(filters).forEach(([key, value]) => {
+      if (value !== undefined && value !== '') params[key] = String(value);
+    });
+    return params;
+  }, [search, filters]);
+
   const {
     results,
     count,
@@ -103,6 +120,7 @@ export default function ModelListPageClient({
   logLoading('ModelListPage', authLoading || schemaLoading || listLoading, `schema=${schemaLoading} list=${listLoading}`);
 
   const toggleSelect = useCallback((id: string) => {
+    setSelectAllMatching(false);
     setSelectedIds((prev) => {
       const next = new Set(prev);
       if (next.has(id)) next.delete(id);
@@ -113,27 +131,80 @@ export default function ModelListPageClient({
   const toggleSelectAll = useCallback((checked: boolean) => {
     if (!checked) {
       setSelectedIds(new Set());
+      setSelectAllMatching(false);
       return;
     }
     setSelectedIds(new Set(results.map((r) => String(r.id ?? r.pk ?? '')).filter(Boolean)));
   }, [results]);
 
+  // Filter params of the list, for actions on every matching row
+  const getSelectionParams = () => {
+    const params: Record<string, string> = { ...hierarchyFilters };
+    Object.entries(listParams).forEach(([key, value]) => {
+      if (key.startsWith(`${schema?.date_hierarchy}__`) && value !== undefined) params[key] = String(value);
+    });
+    return params;
+  };
+
   const runAction = async () => {
     if (!selectedAction || selectedIds.size === 0) return;
     setActionRunning(true);
+    const operationId = typeof crypto !== 'undefined' && 'randomUUID' in crypto
+      ? crypto.randomUUID()
+      : `op-${Date.now()}`;
+    const poll = window.setInterval(async () => {
+      try {
+        const progress = await api.actionProgress(resolved!.app, resolved!.model, operationId);
+        setActionProgress({ done: progress.done, total: progress.total });
+      } catch {
+        // Not started yet, or progress not shared across workers
+      }
+    }, 1000);
     try {
-      await api.runAction(resolved!.app, resolved!.model, selectedAction, Array.from(selectedIds));
+      const response = await api.runAction(resolved!.app, resolved!.model, selectedAction, Array.from(selectedIds), {
+        selectAllMatching,
+        params: getSelectionParams(),
+        operationId,
+      });
+      if ('job_id' in response) {
+        // Background action: follow the job instead of the operation
+        window.clearInterval(poll);
+        await api.waitForJob(response.job_id, (job) => setActionProgress(job.progress));
+      }
       setSelectedIds(new Set());
+      setSelectAllMatching(false);
       setSelectedAction('');
       setActionDropdownOpen(false);
       refetch();
     } catch (err) {
       alert(err instanceof Error ? err.message : 'Action failed');
     } finally {
+      window.clearInterval(poll);
+      setActionProgress(null);
       setActionRunning(false);
     }
   };
 
+  const runBulkDelete = async () => {
+    if (selectedIds.size === 0) return;
+    setDeleting(true);
+    setDeleteError(null);
+    try {
+      await api.bulkDelete(resolved!.app, resolved!.model, Array.from(selectedIds), {
+        selectAllMatching,
+        params: getSelectionParams(),
+      });
+      setSelectedIds(new Set());
+      setSelectAllMatching(false);
+      setBulkDeleteOpen(false);
+      refetch();
+    } catch (err) {
+      setDeleteError(err instanceof Error ? err.message : 'Delete failed');
+    } finally {
+      setDeleting(false);
+    }
+  };
+
   const handleInlineEdit = useCallback(async (id: string, field: string, value: unknown) => {
     try {
       await api.bulkUpdate(resolved!.app, resolved!.model, [{ id, [field]: value }]);
@@ -190,6 +261,10 @@ export default function ModelListPageClient({
         ? String(row[firstKey] ?? row.id ?? row.pk ?? id)
         : id;
     setDeleteTarget({ id, repr });
+    setDeletePreview(null);
+    api.deletePreview(resolved!.app, resolved!.model, id).then(setDeletePreview).catch(() => {
+      // Preview is informational; the delete itself still reports protection errors
+    });
   };
 
   const handleDeleteConfirm = async () => {
@@ -197,7 +272,13 @@ export default function ModelListPageClient({
     setDeleting(true);
     setDeleteError(null);
     try {
-      await deleteOne(deleteTarget.id);
+      if (deletePreview?.chunked) {
+        // Large cascade: delete in chunks in a background job
+        await api.delete(resolved!.app, resolved!.model, deleteTarget.id, { background: true });
+        refetch();
+      } else {
+        await deleteOne(deleteTarget.id);
+      }
       setDeleteTarget(null);
     } catch (err) {
       setDeleteError(err instanceof Error ? err.message : 'Delete failed');
@@ -236,46 +317,76 @@ export default function ModelListPageClient({
           </div>
         </div>
 
-        {schema.actions?.length ? (
+        {schema.actions?.length || schema.permissions?.delete ? (
           <div className="flex flex-wrap items-center gap-3 rounded-lg border border-border bg-card px-4 py-2">
-            <span className="text-sm text-muted-foreground">Action:</span>
-            <div className="relative">
+            {schema.actions?.length ? (
+              <>
+                <span className="text-sm text-muted-foreground">Action:</span>
+                <div className="relative">
+                  <button
+                    type="button"
+                    onClick={() => setActionDropdownOpen((o) => !o)}
+                    className="inline-flex items-center gap-1 rounded-lg border border-border bg-background px-3 py-1.5 text-sm text-foreground hover:bg-card-hover"
+                  >
+                    {schema.actions.find((a) => a.name === selectedAction)?.description ?? 'Choose action'}
+                    <ChevronDown className="h-4 w-4" />
+                  </button>
+                  {actionDropdownOpen && (
+                    <>
+                      <div className="fixed inset-0 z-10" aria-hidden onClick={() => setActionDropdownOpen(false)} />
+                      <div className="absolute left-0 top-full z-20 mt-1 w-56 rounded-lg border border-border bg-card py-1 shadow-lg">
+                        {schema.actions.map((a) => (
+                          <button
+                            key={a.name}
+                            type="button"
+                            onClick={() => {
+                              setSelectedAction(a.name);
+                              setActionDropdownOpen(false);
+                            }}
+                            className="block w-full px-3 py-2 text-left text-sm text-foreground hover:bg-card-hover"
+                          >
+                            {a.description}
+                          </button>
+                        ))}
+                      </div>
+                    </>
+                  )}
+                </div>
+                <Button
+                  size="sm"
+                  disabled={selectedIds.size === 0 || !selectedAction || actionRunning}
+                  onClick={runAction}
+                >
+                  {actionRunning
+                    ? actionProgress && actionProgress.total > 0
+                      ? `Running… ${Math.round((actionProgress.done / actionProgress.total) * 100)}%`
+                      : 'Running…'
+                    : `Run on ${selectAllMatching ? count : selectedIds.size} selected`}
+                </Button>
+              </>
+            ) : null}
+            {schema.permissions?.delete && (
+              <Button
+                size="sm"
+                variant="danger"
+                disabled={selectedIds.size === 0 || deleting}
+                onClick={() => {
+                  setDeleteError(null);
+                  setBulkDeleteOpen(true);
+                }}
+              >
+                {`Delete ${selectAllMatching ? count : selectedIds.size} selected`}
+              </Button>
+            )}
+            {selectedIds.size > 0 && selectedIds.size === results.length && count > results.length && (
               <button
                 type="button"
-                onClick={() => setActionDropdownOpen((o) => !o)}
-                className="inline-flex items-center gap-1 rounded-lg border border-border bg-background px-3 py-1.5 text-sm text-foreground hover:bg-card-hover"
+                onClick={() => setSelectAllMatching((v) => !v)}
+                className="text-sm text-primary hover:underline cursor-pointer"
               >
-                {schema.actions.find((a) => a.name === selectedAction)?.description ?? 'Choose action'}
-                <ChevronDown className="h-4 w-4" />
+                {selectAllMatching ? 'Only this page' : `Select all ${count} matching`}
               </button>
-              {actionDropdownOpen && (
-                <>
-                  <div className="fixed inset-0 z-10" aria-hidden onClick={() => setActionDropdownOpen(false)} />
-                  <div className="absolute left-0 top-full z-20 mt-1 w-56 rounded-lg border border-border bg-card py-1 shadow-lg">
-                    {schema.actions.map((a) => (
-                      <button
-                        key={a.name}
-                        type="button"
-                        onClick={() => {
-                          setSelectedAction(a.name);
-                          setActionDropdownOpen(false);
-                        }}
-                        className="block w-full px-3 py-2 text-left text-sm text-foreground hover:bg-card-hover"
-                      >
-                        {a.description}
-                      </button>
-                    ))}
-                  </div>
-                </>
-              )}
-            </div>
-            <Button
-              size="sm"
-              disabled={selectedIds.size === 0 || !selectedAction || actionRunning}
-              onClick={runAction}
-            >
-              {actionRunning ? 'Running…' : `Run on ${selectedIds.size} selected`}
-            </Button>
+            )}
           </div>
         ) : null}
 
@@ -288,6 +399,7 @@ export default function ModelListPageClient({
                 dateField={schema.date_hierarchy}
                 values={dateHierarchy}
                 onChange={setDateHierarchy}
+                filters={hierarchyFilters}
               />
             )}
             <DataTable
@@ -301,7 +413,7 @@ export default function ModelListPageClient({
               basePath={basePath}
               pkField={schema.model?.pk_field}
               selection={
-                schema.actions?.length
+                schema.actions?.length || schema.permissions?.delete
                   ? {
                       selectedIds,
                       onToggle: toggleSelect,
@@ -338,7 +450,29 @@ export default function ModelListPageClient({
           deleteError ? (
             <span className="text-destructive">{deleteError}</span>
           ) : deleteTarget ? (
-            <>This will permanently delete &quot;{deleteTarget.repr}&quot;. This action cannot be undone.</>
+            <>
+              This will permanently delete &quot;{deleteTarget.repr}&quot;. This action cannot be undone.
+              {deletePreview && deletePreview.relations.length > 0 && (
+                <span className="mt-2 block">
+                  {deletePreview.relations.map((relation) => (
+                    <span
+                      key={relation.path}
+                      className={relation.action === 'protect' || relation.action === 'restrict' ? 'block text-destructive' : 'block'}
+                    >
+                      {relation.count}
+                      {relation.recursive ? '+' : ''} {relation.verbose_name}{' '}
+                      {relation.action === 'delete'
+                        ? 'deleted'
+                        : relation.action === 'set_null'
+                          ? 'unlinked'
+                          : relation.action === 'other'
+                            ? 'affected'
+                            : 'block the delete'}
+                    </span>
+                  ))}
+                </span>
+              )}
+            </>
           ) : null
         }
         confirmLabel="Delete"
@@ -346,6 +480,28 @@ export default function ModelListPageClient({
         onConfirm={handleDeleteConfirm}
         loading={deleting}
       />
+
+      <ConfirmDialog
+        open={bulkDeleteOpen}
+        onOpenChange={(open) => {
+          if (!open) {
+            setBulkDeleteOpen(false);
+            setDeleteError(null);
+          }
+        }}
+        title={`Delete ${selectAllMatching ? count : selectedIds.size} ${schema?.model?.verbose_name_plural ?? titleName(resolved.model)}?`}
+        description={
+          deleteError ? (
+            <span className="text-destructive">{deleteError}</span>
+          ) : (
+            <>This will permanently delete the selected objects and their related objects. This action cannot be undone.</>
+          )
+        }
+        confirmLabel="Delete"
+        variant="danger"
+        onConfirm={runBulkDelete}
+        loading={deleting}
+      />
     </AdminLayout>
   );
 }
@@ -3,7 +3,7 @@
 import { useState } from 'react';
 import { Button } from '@/components/ui/Button';
 import { api } from '@/lib/api';
-import type { ObjectToolSchema } from '@/types';
+import type { JobAccepted, ObjectToolSchema } from '@/types';
 import * as LucideIcons from 'lucide-react';
 
 interface ObjectToolsProps {
@@ -42,7 +42,11 @@ export function ObjectTools({
 
     try {
       const path = `/${appLabel}/${modelName}/${objectId}/tools/${tool.name}/`;
-      const data = await api.post<{ message?: string }>(path);
+      let data: unknown = await api.post<{ message?: string } | JobAccepted>(path);
+      if (data && typeof data === 'object' && 'job_id' in data) {
+        // Background tool: wait for the job's result
+        data = await api.waitForJob((data as JobAccepted).job_id);
+      }
       const msg = (data && typeof data === 'object' && typeof (data as { message?: string }).message === 'string')
         ? (data as { message: string }).message
         : `${tool.label} completed`;
@@ -1,8 +1,10 @@
 'use client';
 
+import { useEffect, useMemo, useState } from 'react';
 import * as Select from '@radix-ui/react-select';
 import { ChevronDown } from 'lucide-react';
 import { cn } from '@/lib/utils';
+import { api } from '@/lib/api';
 import type { FieldSchema, FieldChoice } from '@/types';
 
 interface SelectFieldProps {
@@ -20,8 +22,30 @@ export function SelectField({
   onBlur,
   error,
 }: SelectFieldProps) {
-  const choices: FieldChoice[] = field.choices ?? [];
+  const remoteUrl = field.remote_choices ? field.choices_url : undefined;
+  const [remoteChoices, setRemoteChoices] = useState<FieldChoice[]>([]);
+  const [search, setSearch] = useState('');
+
+  // Long choice lists are not in the schema: search them on the server
+  useEffect(() => {
+    if (!remoteUrl) return;
+    let cancelled = false;
+    api
+      .choices(remoteUrl, search || undefined)
+      .then((res) => !cancelled && setRemoteChoices(res.results ?? []))
+      .catch(() => !cancelled && setRemoteChoices([]));
+    return () => {
+      cancelled = true;
+    };
+  }, [remoteUrl, search]);
+
   const valueStr = value === null || value === undefined ? '' : String(value);
+  const choices: FieldChoice[] = useMemo(() => {
+    if (!remoteUrl) return field.choices ?? [];
+    // Keep the current value selectable when it is not on the loaded page
+    if (!valueStr || remoteChoices.some((c) => String(c.value) === valueStr)) return remoteChoices;
+    return [{ value: value as string | number, label: valueStr }, ...remoteChoices];
+  }, [remoteUrl, field.choices, remoteChoices, value, valueStr]);
   const selected = choices.find((c) => String(c.value) === valueStr);
   const rootValue = valueStr === '' || valueStr === undefined ? '__null__' : valueStr;
 
@@ -68,6 +92,17 @@ export function SelectField({
             sideOffset={4}
             className="z-50 max-h-60 overflow-auto rounded-lg border border-border bg-card shadow-lg animate-fade-in"
           >
+            {remoteUrl && (
+              <div className="p-2 border-b border-border">
+                <input
+                  type="search"
+                  placeholder="Search..."
+                  value={search}
+                  onChange={(e) => setSearch(e.target.value)}
+                  className="w-full rounded border border-input-border bg-input px-2 py-1.5 text-sm text-foreground placeholder:text-muted-foreground focus:outline-none focus:ring-1 focus:ring-primary"
+                />
+              </div>
+            )}
             {/* Always render __null__ item so Radix has a matching value and shows it (not blank) */}
             <Select.Item
               value="__null__"
@@ -6,6 +6,7 @@ import { cn } from '@/lib/utils';
 import { Pagination } from '@/components/ui/Pagination';
 import { Button } from '@/components/ui/Button';
 import { EditableCell } from './EditableCell';
+import { useChoiceLabels } from '@/hooks/useChoiceLabels';
 import type { ModelSchema } from '@/types';
 
 interface DataTableProps<T = Record<string, unknown>> {
@@ -71,6 +72,7 @@ export function DataTable<T extends Record<string, unknown>>({
   onInlineEdit,
 }: DataTableProps<T>) {
   const allColumns = normalizeColumns(schema.list_display);
+  const choiceLabels = useChoiceLabels(schema, data);
   const canChange = schema.permissions?.change ?? false;
   const canDelete = schema.permissions?.delete ?? false;
   const showSelection = selection && schema.actions?.length;
@@ -112,9 +114,13 @@ export function DataTable<T extends Record<string, unknown>>({
     return true;
   };
 
-  // Get field schema for a column
+  // Get field schema for a column (remote_choices fields get the labels of the values shown)
   const getFieldSchema = (colName: string) => {
-    return schema.fields?.find((f) => f.name === colName);
+    const field = schema.fields?.find((f) => f.name === colName);
+    if (field?.remote_choices && choiceLabels[colName]) {
+      return { ...field, choices: choiceLabels[colName] };
+    }
+    return field;
   };
 
   // Simple empty state: no table, no pagination, just "No records"
@@ -16,6 +16,8 @@ interface DateHierarchyProps {
   };
   /** Called when hierarchy selection changes */
   onChange: (values: { year?: number; month?: number; day?: number }) => void;
+  /** Current list filters and search, so counts match the list */
+  filters?: Record<string, string>;
 }
 
 const MONTH_NAMES = [
@@ -33,8 +35,10 @@ export function DateHierarchy({
   dateField,
   values,
   onChange,
+  filters,
 }: DateHierarchyProps) {
   const [dates, setDates] = useState<number[]>([]);
+  const [counts, setCounts] = useState<Record<number, number>>({});
   const [level, setLevel] = useState<'year' | 'month' | 'day'>('year');
   const [loading, setLoading] = useState(true);
 
@@ -43,21 +47,30 @@ export function DateHierarchy({
     const fetchDates = async () => {
       setLoading(true);
       try {
-        const result = await api.getDateHierarchy(appLabel, modelName, {
-          year: values.year,
-          month: values.month,
-        });
+        const result = await api.getDateHierarchy(
+          appLabel,
+          modelName,
+          { year: values.year, month: values.month },
+          filters
+        );
         setDates(result.dates);
+        setCounts(Object.fromEntries((result.buckets ?? []).map((b) => [b.value, b.count])));
         setLevel(result.level);
       } catch {
         setDates([]);
+        setCounts({});
       } finally {
         setLoading(false);
       }
     };
 
     fetchDates();
-  }, [appLabel, modelName, values.year, values.month]);
+  }, [appLabel, modelName, values.year, values.month, filters]);
+
+  const countSuffix = (value: number) =>
+    counts[value] !== undefined ? (
+      <span className="ml-1 text-xs text-muted-foreground">{counts[value]}</span>
+    ) : null;
 
   // Navigate to a specific level
   const handleSelectYear = (year: number) => {
@@ -148,6 +161,7 @@ export function DateHierarchy({
               className="px-2 py-0.5 rounded hover:bg-primary/10 text-primary cursor-pointer"
             >
               {year}
+              {countSuffix(year)}
             </button>
           ))}
         </div>
@@ -164,6 +178,7 @@ export function DateHierarchy({
               className="px-2 py-0.5 rounded hover:bg-primary/10 text-primary cursor-pointer"
             >
               {MONTH_NAMES[month - 1]?.slice(0, 3)}
+              {countSuffix(month)}
             </button>
           ))}
         </div>
@@ -182,6 +197,7 @@ export function DateHierarchy({
               className="px-2 py-0.5 rounded hover:bg-primary/10 text-primary cursor-pointer min-w-[2rem]"
             >
               {day}
+              {countSuffix(day)}
             </button>
           ))}
         </div>
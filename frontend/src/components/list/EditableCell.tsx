@@ -2,7 +2,8 @@
 
 import { useState, useRef, useEffect } from 'react';
 import { Check, X } from 'lucide-react';
-import type { FieldSchema } from '@/types';
+import { api } from '@/lib/api';
+import type { FieldSchema, FieldChoice } from '@/types';
 
 interface EditableCellProps {
   value: unknown;
@@ -91,6 +92,23 @@ export function EditableCell({
     );
   }
 
+  // Select field - remote choices (searched on the server)
+  if (fieldSchema?.remote_choices && fieldSchema.choices_url) {
+    return (
+      <div className="flex items-center gap-1">
+        <RemoteChoiceSelect
+          url={fieldSchema.choices_url}
+          value={editValue}
+          currentChoices={choices}
+          selectRef={inputRef as React.RefObject<HTMLSelectElement>}
+          onChange={setEditValue}
+          onKeyDown={handleKeyDown}
+        />
+        <EditButtons onSave={handleSave} onCancel={handleCancel} />
+      </div>
+    );
+  }
+
   // Select field - choices
   if (choices && choices.length > 0) {
     return (
@@ -146,6 +164,74 @@ export function EditableCell({
   );
 }
 
+function RemoteChoiceSelect({
+  url,
+  value,
+  currentChoices,
+  selectRef,
+  onChange,
+  onKeyDown,
+}: {
+  url: string;
+  value: unknown;
+  currentChoices?: FieldChoice[];
+  selectRef: React.RefObject<HTMLSelectElement>;
+  onChange: (value: unknown) => void;
+  onKeyDown: (e: React.KeyboardEvent) => void;
+}) {
+  const [search, setSearch] = useState('');
+  const [results, setResults] = useState<FieldChoice[]>([]);
+
+  useEffect(() => {
+    let cancelled = false;
+    api
+      .choices(url, search || undefined)
+      .then((res) => !cancelled && setResults(res.results ?? []))
+      .catch(() => !cancelled && setResults([]));
+    return () => {
+      cancelled = true;
+    };
+  }, [url, search]);
+
+  // Keep the current value selectable when it is not on the loaded page
+  const valueStr = value === null || value === undefined ? '' : String(value);
+  const options = results.some((c) => String(c.value) === valueStr) || !valueStr
+    ? results
+    : [
+        currentChoices?.find((c) => String(c.value) === valueStr) ?? { value: valueStr, label: valueStr },
+        ...results,
+      ];
+
+  return (
+    <div className="flex flex-1 flex-col gap-1">
+      <input
+        type="search"
+        placeholder="Search..."
+        value={search}
+        onChange={(e) => setSearch(e.target.value)}
+        onKeyDown={onKeyDown}
+        className="px-2 py-1 text-sm rounded border border-border bg-input focus:outline-none focus:ring-2 focus:ring-primary"
+      />
+      <select
+        ref={selectRef}
+        value={valueStr}
+        onChange={(e) => {
+          const choice = options.find((c) => String(c.value) === e.target.value);
+          onChange(choice?.value ?? e.target.value);
+        }}
+        onKeyDown={onKeyDown}
+        className="px-2 py-1 text-sm rounded border border-border bg-input focus:outline-none focus:ring-2 focus:ring-primary"
+      >
+        {options.map((choice) => (
+          <option key={String(choice.value)} value={String(choice.value)}>
+            {choice.label}
+          </option>
+        ))}
+      </select>
+    </div>
+  );
+}
+
 function EditButtons({
   onSave,
   onCancel,
@@ -16,7 +16,7 @@ interface FilterSidebarProps {
   onClear: () => void;
   open: boolean;
   onToggle: () => void;
-  /** Fetched options per filter field (from schema choices + autocomplete for relations) */
+  /** Fetched options per filter field (schema choices, facets for relations and remote choices) */
   optionsByField?: Record<string, FilterOption[]>;
   optionsLoading?: boolean;
 }
@@ -108,9 +108,10 @@ export function FilterSidebar({
                 </h3>
                 {(() => {
                   const options = getOptionsForField(field);
-                  const loading = optionsLoading && field.relation && options.length === 0;
+                  const remote = field.relation || field.remote_choices;
+                  const loading = optionsLoading && remote && options.length === 0;
                   const useSearchableDropdown =
-                    field.relation || options.length > SIMPLE_FILTER_MAX_OPTIONS;
+                    remote || options.length > SIMPLE_FILTER_MAX_OPTIONS;
 
                   if (loading) {
                     return (
@@ -5,6 +5,7 @@ import { Input } from '@/components/ui/Input';
 import { Button } from '@/components/ui/Button';
 import { cn } from '@/lib/utils';
 import type { ModelSchema } from '@/types';
+import type { FilterOption } from '@/hooks/useFilterOptions';
 
 interface FiltersProps {
   schema: ModelSchema;
@@ -12,6 +13,8 @@ interface FiltersProps {
   onChange: (values: Record<string, string | number | undefined>) => void;
   onClear: () => void;
   className?: string;
+  /** Fetched options per filter field (see useFilterOptions); needed for remote_choices fields */
+  optionsByField?: Record<string, FilterOption[]>;
 }
 
 export function Filters({
@@ -20,6 +23,7 @@ export function Filters({
   onChange,
   onClear,
   className,
+  optionsByField = {},
 }: FiltersProps) {
   const filterFields = useMemo(() => {
     const names = schema.list_filter ?? [];
@@ -41,73 +45,80 @@ export function Filters({
         className
       )}
     >
-      {filterFields.map((field) => (
-        <div key={field.name} className="min-w-[140px] max-w-[200px]">
-          <label
-            htmlFor={`filter-${field.name}`}
-            className="mb-1 block text-xs font-medium text-muted-foreground"
-          >
-            {field.verbose_name}
-          </label>
-          {field.choices && field.choices.length > 0 ? (
-            <select
-              id={`filter-${field.name}`}
-              value={
-                values[field.name] === undefined ? '' : String(values[field.name])
-              }
-              onChange={(e) => {
-                const v = e.target.value;
-                onChange({
-                  ...values,
-                  [field.name]: v === '' ? undefined : v,
-                });
-              }}
-              className="flex h-9 w-full rounded-lg border border-input-border bg-input px-2 py-1.5 text-sm text-foreground focus:outline-none focus:ring-2 focus:ring-primary"
+      {filterFields.map((field) => {
+        const options = optionsByField[field.name]?.length
+          ? optionsByField[field.name]
+          : field.remote_choices
+            ? []
+            : field.choices ?? [];
+        return (
+          <div key={field.name} className="min-w-[140px] max-w-[200px]">
+            <label
+              htmlFor={`filter-${field.name}`}
+              className="mb-1 block text-xs font-medium text-muted-foreground"
             >
-              <option value="">All</option>
-              {field.choices.map((opt) => (
-                <option key={String(opt.value)} value={String(opt.value)}>
-                  {opt.label}
-                </option>
-              ))}
-            </select>
-          ) : field.widget === 'date' || field.type === 'string' ? (
-            <Input
-              id={`filter-${field.name}`}
-              type={field.widget === 'date' ? 'date' : 'text'}
-              value={values[field.name] ?? ''}
-              onChange={(e) =>
-                onChange({
-                  ...values,
-                  [field.name]:
-                    e.target.value === ''
-                      ? undefined
-                      : field.widget === 'date'
-                        ? e.target.value
-                        : e.target.value,
-                })
-              }
-              placeholder={`Filter ${field.verbose_name}`}
-              className="h-9 text-sm"
-            />
-          ) : (
-            <Input
-              id={`filter-${field.name}`}
-              type="text"
-              value={values[field.name] ?? ''}
-              onChange={(e) =>
-                onChange({
-                  ...values,
-                  [field.name]:
-                    e.target.value === '' ? undefined : e.target.value,
-                })
-              }
-              placeholder={field.verbose_name}
-              className="h-9 text-sm"
-            />
-          )}
-        </div>
-      ))}
+              {field.verbose_name}
+            </label>
+            {options.length > 0 ? (
+              <select
+                id={`filter-${field.name}`}
+                value={
+                  values[field.name] === undefined ? '' : String(values[field.name])
+                }
+                onChange={(e) => {
+                  const v = e.target.value;
+                  onChange({
+                    ...values,
+                    [field.name]: v === '' ? undefined : v,
+                  });
+                }}
+                className="flex h-9 w-full rounded-lg border border-input-border bg-input px-2 py-1.5 text-sm text-foreground focus:outline-none focus:ring-2 focus:ring-primary"
+              >
+                <option value="">All</option>
+                {options.map((opt) => (
+                  <option key={String(opt.value)} value={String(opt.value)}>
+                    {opt.label}
+                  </option>
+                ))}
+              </select>
+            ) : field.widget === 'date' || field.type === 'string' ? (
+              <Input
+                id={`filter-${field.name}`}
+                type={field.widget === 'date' ? 'date' : 'text'}
+                value={values[field.name] ?? ''}
+                onChange={(e) =>
+                  onChange({
+                    ...values,
+                    [field.name]:
+                      e.target.value === ''
+                        ? undefined
+                        : field.widget === 'date'
+                          ? e.target.value
+                          : e.target.value,
+                  })
+                }
+                placeholder={`Filter ${field.verbose_name}`}
+                className="h-9 text-sm"
+              />
+            ) : (
+              <Input
+                id={`filter-${field.name}`}
+                type="text"
+                value={values[field.name] ?? ''}
+                onChange={(e) =>
+                  onChange({
+                    ...values,
+                    [field.name]:
+                      e.target.value === '' ? undefined : e.target.value,
+                  })
+                }
+                placeholder={field.verbose_name}
+                className="h-9 text-sm"
+              />
+            )}
+          </div>
+        );
+      })}
       {hasActiveFilters && (
         <Button
           type="button"
@@ -0,0 +1,49 @@
+'use client';
+
+import { useQuery } from '@tanstack/react-query';
+import { api } from '@/lib/api';
+import type { FieldChoice, ModelSchema } from '@/types';
+
+/**
+ * Choices of remote_choices fields (not inlined in the schema) for the values
+ * shown in rows: one ?values= request per list_display field, so list cells
+ * show labels.
+ */
+export function useChoiceLabels(schema: ModelSchema | null, rows: Record<string, unknown>[]) {
+  const columns = new Set(
+    (schema?.list_display ?? []).map((col) => (typeof col === 'string' ? col : col.name))
+  );
+  const fields = (schema?.fields ?? []).filter(
+    (f) => f.remote_choices && f.choices_url && columns.has(f.name)
+  );
+  const valuesByField = fields.map((field) => {
+    const values = new Set<string>();
+    for (const row of rows) {
+      const value = row[field.name];
+      if (value !== null && value !== undefined && value !== '') values.add(String(value));
+    }
+    return { field, values: Array.from(values).sort() };
+  }).filter(({ values }) => values.length > 0);
+
+  const { data } = useQuery({
+    queryKey: [
+      'choiceLabels',
+      schema?.model?.app_label,
+      schema?.model?.model_name,
+      valuesByField.map(({ field, values }) => `${field.name}=${values.join(',')}`).join('&'),
+    ],
+    queryFn: async () => {
+      const entries = await Promise.all(
+        valuesByField.map(async ({ field, values }) => {
+          const res = await api.choiceLabels(field.choices_url!, values);
+          return [field.name, res.results ?? []] as const;
+        })
+      );
+      return Object.fromEntries(entries) as Record<string, FieldChoice[]>;
+    },
+    staleTime: 5 * 60 * 1000,
+    enabled: valuesByField.length > 0,
+  });
+
+  return data ?? {};
+}
@@ -1,15 +1,18 @@
 'use client';
 
-import { useQueries } from '@tanstack/react-query';
+import { useQuery } from '@tanstack/react-query';
 import { api } from '@/lib/api';
 import type { FieldSchema, ModelSchema } from '@/types';
 
-export type FilterOption = { value: string | number | boolean; label: string };
+export type FilterOption = { value: string | number | boolean; label: string; count?: number };
+
+/** Max relation / remote choice values fetched per filter field */
+const RELATION_FACET_LIMIT = 50;
 
 /**
  * Fetches filter options for list_filter fields when we show the table.
  * - Choice fields: use schema.fields[].choices
- * - Relation (FK) fields: fetch via autocomplete API
+ * - Relation (FK) and remote_choices fields: one facets request for all of them (values with counts)
  * - Boolean: All / Yes / No
  */
 export function useFilterOptions(schema: ModelSchema | null) {
@@ -19,36 +22,34 @@ export function useFilterOptions(schema: ModelSchema | null) {
       .map((name) => schema?.fields?.find((f) => f.name === name))
       .filter((f): f is FieldSchema => Boolean(f)) ?? [];
 
-  const relationFields = fields.filter((f) => f.relation && !f.choices?.length);
+  const relationFields = fields.filter(
+    (f) => (f.relation && !f.choices?.length) || f.remote_choices
+  );
+  const relationNames = relationFields.map((f) => f.name);
+  const appLabel = schema?.model?.app_label;
+  const modelName = schema?.model?.model_name;
 
-  const queries = useQueries({
-    queries: relationFields.map((field) => ({
-      queryKey: ['filterOptions', field.relation!.app_label, field.relation!.model_name],
-      queryFn: async () => {
-        try {
-          return await api.autocomplete(
-            field.relation!.app_label,
-            field.relation!.model_name,
-            undefined
-          );
-        } catch {
-          return await api.relationOptions(
-            field.relation!.app_label,
-            field.relation!.model_name,
-            undefined,
-            50
-          );
-        }
-      },
-      staleTime: 5 * 60 * 1000,
-      enabled: !!schema && !!field.relation?.app_label && !!field.relation?.model_name,
-    })),
+  const { data, isLoading } = useQuery({
+    queryKey: ['filterFacets', appLabel, modelName, relationNames.join(',')],
+    queryFn: () =>
+      api.facets(appLabel!, modelName!, { fields: relationNames, limit: RELATION_FACET_LIMIT }),
+    staleTime: 5 * 60 * 1000,
+    enabled: !!appLabel && !!modelName && relationNames.length > 0,
   });
 
   const optionsByField: Record<string, FilterOption[]> = {};
   if (schema?.fields) {
     for (const field of fields) {
-      if (field.choices?.length) {
+      if (field.remote_choices || (field.relation && !field.choices?.length)) {
+        const facet = data?.facets.find((f) => f.field === field.name);
+        optionsByField[field.name] = (facet?.values ?? [])
+          .filter((v) => v.value !== null)
+          .map((v) => ({
+            value: v.value as string | number | boolean,
+            label: v.label,
+            count: v.count,
+          }));
+      } else if (field.choices?.length) {
         optionsByField[field.name] = field.choices.map((c) => ({
           value: c.value,
           label: c.label,
@@ -58,22 +59,9 @@ export function useFilterOptions(schema: ModelSchema | null) {
           { value: true, label: 'Yes' },
           { value: false, label: 'No' },
         ];
-      } else if (field.relation) {
-        const idx = relationFields.findIndex((f) => f.name === field.name);
-        const result = queries[idx]?.data;
-        if (result?.results?.length) {
-          optionsByField[field.name] = result.results.map((r) => ({
-            value: r.id,
-            label: r.text,
-          }));
-        } else {
-          optionsByField[field.name] = [];
-        }
       }
     }
   }
 
-  const isLoading = queries.some((q) => q.isLoading);
-
-  return { optionsByField, isLoading };
+  return { optionsByField, isLoading: relationNames.length > 0 && isLoading };
 }
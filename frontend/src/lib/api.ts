@@ -1,7 +1,11 @@
 import type {
   ApiResponse,
+  FieldChoice,
   GlobalSchema,
+  DeletePreview,
   GlobalSearchResult,
+  Job,
+  JobAccepted,
   ModelSchema,
   PaginatedResponse,
   LoginResponse,
@@ -401,28 +405,90 @@ class ApiClient {
     });
   }
 
+  /**
+   * Delete an object. background deletes its cascades in chunks as a job
+   * and resolves once the job is done.
+   */
   async delete(
     appLabel: string,
     modelName: string,
-    id: string
+    id: string,
+    options: { background?: boolean } = {}
   ): Promise<void> {
-    await this.request(`/${appLabel}/${modelName}/${id}/`, {
+    const query = options.background ? '?background=1' : '';
+    const data = await this.request<Partial<JobAccepted> | undefined>(`/${appLabel}/${modelName}/${id}/${query}`, {
       method: 'DELETE',
     });
+    if (data?.job_id) await this.waitForJob(data.job_id);
+  }
+
+  /** Rows each relation loses when the object is deleted (counts only). */
+  async deletePreview(appLabel: string, modelName: string, id: string): Promise<DeletePreview> {
+    return this.request(`/${appLabel}/${modelName}/${id}/delete-preview/`);
   }
 
   async autocomplete(
     appLabel: string,
     modelName: string,
-    search?: string
-  ): Promise<{ results: Array<{ id: number; text: string }>; has_more: boolean }> {
+    search?: string,
+    cursor?: string
+  ): Promise<{ results: Array<{ id: number; text: string }>; has_more: boolean; next_cursor?: string | null }> {
     const params = new URLSearchParams();
     if (search) params.set('q', search);
+    if (cursor) params.set('cursor', cursor);
     params.set('page_size', '20');
     const query = params.toString();
     return this.request(`/${appLabel}/${modelName}/autocomplete/${query ? `?${query}` : ''}`);
   }
 
+  /**
+   * One page of a field's choices (GET .../choices/<field>/), for fields with remote_choices.
+   * url is the field's choices_url (a server path, resolved against the API origin).
+   */
+  async choices(
+    url: string,
+    search?: string,
+    cursor?: string
+  ): Promise<{ results: FieldChoice[]; has_more: boolean; next_cursor?: string | null }> {
+    const params = new URLSearchParams();
+    if (search) params.set('q', search);
+    if (cursor) params.set('cursor', cursor);
+    params.set('page_size', '50');
+    const absolute = new URL(url, this.baseUrl).toString();
+    return this.request(`${absolute}?${params.toString()}`);
+  }
+
+  /** Labels of given values of a remote_choices field (GET <choices_url>?values=...). */
+  async choiceLabels(url: string, values: Array<string | number>): Promise<{ results: FieldChoice[] }> {
+    const params = new URLSearchParams({ values: values.map(String).join(',') });
+    const absolute = new URL(url, this.baseUrl).toString();
+    return this.request(`${absolute}?${params.toString()}`);
+  }
+
+  /**
+   * Value counts for list_filter fields (GET .../facets/).
+   * Extra params (filters, search) narrow the counted rows as on the list endpoint.
+   */
+  async facets(
+    appLabel: string,
+    modelName: string,
+    options: { fields?: string[]; limit?: number; q?: string; params?: Record<string, string> } = {}
+  ): Promise<{
+    facets: Array<{
+      field: string;
+      type: 'relation' | 'choices' | 'boolean' | 'date' | 'value';
+      values: Array<{ value: string | number | boolean | null; label: string; count: number }>;
+      has_more: boolean;
+    }>;
+  }> {
+    const params = new URLSearchParams(options.params ?? {});
+    if (options.fields?.length) params.set('facet_fields', options.fields.join(','));
+    if (options.limit) params.set('facet_limit', String(options.limit));
+    if (options.q) params.set('facet_q', options.q);
+    const query = params.toString();
+    return this.request(`/${appLabel}/${modelName}/facets/${query ? `?${query}` : ''}`);
+  }
+
   /**
    * Generic relation options for any model (e.g. auth.Group, auth.Permission).
    * Use when the model may not be registered and autocomplete returns 404.
@@ -441,22 +507,98 @@ class ApiClient {
     return this.request(`/relation-options/?${params.toString()}`);
   }
 
-  /** Run a bulk action from admin.actions. POST .../actions/{actionName}/ with { ids }. */
+  /**
+   * Labels of selected relation ids across models, e.g. { 'auth.group': [1, 2] }.
+   * Labels are keyed by model label, then by id (as string).
+   */
+  async relationLabels(
+    ids: Record<string, Array<number | string>>
+  ): Promise<{ results: Record<string, Record<string, string>>; denied: string[]; invalid: string[] }> {
+    return this.request('/relation-labels/', {
+      method: 'POST',
+      body: JSON.stringify(ids),
+    });
+  }
+
+  /**
+   * Run a bulk action from admin.actions. POST .../actions/{actionName}/ with { ids },
+   * or with selectAllMatching on every row matching params (list filters and search).
+   * operationId lets actionProgress() follow the run.
+   */
   async runAction(
     appLabel: string,
     modelName: string,
     actionName: string,
-    ids: (string | number)[]
-  ): Promise<{ success: boolean; affected_count: number; message?: string }> {
+    ids: (string | number)[],
+    options: { selectAllMatching?: boolean; params?: Record<string, string>; operationId?: string } = {}
+  ): Promise<{ success: boolean; affected_count: number; message?: string } | JobAccepted> {
+    const query = options.selectAllMatching ? new URLSearchParams(options.params ?? {}).toString() : '';
     return this.request(
-      `/${appLabel}/${modelName}/actions/${actionName}/`,
+      `/${appLabel}/${modelName}/actions/${actionName}/${query ? `?${query}` : ''}`,
       {
         method: 'POST',
-        body: JSON.stringify({ ids: ids.map(String) }),
+        body: JSON.stringify({
+          ids: options.selectAllMatching ? [] : ids.map(String),
+          select_all_matching: options.selectAllMatching || undefined,
+          operation_id: options.operationId,
+        }),
       }
     );
   }
 
+  /** Progress of a running action started with an operationId. */
+  async actionProgress(
+    appLabel: string,
+    modelName: string,
+    operationId: string
+  ): Promise<{ status: 'running' | 'done' | 'failed'; done: number; total: number; error?: string }> {
+    return this.request(`/${appLabel}/${modelName}/actions/progress/${operationId}/`);
+  }
+
+  /** Delete many rows in one request: the given ids, or every row matching params with selectAllMatching. */
+  async bulkDelete(
+    appLabel: string,
+    modelName: string,
+    ids: (string | number)[],
+    options: { selectAllMatching?: boolean; params?: Record<string, string> } = {}
+  ): Promise<{ success: boolean; deleted_count: number; message?: string; errors?: Array<{ id?: string; error: string }> }> {
+    const query = options.selectAllMatching ? new URLSearchParams(options.params ?? {}).toString() : '';
+    return this.request(
+      `/${appLabel}/${modelName}/bulk-delete/${query ? `?${query}` : ''}`,
+      {
+        method: 'POST',
+        body: JSON.stringify({
+          ids: options.selectAllMatching ? [] : ids.map(String),
+          select_all_matching: options.selectAllMatching || undefined,
+        }),
+      }
+    );
+  }
+
+  /** Status and progress of a background job. */
+  async job(jobId: string): Promise<Job> {
+    return this.request(`/jobs/${jobId}/`);
+  }
+
+  /** Finished background job with its result (409 while it runs). */
+  async jobResult(jobId: string): Promise<Job> {
+    return this.request(`/jobs/${jobId}/result/`);
+  }
+
+  /**
+   * Poll a background job until it finishes; resolves with its result,
+   * rejects with its error. onProgress receives each status.
+   */
+  async waitForJob(jobId: string, onProgress?: (job: Job) => void, interval = 1000): Promise<Job['result']> {
+    for (;;) {
+      const job = await this.job(jobId);
+      onProgress?.(job);
+      if (job.status === 'failed') throw new Error(job.error || 'Job failed');
+      if (job.status === 'done') return (await this.jobResult(jobId)).result;
+      await new Promise((resolve) => setTimeout(resolve, interval));
+    }
+  }
+
   /** Bulk update for list_editable. POST .../bulk-update/ with { updates: [...] }. */
   async bulkUpdate(
     appLabel: string,
@@ -472,19 +614,39 @@ class ApiClient {
     );
   }
 
-  /** Get date hierarchy data for drill-down navigation. */
+  /** Bulk create (pasted rows). POST .../bulk-create/ with { rows: [...] }; all rows or none are created. */
+  async bulkCreate(
+    appLabel: string,
+    modelName: string,
+    rows: Array<Record<string, unknown>>
+  ): Promise<{ success: boolean; created_count: number; ids?: Array<string | number>; errors?: Array<{ index?: number; error: string }> }> {
+    return this.request(
+      `/${appLabel}/${modelName}/bulk-create/`,
+      {
+        method: 'POST',
+        body: JSON.stringify({ rows }),
+      }
+    );
+  }
+
+  /**
+   * Get date hierarchy data for drill-down navigation.
+   * filters (list filters, search) narrow the counted rows as on the list endpoint.
+   */
   async getDateHierarchy(
     appLabel: string,
     modelName: string,
-    params?: { year?: number; month?: number }
+    params?: { year?: number; month?: number },
+    filters?: Record<string, string>
   ): Promise<{
     field: string | null;
     level: 'year' | 'month' | 'day';
     year?: number;
     month?: number;
     dates: number[];
+    buckets?: Array<{ value: number; count: number }>;
   }> {
-    const searchParams = new URLSearchParams();
+    const searchParams = new URLSearchParams(filters ?? {});
     if (params?.year) searchParams.set('year', String(params.year));
     if (params?.month) searchParams.set('month', String(params.month));
     const query = searchParams.toString();
@@ -43,7 +43,7 @@ const widgetToComponent = {
 export function getFieldComponent(field: FieldSchema): ComponentType<FieldComponentProps> {
   if (field.relation?.type === 'many_to_many') return ManyToManyField as ComponentType<FieldComponentProps>;
   if (field.relation) return RelationField as ComponentType<FieldComponentProps>;
-  if (field.choices?.length) return SelectField as ComponentType<FieldComponentProps>;
+  if (field.choices?.length || field.remote_choices) return SelectField as ComponentType<FieldComponentProps>;
   if (field.widget === 'json' || field.type === 'object') return JsonField as ComponentType<FieldComponentProps>;
   return widgetToComponent[field.widget] ?? TextField;
 }
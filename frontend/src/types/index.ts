@@ -85,6 +85,9 @@ export interface ModelEndpoints {
   update?: string;
   delete?: string;
   autocomplete?: string;
+  facets?: string;
+  /** Template with a {field} placeholder */
+  choices?: string;
 }
 
 export interface ModelSummary {
@@ -172,7 +175,15 @@ export interface FieldSchema {
   default?: unknown;
   has_default?: boolean;
   choices?: FieldChoice[];
+  /** Too many choices to inline: search them at choices_url */
+  remote_choices?: boolean;
+  choices_count?: number;
+  choices_url?: string;
   relation?: RelationInfo;
+  /** Estimated number of options (relation and list_filter fields) */
+  cardinality?: number;
+  /** 'remote': too many options to preload, use server-side autocomplete */
+  options_mode?: 'preload' | 'remote';
 }
 
 export interface FieldsetSchema {
@@ -232,6 +243,53 @@ export interface CustomViewSchema {
   methods: string[];
 }
 
+/**
+ * Background job (action, object tool or custom view with `background = True`).
+ * Returned by /api/jobs/{id}/; `result` only from /api/jobs/{id}/result/.
+ */
+export interface Job {
+  id: string;
+  app_label: string;
+  model_name: string;
+  kind: 'action' | 'object_tool' | 'custom_view' | 'delete';
+  name: string;
+  object_id: string | null;
+  status: 'pending' | 'running' | 'done' | 'failed';
+  progress: { done: number; total: number };
+  error: string | null;
+  created_at: string;
+  started_at: string | null;
+  finished_at: string | null;
+  result?: Record<string, unknown> | null;
+}
+
+/**
+ * Rows affected by deleting an object, per relation (GET .../{id}/delete-preview/).
+ * `chunked` recommends deleting with ?chunked=1 / ?background=1.
+ */
+export interface DeletePreview {
+  object: { id: string | number; repr: string };
+  total: number;
+  relations: Array<{
+    model: string;
+    verbose_name: string;
+    field: string;
+    path: string;
+    action: 'delete' | 'set_null' | 'protect' | 'restrict' | 'other';
+    count: number;
+    recursive: boolean;
+  }>;
+  protected: DeletePreview['relations'];
+  chunked: boolean;
+}
+
+/** 202 response of an endpoint that queued a background job. */
+export interface JobAccepted {
+  job_id: string;
+  status: Job['status'];
+  status_url: string;
+}
+
 export interface ModelInfo {
   name: string;
   app_label: string;
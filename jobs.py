@@ -0,0 +1,177 @@
+"""
+Background jobs for heavy admin actions, object tools and custom views.
+
+A callable marked background = True is not run inside the HTTP request: the
+endpoint stores a Job row and hands the call to an in-process thread pool
+(JOB_WORKERS threads, no external broker) after the transaction commits, then
+answers 202 with the job id. Status, progress and result are read back from
+the Job row, so any worker can answer. At most JOB_MAX_CONCURRENT_PER_MODEL
+jobs run or wait per model; JOB_RUNNER = 'sync' runs jobs inline (tests,
+development).
+
+Jobs live as long as the process: a job still pending or running when its
+worker restarts is not resumed, and stops counting towards the per-model
+limit after JOB_STALE_AFTER.
+"""
+
+import json
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import close_old_connections, connections, router, transaction
+from django.utils import timezone
+from rest_framework.response import Response
+
+from .models import Job
+from .settings import djnext_settings
+
+
+logger = logging.getLogger('djnext_admin')
+
+ACTIVE_STATUSES = (Job.Status.PENDING, Job.Status.RUNNING)
+JOB_STALE_AFTER = timedelta(hours=6)
+
+_executor = None
+_executor_lock = threading.Lock()
+# Serializes the per-model limit check and the Job insert within a process
+_submit_lock = threading.Lock()
+
+
+class JobLimitReached(Exception):
+    """The model already has JOB_MAX_CONCURRENT_PER_MODEL active jobs."""
+
+
+def is_background(func) -> bool:
+    return bool(getattr(func, 'background', False))
+
+
+def _get_executor():
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=djnext_settings.JOB_WORKERS,
+                    thread_name_prefix='djnext-job',
+                )
+    return _executor
+
+
+def get_active_jobs(model):
+    """Pending or running jobs of a model, ignoring stale ones."""
+    return Job.objects.filter(
+        app_label=model._meta.app_label,
+        model_name=model._meta.model_name,
+        status__in=ACTIVE_STATUSES,
+        created_at__gte=timezone.now() - JOB_STALE_AFTER,
+    )
+
+
+def _to_json(result):
+    """JSON-compatible result: Response data, dicts as is, anything else under 'data'."""
+    if isinstance(result, Response):
+        result = result.data
+    elif not isinstance(result, dict):
+        result = {'data': result}
+    return json.loads(json.dumps(result, cls=DjangoJSONEncoder, default=str))
+
+
+def report_progress(job_id, done, total):
+    """Store a job's progress (called after each chunk)."""
+    Job.objects.filter(pk=job_id).update(progress_done=done, progress_total=total)
+
+
+def _run(job_id, func):
+    threaded = djnext_settings.JOB_RUNNER != 'sync'
+    if threaded:
+        close_old_connections()
+    try:
+        Job.objects.filter(pk=job_id).update(status=Job.Status.RUNNING, started_at=timezone.now())
+        try:
+            result = func(lambda done, total: report_progress(job_id, done, total))
+        except Exception as e:
+            logger.exception('DJNext job %s failed', job_id)
+            Job.objects.filter(pk=job_id).update(
+                status=Job.Status.FAILED, error=str(e), finished_at=timezone.now()
+            )
+            return
+        Job.objects.filter(pk=job_id).update(
+            status=Job.Status.DONE, result=_to_json(result), finished_at=timezone.now()
+        )
+    finally:
+        # Worker threads keep no connections between jobs
+        if threaded:
+            connections.close_all()
+
+
+def submit_job(request, model, kind, name, func, object_id='', total=0):
+    """
+    Create a Job and run func(progress) in the background once the current
+    transaction commits. progress(done, total) records progress; the return
+    value (dict, Response or JSON-serializable value) becomes the job result.
+
+    The limit check and the insert run under a process lock, in a transaction
+    that locks the model's active Job rows (SELECT ... FOR UPDATE where the
+    database supports it), so concurrent requests cannot both take the last slot.
+
+    Raises:
+        JobLimitReached: Too many active jobs for the model.
+
+    Returns:
+        Job
+    """
+    limit = djnext_settings.JOB_MAX_CONCURRENT_PER_MODEL
+    user = getattr(request, 'user', None)
+    with _submit_lock, transaction.atomic(using=router.db_for_write(Job)):
+        if limit:
+            active = list(get_active_jobs(model).select_for_update().values_list('pk', flat=True))
+            if len(active) >= limit:
+                raise JobLimitReached(
+                    f'{limit} jobs are already running for {model._meta.verbose_name_plural}; try again later.'
+                )
+        job = Job.objects.create(
+            user=user if (user and getattr(user, 'is_authenticated', False)) else None,
+            app_label=model._meta.app_label,
+            model_name=model._meta.model_name,
+            kind=kind,
+            name=name,
+            object_id=str(object_id or ''),
+            progress_total=total,
+        )
+    if djnext_settings.JOB_RUNNER == 'sync':
+        transaction.on_commit(lambda: _run(job.pk, func))
+    else:
+        transaction.on_commit(lambda: _get_executor().submit(_run, job.pk, func))
+    return job
+
+
+def job_accepted_response(job, status_url):
+    """202 response for a submitted job."""
+    return Response(
+        {'job_id': str(job.pk), 'status': job.status, 'status_url': status_url},
+        status=202,
+    )
+
+
+def serialize_job(job, include_result=False):
+    """Job as API data."""
+    data = {
+        'id': str(job.pk),
+        'app_label': job.app_label,
+        'model_name': job.model_name,
+        'kind': job.kind,
+        'name': job.name,
+        'object_id': job.object_id or None,
+        'status': job.status,
+        'progress': {'done': job.progress_done, 'total': job.progress_total},
+        'error': job.error or None,
+        'created_at': job.created_at,
+        'started_at': job.started_at,
+        'finished_at': job.finished_at,
+    }
+    if include_result:
+        data['result'] = job.result
+    return data
@@ -0,0 +1,48 @@
+"""
+Compile all model schemas and the global app skeleton into a JSON artifact.
+
+    python manage.py djnext_compile_schema [--output PATH] [--language CODE]
+
+Run at deploy time and point SCHEMA_ARTIFACT_PATH at the file so cold workers
+serve /schema/ without introspecting every model.
+"""
+
+from django.conf import settings as django_settings
+from django.core.management.base import BaseCommand, CommandError
+
+from ...core.schema_artifact import write_artifact
+from ...settings import djnext_settings
+
+
+class Command(BaseCommand):
+    help = 'Precompile DJNext Admin model schemas into a versioned JSON artifact.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--output',
+            default=None,
+            help='Artifact path (default: DJNEXT_ADMIN["SCHEMA_ARTIFACT_PATH"]).',
+        )
+        parser.add_argument(
+            '--language',
+            default=None,
+            help='Language to compile verbose names in (default: LANGUAGE_CODE).',
+        )
+
+    def handle(self, *args, **options):
+        path = options['output'] or djnext_settings.SCHEMA_ARTIFACT_PATH
+        if not path:
+            raise CommandError(
+                'No output path. Pass --output or set DJNEXT_ADMIN["SCHEMA_ARTIFACT_PATH"].'
+            )
+        language = options['language'] or django_settings.LANGUAGE_CODE
+
+        try:
+            artifact = write_artifact(path, language)
+        except OSError as e:
+            raise CommandError(f'Could not write {path}: {e}')
+
+        self.stdout.write(self.style.SUCCESS(
+            f'Compiled {len(artifact["models"])} model schemas to {path} '
+            f'(fingerprint {artifact["fingerprint"][:12]}, language {language}).'
+        ))
@@ -1,11 +1,13 @@
 """
-Models for DJNext Admin – audit/history logging.
+Models for DJNext Admin – audit/history logging and background jobs.
 
 These live in djnext_admin so they auto-integrate in every project
 that uses DJNext Admin. Register in admin so they appear in the
 Django admin and in the DJNext frontend.
 """
 
+import uuid
+
 from django.conf import settings
 from django.db import models
 
@@ -55,3 +57,55 @@ class AuditLog(models.Model):
 
     def __str__(self):
         return f'{self.get_action_display()} {self.app_label}.{self.model_name} #{self.object_id}'
+
+
+class Job(models.Model):
+    """
+    A background run of an admin action, object tool or custom view marked
+    background = True, or of a delete with ?background=1 (see djnext_admin.jobs).
+
+    - kind / name: what runs ('action', 'object_tool', 'custom_view', 'delete' and its name)
+    - object_id: target object for object tools and detail views
+    - progress_done / progress_total: rows processed, for chunked actions
+    - result: JSON result once done; error: message if failed
+    """
+
+    class Status(models.TextChoices):
+        PENDING = 'pending', 'Pending'
+        RUNNING = 'running', 'Running'
+        DONE = 'done', 'Done'
+        FAILED = 'failed', 'Failed'
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='djnext_jobs',
+    )
+    app_label = models.CharField(max_length=100)
+    model_name = models.CharField(max_length=100)
+    kind = models.CharField(max_length=20)
+    name = models.CharField(max_length=255)
+    object_id = models.CharField(max_length=255, blank=True)
+    status = models.CharField(max_length=20, choices=Status.choices, default=Status.PENDING, db_index=True)
+    progress_done = models.PositiveBigIntegerField(default=0)
+    progress_total = models.PositiveBigIntegerField(default=0)
+    result = models.JSONField(null=True, blank=True)
+    error = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True, db_index=True)
+    started_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        db_table = 'djnext_admin_job'
+        ordering = ['-created_at']
+        verbose_name = 'Job'
+        verbose_name_plural = 'Jobs'
+        indexes = [
+            models.Index(fields=['app_label', 'model_name', 'status']),
+        ]
+
+    def __str__(self):
+        return f'{self.name} on {self.app_label}.{self.model_name} ({self.get_status_display()})'
@@ -3,8 +3,66 @@ Permission classes for DJNext Admin.
 Uses Django's built-in permission system.
 """
 
+import inspect
+
+from django.contrib.admin.options import BaseModelAdmin
 from rest_framework import permissions
 from .settings import djnext_settings
+from .core.permission_matrix import get_permission_matrix
+
+
+# ModelAdmin methods consulted for object-level checks, by permission type
+OBJECT_PERMISSION_METHODS = {
+    'view': 'has_view_permission',
+    'change': 'has_change_permission',
+    'delete': 'has_delete_permission',
+}
+
+
+def _compile_check(method):
+    """
+    Wrap an admin permission method as check(request, obj), resolving its
+    signature once. Returns None if it accepts neither (request, obj) nor (request).
+    """
+    try:
+        signature = inspect.signature(method)
+    except (TypeError, ValueError):
+        return None
+    try:
+        signature.bind(None, None)
+        return method
+    except TypeError:
+        pass
+    try:
+        signature.bind(None)
+        return lambda request, obj: method(request)
+    except TypeError:
+        return None
+
+
+def compile_object_permission_checks(model_admin):
+    """
+    Object-level checks for a ModelAdmin, resolved when its ViewSet is built.
+
+    Methods the admin does not override are skipped: Django's defaults only
+    repeat the model-level permission already checked in has_permission().
+
+    Returns:
+        dict: {'view' | 'change' | 'delete': check(request, obj)}
+    """
+    checks = {}
+    if model_admin is None:
+        return checks
+    for perm_type, name in OBJECT_PERMISSION_METHODS.items():
+        method = getattr(model_admin, name, None)
+        if method is None:
+            continue
+        if getattr(method, '__func__', None) is getattr(BaseModelAdmin, name):
+            continue
+        check = _compile_check(method)
+        if check is not None:
+            checks[perm_type] = check
+    return checks
 
 
 class DJNextBasePermission(permissions.BasePermission):
@@ -52,6 +110,18 @@ class DJNextModelPermission(DJNextBasePermission):
         'DELETE': 'delete',
     }
 
+    # Generated viewset actions whose permission differs from their HTTP method
+    ACTION_PERMISSION_MAP = {
+        'bulk_update': 'change',
+        'bulk_delete': 'delete',
+        'delete_preview': 'delete',
+    }
+
+    def get_permission_type(self, request, view):
+        """Permission type ('view', 'add', 'change', 'delete') a request needs."""
+        perm_type = self.ACTION_PERMISSION_MAP.get(getattr(view, 'action', None))
+        return perm_type or self.METHOD_PERMISSION_MAP.get(request.method, 'view')
+
     def has_permission(self, request, view):
         # Check base permissions first
         if not super().has_permission(request, view):
@@ -67,11 +137,13 @@ class DJNextModelPermission(DJNextBasePermission):
             return True  # No model specified, allow
 
         # Check Django permission
-        return self._check_model_permission(request, model)
+        return self._check_model_permission(request, model, self.get_permission_type(request, view))
 
-    def _check_model_permission(self, request, model):
+    def _check_model_permission(self, request, model, perm_type):
         """Check if user has the required permission for the model."""
-        perm_type = self.METHOD_PERMISSION_MAP.get(request.method, 'view')
+        matrix = get_permission_matrix(request.user)
+        if matrix is not None:
+            return matrix.has_model_perm(model, perm_type)
         app_label = model._meta.app_label
         model_name = model._meta.model_name
         permission = f'{app_label}.{perm_type}_{model_name}'
@@ -83,13 +155,19 @@ class DJNextModelPermission(DJNextBasePermission):
         if djnext_settings.SUPERUSER_FULL_ACCESS and request.user.is_superuser:
             return True
 
+        perm_type = self.get_permission_type(request, view)
+
+        # Checks compiled by ViewSetFactory
+        checks = getattr(view, 'object_permission_checks', None)
+        if checks is not None:
+            check = checks.get(perm_type)
+            return check(request, obj) if check is not None else True
+
         # Get model admin for custom permission checks
         model_admin = getattr(view, 'model_admin', None)
         if not model_admin:
             return True
 
-        perm_type = self.METHOD_PERMISSION_MAP.get(request.method, 'view')
-
         # Check admin's permission method if exists
         if perm_type == 'view':
             method = getattr(model_admin, 'has_view_permission', None)
@@ -5,6 +5,8 @@ Creates DRF serializers on-the-fly based on model and admin configuration.
 """
 
 from rest_framework import serializers
+
+from ..core.factory_cache import FactoryCache
 from .fields import RelatedFieldSerializer, FileFieldSerializer, ImageFieldSerializer, wrap_html_value
 
 
@@ -13,7 +15,7 @@ class SerializerFactory:
     Dynamically creates serializers for models.
     """
 
-    _cache = {}
+    _cache = FactoryCache('serializers')
 
     @classmethod
     def get_serializer(cls, model, model_admin, action='list'):
@@ -30,12 +32,10 @@ class SerializerFactory:
         """
         cache_key = f'{model._meta.label}_{action}'
 
-        if cache_key not in cls._cache:
-            cls._cache[cache_key] = cls._create_serializer(
-                model, model_admin, action
-            )
-
-        return cls._cache[cache_key]
+        return cls._cache.get_or_build(
+            cache_key,
+            lambda: cls._create_serializer(model, model_admin, action)
+        )
 
     @classmethod
     def _create_serializer(cls, model, model_admin, action):
@@ -277,6 +277,6 @@ class SerializerFactory:
     def invalidate_model(cls, model):
         """Invalidate cache for a specific model."""
         label = model._meta.label
-        keys_to_remove = [k for k in cls._cache if k.startswith(label)]
+        keys_to_remove = [k for k in cls._cache.keys() if k.startswith(f'{label}_')]
         for key in keys_to_remove:
-            del cls._cache[key]
+            cls._cache.pop(key)
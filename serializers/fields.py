@@ -3,6 +3,7 @@ Custom serializer fields for DJNext Admin.
 """
 
 from rest_framework import serializers
+from django.core.exceptions import ValidationError as DjangoValidationError
 from django.utils.safestring import SafeData
 
 
@@ -96,3 +97,29 @@ class ChoiceDisplayField(serializers.ChoiceField):
             'value': value,
             'display': display or value,
         }
+
+
+class PrefetchedPrimaryKeyRelatedField(serializers.PrimaryKeyRelatedField):
+    """
+    PrimaryKeyRelatedField resolving pks from objects fetched beforehand
+    (one IN query for a whole batch) instead of one query per value.
+
+    Args:
+        objects: {pk: instance} of the related model
+    """
+
+    def __init__(self, objects=None, **kwargs):
+        self.objects = objects or {}
+        super().__init__(**kwargs)
+
+    def to_internal_value(self, data):
+        if isinstance(data, bool):
+            self.fail('incorrect_type', data_type=type(data).__name__)
+        try:
+            pk = self.get_queryset().model._meta.pk.to_python(data)
+        except (DjangoValidationError, TypeError, ValueError):
+            self.fail('incorrect_type', data_type=type(data).__name__)
+        obj = self.objects.get(pk)
+        if obj is None:
+            self.fail('does_not_exist', pk_value=data)
+        return obj
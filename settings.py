@@ -20,6 +20,8 @@ from django.conf import settings as django_settings
 # Allowed values
 ALLOWED_LAYOUTS = ('basic', 'glassmorphism', 'aurora', 'neumorphism', 'minimal')
 ALLOWED_THEME_MODES = ('dark', 'light', 'system')
+ALLOWED_SEARCH_MODES = ('per_model', 'union')
+ALLOWED_JOB_RUNNERS = ('thread', 'sync')
 
 
 # All defaults in one place
@@ -53,8 +55,43 @@ DEFAULTS = {
     'ENABLE_FILTERS': True,
     'ENABLE_ORDERING': True,
 
+    # Global search: 'per_model' runs one query per model; 'union' compiles all
+    # models on the same database into one UNION ALL query.
+    'SEARCH_MODE': 'per_model',
+    'AUTOCOMPLETE_INDEX_MODELS': [],  # e.g. ['auth.Group', 'auth.Permission']
+    'AUTOCOMPLETE_INDEX_MAX_ROWS': 10000,
+    # Fields with more estimated options use server-side autocomplete in the UI
+    'AUTOCOMPLETE_THRESHOLD': 200,
+    # Fields with more choices are served by the choices/<field>/ endpoint
+    'CHOICES_INLINE_LIMIT': 100,
+    # Rows per INSERT in bulk-create
+    'BULK_CREATE_BATCH_SIZE': 500,
+    # Rows per chunk when an admin action runs (per action: djnext_chunk_size)
+    'ACTION_CHUNK_SIZE': 1000,
+    # Rows per chunk (and transaction) of a chunked cascade delete
+    'DELETE_CHUNK_SIZE': 1000,
+    # Background jobs (actions, object tools and views with background = True):
+    # 'thread' runs them in an in-process pool of JOB_WORKERS threads, 'sync' inline
+    'JOB_RUNNER': 'thread',
+    'JOB_WORKERS': 4,
+    # Pending or running jobs per model; further submissions get 429 (0 = no limit)
+    'JOB_MAX_CONCURRENT_PER_MODEL': 2,
+
     # Cache
     'SCHEMA_CACHE_TIMEOUT': 300,
+    'PERMISSION_CACHE_TIMEOUT': 300,
+    'AUTH_CACHE_TIMEOUT': 300,
+    'FACET_CACHE_TIMEOUT': 60,
+    'DATE_HIERARCHY_CACHE_TIMEOUT': 60,
+    'CARDINALITY_CACHE_TIMEOUT': 3600,
+    # JSON file written by `manage.py djnext_compile_schema`; loaded at startup
+    'SCHEMA_ARTIFACT_PATH': None,
+
+    # Routing: build each model's ViewSet on its first request instead of at
+    # URLconf import (for registries with hundreds of models)
+    'LAZY_ROUTING': False,
+    # Pre-build every ViewSet and serializer in a background thread at startup
+    'WARM_UP_FACTORIES': False,
 
     # Models
     'EXCLUDE_APPS': ['contenttypes', 'sessions'],
@@ -105,17 +142,42 @@ class DJNextSettings:
     1. DJNEXT_ADMIN setting
     2. Django admin site setting (for site_header, site_title)
     3. Default value
+
+    Frozen, slot-based snapshot: each setting is resolved (lookup, fallback,
+    validation) on first access and stored in its slot, so later reads are
+    plain attribute reads. refresh() empties the slots; it runs on Django's
+    setting_changed signal for DJNEXT_ADMIN (see djnext_admin.signals).
     """
 
+    __slots__ = tuple(DEFAULTS)
+
     @property
     def _user_settings(self):
         """Get user settings dict from Django settings."""
         return getattr(django_settings, 'DJNEXT_ADMIN', {})
 
     def __getattr__(self, name):
+        # Only called when the slot is still empty (or name is not a setting)
         if name.startswith('_') or name not in DEFAULTS:
             raise AttributeError(f"Invalid setting: '{name}'")
 
+        value = self._resolve(name)
+        object.__setattr__(self, name, value)
+        return value
+
+    def __setattr__(self, name, value):
+        raise AttributeError('DJNext settings are read-only; change DJNEXT_ADMIN instead.')
+
+    def refresh(self):
+        """Drop resolved values; they are re-read from DJNEXT_ADMIN on next access."""
+        for name in DEFAULTS:
+            try:
+                object.__delattr__(self, name)
+            except AttributeError:
+                pass
+
+    def _resolve(self, name):
+        """Resolve one setting: user value or default, fallbacks and validation."""
         # Get value from user settings
         value = self._user_settings.get(name, DEFAULTS[name])
 
@@ -147,6 +209,14 @@ class DJNextSettings:
         if name == 'THEME_MODE':
             return value if value in ALLOWED_THEME_MODES else 'dark'
 
+        # Validate search mode
+        if name == 'SEARCH_MODE':
+            return value if value in ALLOWED_SEARCH_MODES else 'per_model'
+
+        # Validate job runner
+        if name == 'JOB_RUNNER':
+            return value if value in ALLOWED_JOB_RUNNERS else 'thread'
+
         return value
 
     def get_layout_config(self):
@@ -0,0 +1,110 @@
+"""
+Signal receivers for DJNext Admin caches.
+
+Connected from DjnextAdminConfig.ready().
+"""
+
+from django.apps import apps
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Group
+from django.core.signals import setting_changed
+from django.db.models.signals import m2m_changed, post_delete, post_save
+
+from . import authentication
+from .core import lookup_index, model_version, permission_matrix
+from .core.registry import get_registry, invalidate_registry_index
+from .settings import djnext_settings
+
+
+M2M_ACTIONS = ('post_add', 'post_remove', 'post_clear')
+
+
+def connect():
+    """Connect all receivers. Safe to call more than once."""
+    User = get_user_model()
+
+    for field_name in ('user_permissions', 'groups'):
+        descriptor = getattr(User, field_name, None)
+        if descriptor is None:
+            # Custom user model without PermissionsMixin
+            continue
+        m2m_changed.connect(
+            _user_permissions_changed,
+            sender=descriptor.through,
+            dispatch_uid=f'djnext_admin_user_{field_name}_changed',
+        )
+
+    post_save.connect(
+        _user_changed,
+        sender=User,
+        dispatch_uid='djnext_admin_user_saved',
+    )
+    post_delete.connect(
+        _user_changed,
+        sender=User,
+        dispatch_uid='djnext_admin_user_deleted',
+    )
+
+    m2m_changed.connect(
+        _group_permissions_changed,
+        sender=Group.permissions.through,
+        dispatch_uid='djnext_admin_group_permissions_changed',
+    )
+    post_delete.connect(
+        _group_deleted,
+        sender=Group,
+        dispatch_uid='djnext_admin_group_deleted',
+    )
+    # Data versions of every model whose results DJNext caches; models
+    # registered later are tracked by the registry hooks
+    for model in list(get_registry()):
+        model_version.track_model(model)
+    for label in djnext_settings.AUTOCOMPLETE_INDEX_MODELS or []:
+        try:
+            model_version.track_model(apps.get_model(label))
+        except (LookupError, ValueError):
+            continue
+
+    setting_changed.connect(
+        _setting_changed,
+        dispatch_uid='djnext_admin_setting_changed',
+    )
+
+
+def _user_permissions_changed(sender, instance, action, reverse, pk_set, **kwargs):
+    """User.user_permissions or User.groups changed."""
+    if action not in M2M_ACTIONS:
+        return
+    if not reverse:
+        permission_matrix.invalidate_user(instance.pk)
+    elif pk_set:
+        # Changed from the Permission/Group side: pk_set holds user pks
+        for user_pk in pk_set:
+            permission_matrix.invalidate_user(user_pk)
+    else:
+        permission_matrix.invalidate_all()
+
+
+def _user_changed(sender, instance, **kwargs):
+    """User saved or deleted: password, active and staff flags may have changed."""
+    authentication.invalidate_user(instance)
+
+
+def _group_permissions_changed(sender, action, **kwargs):
+    """Group.permissions changed: affects every member of the group."""
+    if action in M2M_ACTIONS:
+        permission_matrix.invalidate_all()
+
+
+def _group_deleted(sender, **kwargs):
+    permission_matrix.invalidate_all()
+
+
+def _setting_changed(setting, **kwargs):
+    if setting == 'AUTHENTICATION_BACKENDS':
+        permission_matrix.matrix_supported.cache_clear()
+    elif setting == 'DJNEXT_ADMIN':
+        djnext_settings.refresh()
+        lookup_index.clear()
+        # Exclusion settings are baked into the registry index
+        invalidate_registry_index()
@@ -0,0 +1,131 @@
+"""
+Admin action execution for list views.
+
+The selection is either explicit ids or, with select_all_matching, every row
+the list endpoint would return for the request's filter and search params
+(rebuilt on the server, no ids sent). The action runs over pk-ordered chunks
+of ACTION_CHUNK_SIZE rows: each chunk is found with a keyset query (pk > last
+pk) and passed to the admin action as a plain pk__in queryset, so actions on
+millions of rows never load or lock them all at once. Chunks do not share a
+transaction: when one fails, the chunks before it stay applied (ActionFailed
+carries how many rows they covered).
+"""
+
+from django.core.exceptions import ValidationError as DjangoValidationError
+
+from ..core.progress import set_progress
+from ..exceptions import ValidationError
+from ..settings import djnext_settings
+from .deletion import TRUE_VALUES
+
+
+class ActionFailed(Exception):
+    """An action call raised after done rows had already been processed."""
+
+    def __init__(self, error, done):
+        super().__init__(str(error))
+        self.error = error
+        self.done = done
+
+
+def is_select_all(request) -> bool:
+    """select_all_matching is true: JSON true, or '1'/'true'/'yes' in a form or query string."""
+    value = request.data.get('select_all_matching')
+    if isinstance(value, str):
+        return value.strip().lower() in TRUE_VALUES
+    return value is True
+
+
+def get_action_queryset(view, request):
+    """
+    Rows an action applies to.
+
+    Returns:
+        QuerySet, or None when neither ids nor select_all_matching was sent
+
+    Raises:
+        ValidationError: ids is not a list of valid primary keys
+    """
+    if is_select_all(request):
+        return view.filter_queryset(view.get_queryset())
+    if hasattr(request.data, 'getlist'):
+        # Form data: ids=1&ids=2
+        ids = request.data.getlist('ids')
+    else:
+        ids = request.data.get('ids') or []
+    if not isinstance(ids, list):
+        raise ValidationError('ids must be a list.')
+    if not ids:
+        return None
+    pk_field = view.model._meta.pk
+    try:
+        pks = [pk_field.to_python(pk) for pk in ids]
+    except (DjangoValidationError, TypeError):
+        raise ValidationError('ids must be a list of primary keys.')
+    return view.get_queryset().filter(pk__in=pks)
+
+
+def get_chunk_size(action_func) -> int:
+    """Rows per chunk: the action's djnext_chunk_size, else ACTION_CHUNK_SIZE; 0 = one chunk."""
+    chunk_size = getattr(action_func, 'djnext_chunk_size', None)
+    if chunk_size is None:
+        chunk_size = djnext_settings.ACTION_CHUNK_SIZE
+    return chunk_size or 0
+
+
+def iter_chunks(queryset, base_queryset, chunk_size):
+    """
+    Yield querysets of up to chunk_size rows of queryset in pk order, as
+    base_queryset.filter(pk__in=...). Rows changed by earlier chunks are
+    not revisited.
+    """
+    keys = queryset.order_by('pk').values_list('pk', flat=True)
+    last_pk = None
+    while True:
+        page = keys if last_pk is None else keys.filter(pk__gt=last_pk)
+        pks = list(page[:chunk_size])
+        if not pks:
+            return
+        yield base_queryset.filter(pk__in=pks), len(pks)
+        if len(pks) < chunk_size:
+            return
+        last_pk = pks[-1]
+
+
+def run_action(action_func, model_admin, request, queryset, base_queryset, total,
+               operation_id=None, on_progress=None):
+    """
+    Run an admin action over queryset in chunks, reporting progress after each.
+
+    Args:
+        base_queryset: Unfiltered viewset queryset the chunks are built from
+        total: Row count for progress reporting
+        operation_id: Client-chosen id for the progress endpoint (optional)
+        on_progress: Optional callable(done, total) after each chunk
+
+    Returns:
+        tuple: (rows passed to the action, [non-None return value of each call])
+
+    Raises:
+        ActionFailed: A call raised; done is the row count of the chunks before it
+    """
+    chunk_size = get_chunk_size(action_func)
+    done = 0
+    results = []
+    set_progress(request.user, operation_id, done, total)
+    try:
+        if not chunk_size:
+            results.append(action_func(model_admin, request, queryset))
+            done = total
+        else:
+            for chunk, size in iter_chunks(queryset, base_queryset, chunk_size):
+                results.append(action_func(model_admin, request, chunk))
+                done += size
+                set_progress(request.user, operation_id, done, total)
+                if on_progress is not None:
+                    on_progress(done, total)
+    except Exception as e:
+        set_progress(request.user, operation_id, done, total, status='failed', error=str(e))
+        raise ActionFailed(e, done) from e
+    set_progress(request.user, operation_id, done, total, status='done')
+    return done, [result for result in results if result is not None]
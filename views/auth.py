@@ -116,6 +116,11 @@ class AuthViewSet(viewsets.ViewSet):
         Returns current user info.
         """
         user = request.user
+        # A user from DJNextJWTAuthentication's cache has most fields deferred:
+        # load them in one query instead of one per field
+        deferred = user.get_deferred_fields() if hasattr(user, 'get_deferred_fields') else ()
+        if deferred:
+            user.refresh_from_db(fields=list(deferred))
 
         return Response({
             'id': user.pk,
@@ -0,0 +1,286 @@
+"""
+Autocomplete queries for relation widgets.
+
+Matches are ranked prefix-first (istartswith before icontains), then by pk,
+and paged with a keyset cursor over (rank, pk), so "load more" on a large
+table never uses OFFSET. Labels come from the admin's djnext_label_fields
+(a values-only projection) when set, otherwise from str(obj).
+
+Models opted into the in-process lookup index (djnext_autocomplete_index or
+AUTOCOMPLETE_INDEX_MODELS) are answered from memory with the same ranking,
+ordering and cursors. Long choice lists (remote_choices in the schema) are
+searched the same way from a per-field choice index.
+"""
+
+import base64
+import binascii
+import json
+
+from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.db.models import Case, IntegerField, Q, Value, When
+
+from ..core import lookup_index
+from ..core.registry import get_model_admin
+from ..core.row_scope import apply_row_scope, is_request_scoped
+from ..settings import djnext_settings
+
+
+AUTOCOMPLETE_PAGE_SIZE = 20
+AUTOCOMPLETE_MAX_PAGE_SIZE = 100
+# Values labelled by one choices?values= request
+CHOICE_LABELS_MAX_VALUES = 100
+# Fallback search fields when the admin has no search_fields
+AUTOCOMPLETE_MAX_FALLBACK_FIELDS = 5
+# DRF SearchFilter lookup prefixes (^ startswith, = exact, @ full text, $ regex)
+SEARCH_FIELD_PREFIXES = '^=@$'
+LABEL_SEPARATOR = ' · '
+
+
+def get_page_size(value, default=AUTOCOMPLETE_PAGE_SIZE, maximum=AUTOCOMPLETE_MAX_PAGE_SIZE):
+    """page_size query param, clamped to 1..maximum."""
+    try:
+        page_size = int(value)
+    except (TypeError, ValueError):
+        return default
+    return max(1, min(page_size, maximum))
+
+
+def get_autocomplete_search_fields(model, search_fields=None):
+    """
+    Field lookups to match against. Uses search_fields (without DRF prefixes),
+    else the model's first text fields, else a common name field.
+    """
+    names = [f.lstrip(SEARCH_FIELD_PREFIXES) for f in search_fields or [] if f]
+    if names:
+        return names
+
+    for f in model._meta.get_fields():
+        if getattr(f, 'get_internal_type', None) and not getattr(f, 'many_to_many', False) and not getattr(f, 'one_to_many', False):
+            if f.get_internal_type() in ('CharField', 'TextField', 'SlugField'):
+                names.append(f.name)
+    if names:
+        return names[:AUTOCOMPLETE_MAX_FALLBACK_FIELDS]
+
+    for name in ('name', 'username', 'codename', 'title', 'label'):
+        try:
+            model._meta.get_field(name)
+            return [name]
+        except Exception:
+            pass
+    return []
+
+
+def get_label_fields(model_admin):
+    """Fields from djnext_label_fields, or None to label options with str(obj)."""
+    names = getattr(model_admin, 'djnext_label_fields', None) if model_admin is not None else None
+    return list(names) if names else None
+
+
+def build_label(pk, values):
+    """Label from projected field values."""
+    return LABEL_SEPARATOR.join(str(v) for v in values if v not in (None, '')) or f'#{pk}'
+
+
+def encode_cursor(rank, pk) -> str:
+    data = json.dumps([rank, str(pk)]).encode()
+    return base64.urlsafe_b64encode(data).decode().rstrip('=')
+
+
+def decode_cursor(cursor, model=None):
+    """
+    (rank, pk) from a cursor, or None if it is malformed. Without a model the
+    position is an int (choice indexes).
+    """
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        rank, pk = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return int(rank), model._meta.pk.to_python(pk) if model is not None else int(pk)
+    except (binascii.Error, ValueError, TypeError, ValidationError):
+        return None
+
+
+def get_autocomplete_results(queryset, search, search_fields, label_fields=None,
+                             page_size=AUTOCOMPLETE_PAGE_SIZE, cursor=None):
+    """
+    One page of options from queryset.
+
+    Returns:
+        dict: {results: [{id, text}], has_more, next_cursor}
+    """
+    rank = Value(0, output_field=IntegerField())
+    if search and search_fields:
+        contains = Q()
+        prefix = Q()
+        for field in search_fields:
+            contains |= Q(**{f'{field}__icontains': search})
+            prefix |= Q(**{f'{field}__istartswith': search})
+        queryset = queryset.filter(contains)
+        rank = Case(When(prefix, then=Value(0)), default=Value(1), output_field=IntegerField())
+
+    queryset = queryset.annotate(_djnext_rank=rank).order_by('_djnext_rank', 'pk')
+
+    position = decode_cursor(cursor, queryset.model) if cursor else None
+    if position is not None:
+        last_rank, last_pk = position
+        queryset = queryset.filter(
+            Q(_djnext_rank__gt=last_rank) | Q(_djnext_rank=last_rank, pk__gt=last_pk)
+        )
+
+    # Fetch one extra row to know whether another page exists
+    if label_fields:
+        rows = [
+            (row[0], row[1], build_label(row[0], row[2:]))
+            for row in queryset.values_list('pk', '_djnext_rank', *label_fields)[:page_size + 1]
+        ]
+    else:
+        rows = [(obj.pk, obj._djnext_rank, str(obj)) for obj in queryset[:page_size + 1]]
+
+    has_more = len(rows) > page_size
+    rows = rows[:page_size]
+    return {
+        'results': [{'id': pk, 'text': text} for pk, _, text in rows],
+        'has_more': has_more,
+        'next_cursor': encode_cursor(rows[-1][1], rows[-1][0]) if has_more else None,
+    }
+
+
+def is_index_enabled(model, model_admin=None) -> bool:
+    """
+    True when the model opted into the lookup index and its options do not
+    depend on the request (no custom get_queryset, no row scope).
+    """
+    if is_request_scoped(model_admin):
+        return False
+    if getattr(model_admin, 'djnext_autocomplete_index', False):
+        return True
+    labels = {label.lower() for label in djnext_settings.AUTOCOMPLETE_INDEX_MODELS or []}
+    return model._meta.label_lower in labels
+
+
+def get_model_lookup_index(model, model_admin=None):
+    """The model's lookup index, or None when not enabled or over AUTOCOMPLETE_INDEX_MAX_ROWS."""
+    if not is_index_enabled(model, model_admin):
+        return None
+
+    def build():
+        max_rows = djnext_settings.AUTOCOMPLETE_INDEX_MAX_ROWS
+        search_fields = get_autocomplete_search_fields(model, getattr(model_admin, 'search_fields', None))
+        label_fields = get_label_fields(model_admin) or []
+        qs = model._default_manager.order_by()
+
+        rows = list(qs.values_list('pk', *label_fields, *search_fields)[:max_rows + 1])
+        if len(rows) > max_rows:
+            return None
+
+        labels = {}
+        texts = {}
+        for row in rows:
+            pk = row[0]
+            if pk not in labels:
+                labels[pk] = build_label(pk, row[1:1 + len(label_fields)])
+            texts.setdefault(pk, []).extend(row[1 + len(label_fields):])
+        if not label_fields:
+            labels = {obj.pk: str(obj) for obj in qs.select_related()[:max_rows + 1]}
+
+        return lookup_index.LookupIndex(
+            (pk, pk, labels.get(pk, f'#{pk}'), pk_texts) for pk, pk_texts in texts.items()
+        )
+
+    return lookup_index.get_index(model, build)
+
+
+def get_index_results(index, model, search, page_size=AUTOCOMPLETE_PAGE_SIZE, cursor=None):
+    """get_autocomplete_results() answered from a lookup index."""
+    after = decode_cursor(cursor, model) if cursor else None
+    rows, has_more = index.search(search, page_size, after)
+    return {
+        'results': [{'id': key, 'text': label} for _, _, key, label in rows],
+        'has_more': has_more,
+        'next_cursor': encode_cursor(rows[-1][0], rows[-1][1]) if has_more else None,
+    }
+
+
+def get_choice_field(model, name):
+    """Concrete model field with choices, or None."""
+    try:
+        field = model._meta.get_field(name)
+    except FieldDoesNotExist:
+        return None
+    if not getattr(field, 'concrete', False) or not field.choices:
+        return None
+    return field
+
+
+def get_choice_results(field, search, page_size=AUTOCOMPLETE_PAGE_SIZE, cursor=None):
+    """
+    One page of a field's choices, prefix matches first, then declaration order.
+
+    Returns:
+        dict: {results: [{value, label}], has_more, next_cursor}
+    """
+    after = decode_cursor(cursor) if cursor else None
+    rows, has_more = lookup_index.get_choice_index(field).search(search, page_size, after)
+    return {
+        'results': [{'value': value, 'label': label} for _, _, value, label in rows],
+        'has_more': has_more,
+        'next_cursor': encode_cursor(rows[-1][0], rows[-1][1]) if has_more else None,
+    }
+
+
+def get_choice_labels(field, values):
+    """
+    [{value, label}] for the given raw values (query string) that are choices
+    of field, in the order given (at most CHOICE_LABELS_MAX_VALUES).
+    """
+    labels = {str(value): str(label) for value, label in field.flatchoices}
+    results = []
+    seen = set()
+    for raw in values[:CHOICE_LABELS_MAX_VALUES]:
+        try:
+            value = field.to_python(raw)
+        except ValidationError:
+            continue
+        label = labels.get(str(value))
+        if label is not None and str(value) not in seen:
+            seen.add(str(value))
+            results.append({'value': value, 'label': label})
+    return {'results': results, 'has_more': False, 'next_cursor': None}
+
+
+def get_labels(request, model, pks):
+    """
+    {str(pk): label} for the pks that exist: from the lookup index when
+    enabled, else one pk__in query (row scope applied for registered models).
+    """
+    model_admin = None
+    entry = get_model_admin(model._meta.app_label, model._meta.model_name)
+    if entry is not None:
+        model_admin = entry[1]
+
+    index = get_model_lookup_index(model, model_admin)
+    if index is not None:
+        labels = {}
+        for pk in pks:
+            found = index.get(pk)
+            if found is not None:
+                labels[str(pk)] = found[1]
+        return labels
+
+    qs = model._default_manager.filter(pk__in=pks)
+    if model_admin is not None:
+        qs = apply_row_scope(qs, request, model_admin)
+
+    label_fields = get_label_fields(model_admin)
+    if label_fields:
+        return {
+            str(row[0]): build_label(row[0], row[1:])
+            for row in qs.values_list('pk', *label_fields)
+        }
+
+    # Related objects used by __str__ come in the same query
+    select_related = getattr(model_admin, 'list_select_related', None)
+    if isinstance(select_related, (list, tuple)):
+        qs = qs.select_related(*select_related)
+    else:
+        qs = qs.select_related()
+    return {str(obj.pk): str(obj) for obj in qs}
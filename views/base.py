@@ -2,14 +2,34 @@
 Base ViewSet class for DJNext Admin.
 """
 
+import hashlib
+
+from django.db import router, transaction
+from django.db.models import ProtectedError, RestrictedError
+from django.utils import translation
 from rest_framework import viewsets, status
 from rest_framework.response import Response
 from rest_framework.pagination import PageNumberPagination
 
 from ..audit import log_audit
+from ..exceptions import DeleteProtected
+from ..core.model_version import get_model_version
+from ..core.row_scope import apply_row_scope, is_request_scoped
 from ..models import AuditLog
 from ..permissions import DJNextModelPermission
 from ..settings import djnext_settings
+from .deletion import (
+    TRUE_VALUES,
+    build_delete_plan,
+    delete_plan_chunked,
+    get_delete_preview,
+    get_plan_protected_objects,
+    get_protected_objects,
+)
+
+
+# Query params that do not change which rows a request sees
+FILTER_SIGNATURE_IGNORED_PARAMS = ('page', 'page_size', 'ordering', 'format')
 
 
 def _audit_serialize(value):
@@ -59,6 +79,8 @@ class DJNextBaseViewSet(viewsets.ModelViewSet):
     # These are set by factory
     model = None
     model_admin = None
+    # {perm_type: check(request, obj)}; None = resolve admin methods per request
+    object_permission_checks = None
 
     def get_queryset(self):
         """Get queryset with admin's customizations."""
@@ -71,7 +93,31 @@ class DJNextBaseViewSet(viewsets.ModelViewSet):
             except TypeError:
                 pass
 
-        return qs
+        # Row scope (djnext_row_scope) is applied in SQL
+        return apply_row_scope(qs, self.request, self.model_admin)
+
+    def get_filter_signature(self, request, *extra):
+        """
+        Hash identifying the rows a filtered request sees, for caching
+        aggregates (facets, date hierarchy): model, its data version, filter
+        and search params, language, extra values, and the user when the
+        admin scopes rows per request.
+        """
+        params = sorted(
+            (key, tuple(sorted(values)))
+            for key, values in request.query_params.lists()
+            if key not in FILTER_SIGNATURE_IGNORED_PARAMS
+        )
+        parts = [
+            self.model._meta.label_lower,
+            get_model_version(self.model),
+            translation.get_language() or '',
+            repr(params),
+            repr(extra),
+        ]
+        if is_request_scoped(self.model_admin):
+            parts.append(f'user:{request.user.pk}')
+        return hashlib.sha1('|'.join(parts).encode()).hexdigest()
 
     def get_serializer_context(self):
         """Add extra context for serializers."""
@@ -203,18 +249,51 @@ class DJNextBaseViewSet(viewsets.ModelViewSet):
         return response
 
     def destroy(self, request, *args, **kwargs):
-        """Override delete with message. AuditLog is view-only."""
+        """
+        Override delete with message. AuditLog is view-only.
+
+        ?chunked=1 deletes cascaded rows bottom-up in chunks of
+        DELETE_CHUNK_SIZE (see views.deletion); ?background=1 does so in a
+        background job and answers 202 with the job id.
+        """
         if self.model == AuditLog:
             return Response({'detail': 'Cannot delete audit log entries.'}, status=status.HTTP_403_FORBIDDEN)
         instance = self.get_object()
 
+        background = request.query_params.get('background', '').lower() in TRUE_VALUES
+        if background or request.query_params.get('chunked', '').lower() in TRUE_VALUES:
+            return self.destroy_chunked(request, instance, background)
+
         try:
             self.perform_destroy(instance)
-        except Exception as e:
-            from ..exceptions import DeleteProtected
-            raise DeleteProtected()
+        except (ProtectedError, RestrictedError) as e:
+            raise DeleteProtected(get_protected_objects(e))
 
         return Response(
             {'_message': f'{self.model._meta.verbose_name} deleted successfully.'},
             status=status.HTTP_200_OK
         )
+
+    def destroy_chunked(self, request, instance, background=False):
+        """Delete instance after its cascades, chunk by chunk (optionally as a job)."""
+        plan = build_delete_plan(self.model, self.model._base_manager.filter(pk=instance.pk))
+        preview = get_delete_preview(plan)
+        if preview['protected']:
+            raise DeleteProtected(get_plan_protected_objects(plan))
+        message = f'{self.model._meta.verbose_name} deleted successfully.'
+
+        def run(progress=None):
+            delete_plan_chunked(plan, total=preview['total'], on_progress=progress)
+            with transaction.atomic(using=router.db_for_write(self.model)):
+                self.perform_destroy(instance)
+            return {'_message': message, 'deleted_count': preview['total'] + 1}
+
+        if background:
+            from .factory import ViewSetFactory
+            return ViewSetFactory._submit_background(
+                self, request, 'delete', 'delete', run, object_id=instance.pk, total=preview['total']
+            )
+        try:
+            return Response(run(), status=status.HTTP_200_OK)
+        except (ProtectedError, RestrictedError) as e:
+            raise DeleteProtected(get_protected_objects(e))
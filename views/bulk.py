@@ -0,0 +1,428 @@
+"""
+Set-based bulk writes for list views.
+
+bulk-update fetches rows with one in_bulk query restricted by the viewset
+queryset (admin get_queryset and row scope); bulk-create resolves FK ids with
+one IN query per related model. Rows are validated with the write serializer,
+written with one QuerySet.bulk_update / bulk_create inside a transaction and
+audited with one INSERT. Models whose saves have side effects (an overridden
+Model.save or admin save_model, djnext_after_save, pre_save/post_save
+receivers outside DJNext)
+are saved row by row in the same transaction instead.
+
+bulk-delete runs one Collector over the whole selection, or a single raw
+DELETE when nothing cascades and no receivers outside DJNext listen; only
+admins that customize deleting (delete_queryset, delete_model) get their
+hooks called instead.
+"""
+
+import inspect
+
+from django.contrib.admin.options import ModelAdmin
+from django.contrib.auth import get_user_model
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db import connections, models, router, transaction
+from django.db.models import deletion
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete, pre_save
+from rest_framework import serializers
+from rest_framework.exceptions import PermissionDenied
+
+from .. import authentication
+from ..admin import DJNextAdminMixin
+from ..audit import log_audit_bulk
+from ..core.model_version import bump_model_version
+from ..serializers.factory import SerializerFactory
+from ..serializers.fields import PrefetchedPrimaryKeyRelatedField
+from ..settings import djnext_settings
+from .autocomplete import build_label, get_label_fields
+from .base import _audit_serialize
+
+
+BULK_CREATE_MAX_ROWS = 1000
+
+
+# Receivers defined in this package only invalidate DJNext caches;
+# after_bulk_write() replays them for writes that bypass signals
+PACKAGE = __name__.split('.')[0]
+
+
+def _receivers(signal, model):
+    receivers = signal._live_receivers(model)
+    # Django >= 5.0 returns (sync receivers, async receivers)
+    if isinstance(receivers, tuple):
+        receivers = [*receivers[0], *receivers[1]]
+    return receivers
+
+
+def _has_foreign_receivers(model, signals) -> bool:
+    """True when receivers outside DJNext listen to any of signals for model."""
+    for signal in signals:
+        for receiver in _receivers(signal, model):
+            if not getattr(receiver, '__module__', '').startswith(PACKAGE):
+                return True
+    return False
+
+
+def _admin_saves(model_admin) -> bool:
+    """
+    True when the admin's save_model must run: it overrides save_model()
+    (or defines djnext_after_save) and accepts (request, obj, form, change).
+    """
+    if model_admin is None:
+        return False
+    save_model = type(model_admin).save_model
+    if save_model is DJNextAdminMixin.save_model:
+        if not hasattr(model_admin, 'djnext_after_save'):
+            return False
+    elif save_model is ModelAdmin.save_model:
+        return False
+    try:
+        inspect.signature(model_admin.save_model).bind(None, None, None, change=False)
+    except (TypeError, ValueError):
+        return False
+    return True
+
+
+def has_save_side_effects(model, model_admin=None) -> bool:
+    """
+    True when saving a row does more than an UPDATE/INSERT: the model
+    overrides save(), the admin overrides save_model() (or defines
+    djnext_after_save), or pre_save/post_save receivers outside DJNext are
+    connected.
+    """
+    if model.save is not models.Model.save:
+        return True
+    if _admin_saves(model_admin):
+        return True
+    return _has_foreign_receivers(model, (pre_save, post_save))
+
+
+def has_delete_side_effects(model, model_admin=None) -> bool:
+    """
+    True when rows must be deleted one by one: the model overrides delete(),
+    or the admin overrides delete_model() (or defines djnext_before_delete).
+    """
+    if model.delete is not models.Model.delete:
+        return True
+    if model_admin is None:
+        return False
+    delete_model = type(model_admin).delete_model
+    if delete_model is DJNextAdminMixin.delete_model:
+        return hasattr(model_admin, 'djnext_before_delete')
+    return delete_model is not ModelAdmin.delete_model
+
+
+def after_bulk_write(model, objs):
+    """Invalidate what DJNext's own save/delete receivers would have."""
+    bump_model_version(model)
+    if model is get_user_model():
+        for obj in objs:
+            authentication.invalidate_user(obj)
+
+
+def save_object(request, model_admin, obj, update_fields=None):
+    """Save one row through the admin's save_model when overridden, else Model.save."""
+    if _admin_saves(model_admin):
+        model_admin.save_model(request, obj, None, change=update_fields is not None)
+        return
+    obj.save(update_fields=update_fields)
+
+
+def _error_message(errors):
+    """First message of DRF serializer errors, prefixed with its field."""
+    for name, messages in errors.items():
+        message = messages[0] if isinstance(messages, list) and messages else messages
+        return f'{name}: {message}' if name != 'non_field_errors' else str(message)
+    return 'Invalid data.'
+
+
+def bulk_update(view, request, updates, fields):
+    """
+    Apply list_editable changes to many rows, all or nothing.
+
+    Args:
+        view: The model's viewset (queryset, permissions, serializer context)
+        updates: [{id, field: value, ...}]; only names in fields are applied
+        fields: Editable field names
+
+    Returns:
+        tuple: (updated_count, errors); nothing is written when errors is not empty
+    """
+    model = view.model
+    model_admin = view.model_admin
+    errors = []
+
+    rows = {}
+    for index, update in enumerate(updates):
+        if not isinstance(update, dict):
+            errors.append({'index': index, 'error': 'Expected an object.'})
+            continue
+        raw_id = update.get('id') or update.get('pk')
+        if raw_id in (None, ''):
+            errors.append({'index': index, 'error': 'Missing id in update'})
+            continue
+        try:
+            pk = model._meta.pk.to_python(raw_id)
+        except DjangoValidationError:
+            errors.append({'id': raw_id, 'error': 'Invalid id'})
+            continue
+        rows.setdefault(pk, {}).update({name: update[name] for name in fields if name in update})
+
+    objects = view.get_queryset().in_bulk(list(rows)) if rows else {}
+    serializer_class = SerializerFactory.get_serializer(model, model_admin, 'partial_update')
+    context = view.get_serializer_context()
+
+    changed = []
+    for pk, data in rows.items():
+        obj = objects.get(pk)
+        if obj is None:
+            errors.append({'id': pk, 'error': 'Object not found'})
+            continue
+        try:
+            view.check_object_permissions(request, obj)
+        except PermissionDenied:
+            errors.append({'id': pk, 'error': 'Permission denied'})
+            continue
+
+        serializer = serializer_class(obj, data=data, partial=True, context=context)
+        if not serializer.is_valid():
+            errors.append({
+                'id': pk,
+                'error': _error_message(serializer.errors),
+                'fields': serializer.errors,
+            })
+            continue
+
+        changes = {}
+        for name, value in serializer.validated_data.items():
+            old_value = _audit_serialize(getattr(obj, name, None))
+            new_value = _audit_serialize(value)
+            if old_value != new_value:
+                changes[name] = {'old': old_value, 'new': new_value}
+                setattr(obj, name, value)
+        if changes:
+            changed.append((obj, changes))
+
+    if errors or not changed:
+        return 0, errors
+
+    objs = [obj for obj, _ in changed]
+    using = router.db_for_write(model)
+    with transaction.atomic(using=using):
+        if has_save_side_effects(model, model_admin):
+            for obj, changes in changed:
+                save_object(request, model_admin, obj, list(changes))
+        else:
+            update_fields = sorted({name for _, changes in changed for name in changes})
+            model._base_manager.using(using).bulk_update(objs, update_fields)
+            transaction.on_commit(lambda: after_bulk_write(model, objs), using=using)
+        log_audit_bulk('update', request, changed)
+    return len(changed), []
+
+
+def prefetch_related_fields(serializer, rows):
+    """
+    Resolve the FK ids of every row with one IN query per related model:
+    the list serializer's PrimaryKeyRelatedFields are swapped for
+    PrefetchedPrimaryKeyRelatedFields holding the fetched objects.
+    """
+    child = serializer.child
+    for name, field in list(child.fields.items()):
+        if type(field) is not serializers.PrimaryKeyRelatedField or field.read_only:
+            continue
+        queryset = field.get_queryset()
+        pks = set()
+        for row in rows:
+            value = row.get(name) if isinstance(row, dict) else None
+            if value in (None, '') or isinstance(value, bool):
+                continue
+            try:
+                pks.add(queryset.model._meta.pk.to_python(value))
+            except (DjangoValidationError, TypeError, ValueError):
+                continue
+        objects = queryset.in_bulk(list(pks)) if pks else {}
+        child.fields[name] = PrefetchedPrimaryKeyRelatedField(objects=objects, **field._kwargs)
+
+
+def _set_many_to_many(model, created, using):
+    """
+    Set M2M values of created rows: one through-table INSERT per field when
+    the through model is auto-created and nothing listens to m2m_changed.
+    """
+    by_field = {}
+    for obj, m2m in created:
+        for name, values in m2m.items():
+            by_field.setdefault(name, []).append((obj, values))
+
+    for name, rows in by_field.items():
+        field = model._meta.get_field(name)
+        through = field.remote_field.through
+        if not through._meta.auto_created or m2m_changed.has_listeners(through):
+            for obj, values in rows:
+                getattr(obj, name).set(values)
+            continue
+        source, target = field.m2m_field_name(), field.m2m_reverse_field_name()
+        through._base_manager.using(using).bulk_create(
+            [through(**{source: obj, target: value}) for obj, values in rows for value in values],
+            ignore_conflicts=True,
+        )
+
+
+def bulk_create(view, request, rows):
+    """
+    Create many rows, all or nothing.
+
+    Args:
+        view: The model's viewset (serializer context)
+        rows: [{field: value, ...}] as for the create endpoint
+
+    Returns:
+        tuple: (created objects, errors); nothing is written when errors is not empty
+    """
+    model = view.model
+    model_admin = view.model_admin
+    if len(rows) > BULK_CREATE_MAX_ROWS:
+        return [], [{'error': f'At most {BULK_CREATE_MAX_ROWS} rows per request.'}]
+
+    serializer_class = SerializerFactory.get_serializer(model, model_admin, 'create')
+    serializer = serializer_class(data=rows, many=True, context=view.get_serializer_context())
+    prefetch_related_fields(serializer, rows)
+    if not serializer.is_valid():
+        errors = serializer.errors
+        # Per-row errors: a list, or {index: errors} with LIST_SERIALIZER_ERRORS_AS_DICT
+        if isinstance(errors, list):
+            errors = dict(enumerate(errors))
+        elif not all(isinstance(key, int) for key in errors):
+            return [], [{'error': _error_message(errors)}]
+        return [], [
+            {'index': index, 'error': _error_message(row_errors), 'fields': row_errors}
+            for index, row_errors in sorted(errors.items())
+            if row_errors
+        ]
+
+    created = []
+    for data in serializer.validated_data:
+        attrs, m2m = {}, {}
+        for name, value in data.items():
+            if model._meta.get_field(name).many_to_many:
+                m2m[name] = value
+            else:
+                attrs[name] = value
+        created.append((model(**attrs), m2m))
+    objs = [obj for obj, _ in created]
+
+    using = router.db_for_write(model)
+    with transaction.atomic(using=using):
+        if has_save_side_effects(model, model_admin) or not connections[using].features.can_return_rows_from_bulk_insert:
+            for obj, m2m in created:
+                save_object(request, model_admin, obj)
+                for name, values in m2m.items():
+                    getattr(obj, name).set(values)
+        else:
+            model._base_manager.using(using).bulk_create(
+                objs, batch_size=djnext_settings.BULK_CREATE_BATCH_SIZE
+            )
+            _set_many_to_many(model, created, using)
+            transaction.on_commit(lambda: after_bulk_write(model, objs), using=using)
+        log_audit_bulk('create', request, [(obj, None) for obj in objs])
+    return objs, []
+
+
+def can_raw_delete(model) -> bool:
+    """
+    True when deleting rows is a single DELETE: no relation cascades or sets
+    null, no generic relations or parent tables, and only DJNext listens to
+    the delete signals (after_bulk_write replays its receivers).
+    """
+    opts = model._meta
+    if opts.parents or any(hasattr(field, 'bulk_related_objects') for field in opts.private_fields):
+        return False
+    for rel in deletion.get_candidate_relations_to_delete(opts):
+        if rel.field.remote_field.on_delete is not deletion.DO_NOTHING:
+            return False
+    return not _has_foreign_receivers(model, (pre_delete, post_delete))
+
+
+def get_delete_entries(model, model_admin, queryset):
+    """
+    Audit entries (instance, None, repr) for the rows of queryset: labels
+    from djnext_label_fields when set (only those columns are read), else
+    str() of each row, streamed.
+    """
+    label_fields = get_label_fields(model_admin)
+    if label_fields:
+        return [
+            (model(pk=row[0]), None, build_label(row[0], row[1:]))
+            for row in queryset.order_by().values_list('pk', *label_fields).iterator()
+        ]
+    return [(obj, None, str(obj)) for obj in queryset.order_by().iterator()]
+
+
+def _needs_object_checks(view, request) -> bool:
+    """True when the admin's has_delete_permission(request, obj) must run per row."""
+    if djnext_settings.SUPERUSER_FULL_ACCESS and request.user.is_superuser:
+        return False
+    checks = view.object_permission_checks
+    if checks is not None:
+        return 'delete' in checks
+    return view.model_admin is not None
+
+
+def bulk_delete(view, request, queryset):
+    """
+    Delete the selected rows, all or nothing.
+
+    Rows outside the viewset queryset (admin get_queryset, row scope) are
+    never selected; has_delete_permission(request, obj) runs per row only
+    when the admin overrides it.
+
+    Args:
+        view: The model's viewset (permissions)
+        queryset: Selected rows, from the viewset queryset
+
+    Returns:
+        tuple: (deleted_count, errors); nothing is deleted when errors is not empty
+
+    Raises:
+        ProtectedError, RestrictedError: Protected related rows block the delete
+    """
+    model = view.model
+    model_admin = view.model_admin
+
+    if _needs_object_checks(view, request):
+        errors = []
+        for obj in queryset.order_by().iterator():
+            try:
+                view.check_object_permissions(request, obj)
+            except PermissionDenied:
+                errors.append({'id': obj.pk, 'error': 'Permission denied'})
+        if errors:
+            return 0, errors
+
+    using = router.db_for_write(model)
+    # A plain pk subquery: the viewset queryset may carry annotations or
+    # ordering QuerySet.delete() refuses
+    selection = model._base_manager.using(using).filter(pk__in=queryset.values('pk'))
+
+    with transaction.atomic(using=using):
+        entries = get_delete_entries(model, model_admin, selection)
+        if not entries:
+            return 0, []
+        if model_admin is not None and type(model_admin).delete_queryset is not ModelAdmin.delete_queryset:
+            model_admin.delete_queryset(request, selection)
+        elif has_delete_side_effects(model, model_admin):
+            for obj in selection.iterator():
+                if model_admin is not None:
+                    model_admin.delete_model(request, obj)
+                else:
+                    obj.delete()
+        elif can_raw_delete(model):
+            selection._raw_delete(using)
+            objs = [instance for instance, *_ in entries]
+            transaction.on_commit(lambda: after_bulk_write(model, objs), using=using)
+        else:
+            collector = deletion.Collector(using=using, origin=selection)
+            collector.collect(selection)
+            collector.delete()
+        log_audit_bulk('delete', request, entries)
+    return len(entries), []
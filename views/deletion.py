@@ -0,0 +1,275 @@
+"""
+Delete preview and chunked cascade delete.
+
+A delete plan follows the relations Django's Collector would: reverse FKs and
+one-to-ones (auto-created M2M through tables included) and generic relations.
+Each relation's rows are a queryset built from a subquery on its parent's rows,
+so a preview is one COUNT per relation and nothing is loaded.
+
+Chunked execution deletes the plan bottom-up: the rows of each cascaded
+relation in pk-ordered chunks of DELETE_CHUNK_SIZE, each chunk in its own
+transaction through a Collector (delete signals, SET_NULL and generic
+relations still apply), then the object itself. A chunked delete is not atomic
+as a whole: chunks deleted before a failure stay deleted.
+"""
+
+from django.db import router, transaction
+from django.db.models import deletion
+from django.db.models.functions import Cast
+
+from ..settings import djnext_settings
+
+
+# Relations followed below this depth are left to the Collector of their parent
+MAX_DEPTH = 10
+
+# Protected rows named in a DeleteProtected error, per relation
+PROTECTED_SAMPLE_SIZE = 5
+
+TRUE_VALUES = ('1', 'true', 'yes')
+
+
+def _on_delete_action(on_delete) -> str:
+    """'delete', 'set_null', 'protect', 'restrict', 'nothing' or 'other' (custom handler)."""
+    if on_delete is deletion.CASCADE:
+        return 'delete'
+    if on_delete is deletion.PROTECT:
+        return 'protect'
+    if on_delete is deletion.RESTRICT:
+        return 'restrict'
+    if on_delete is deletion.DO_NOTHING:
+        return 'nothing'
+    if on_delete in (deletion.SET_NULL, deletion.SET_DEFAULT) or hasattr(on_delete, 'deconstruct'):
+        # SET(value) handlers carry deconstruct()
+        return 'set_null'
+    return 'other'
+
+
+def _generic_relation_queryset(field, model, queryset):
+    """Rows of a GenericRelation pointing at queryset (object ids cast to the pk type)."""
+    related_model = field.related_model
+    object_id_field = related_model._meta.get_field(field.object_id_field_name)
+    object_ids = queryset.annotate(
+        djnext_object_id=Cast('pk', output_field=object_id_field.clone())
+    ).values('djnext_object_id')
+    return related_model._base_manager.filter(**{
+        field.content_type_field_name: field.get_content_type(),
+        f'{field.object_id_field_name}__in': object_ids,
+    })
+
+
+def _relations(model, queryset):
+    """(related model, field name, action, queryset) for every relation a delete of queryset touches."""
+    for rel in deletion.get_candidate_relations_to_delete(model._meta):
+        field = rel.field
+        action = _on_delete_action(field.remote_field.on_delete)
+        if action == 'nothing':
+            continue
+        related_queryset = rel.related_model._base_manager.filter(**{
+            f'{field.name}__in': queryset.values(field.target_field.attname),
+        })
+        yield rel.related_model, field.name, action, related_queryset
+
+    for field in model._meta.private_fields:
+        if hasattr(field, 'bulk_related_objects'):
+            yield field.related_model, field.object_id_field_name, 'delete', \
+                _generic_relation_queryset(field, model, queryset)
+
+
+def build_delete_plan(model, queryset):
+    """
+    Relations affected by deleting queryset, as a tree.
+
+    Returns:
+        list of nodes {model, field, action, queryset, path, depth, recursive, children};
+        only 'delete' nodes have children
+    """
+    def walk(model, queryset, path, depth, seen):
+        nodes = []
+        for related_model, field_name, action, related_queryset in _relations(model, queryset):
+            node_path = f'{path}.{related_model._meta.model_name}'
+            # A model already on the path (self-referencing tree, cycle) is not
+            # expanded again: the Collector of each chunk follows it
+            recursive = related_model in seen or depth >= MAX_DEPTH
+            node = {
+                'model': related_model,
+                'field': field_name,
+                'action': action,
+                'queryset': related_queryset,
+                'path': node_path,
+                'depth': depth,
+                'recursive': recursive,
+                'children': [],
+            }
+            if action == 'delete' and not recursive:
+                node['children'] = walk(
+                    related_model, related_queryset, node_path, depth + 1, seen | {related_model}
+                )
+            nodes.append(node)
+        return nodes
+
+    return walk(model, queryset, model._meta.model_name, 1, {model})
+
+
+def iter_plan(plan, bottom_up=False):
+    """Nodes of a plan, parents first (or children first with bottom_up)."""
+    for node in plan:
+        if not bottom_up:
+            yield node
+        yield from iter_plan(node['children'], bottom_up)
+        if bottom_up:
+            yield node
+
+
+def _blocking_queryset(node, plan):
+    """
+    Rows that block the delete: every PROTECT row; RESTRICT rows only when
+    they are not deleted through another cascade (as Django decides).
+    """
+    queryset = node['queryset']
+    if node['action'] == 'restrict':
+        for other in iter_plan(plan):
+            if other['action'] == 'delete' and other['model'] is node['model']:
+                queryset = queryset.exclude(pk__in=other['queryset'].values('pk'))
+    return queryset
+
+
+def get_delete_preview(plan):
+    """
+    Per-relation counts of a plan (one COUNT per relation).
+
+    Returns:
+        dict: {total, relations: [...], protected: [...], chunked}; total counts
+        the rows deleted through cascades, relations with no rows are omitted
+    """
+    relations = []
+    protected = []
+    total = 0
+    for node in iter_plan(plan):
+        if node['action'] in ('protect', 'restrict'):
+            count = _blocking_queryset(node, plan).count()
+        else:
+            count = node['queryset'].count()
+        if not count:
+            continue
+        meta = node['model']._meta
+        entry = {
+            'model': meta.label_lower,
+            'verbose_name': str(meta.verbose_name_plural if count != 1 else meta.verbose_name),
+            'field': node['field'],
+            'path': node['path'],
+            'action': node['action'],
+            'count': count,
+            'recursive': node['recursive'],
+        }
+        relations.append(entry)
+        if node['action'] in ('protect', 'restrict'):
+            protected.append(entry)
+        elif node['action'] == 'delete':
+            total += count
+    return {
+        'total': total,
+        'relations': relations,
+        'protected': protected,
+        'chunked': total > djnext_settings.DELETE_CHUNK_SIZE,
+    }
+
+
+def get_protected_objects(error):
+    """{model, verbose_name, count, objects} per model of a ProtectedError / RestrictedError."""
+    objs = getattr(error, 'protected_objects', None) or getattr(error, 'restricted_objects', None) or []
+    by_model = {}
+    for obj in objs:
+        by_model.setdefault(type(obj), []).append(obj)
+    return [
+        {
+            'model': model._meta.label_lower,
+            'verbose_name': str(model._meta.verbose_name_plural),
+            'count': len(model_objs),
+            'objects': [str(obj) for obj in model_objs[:PROTECTED_SAMPLE_SIZE]],
+        }
+        for model, model_objs in by_model.items()
+    ]
+
+
+def get_plan_protected_objects(plan):
+    """
+    Rows blocking a plan's delete, in the shape of get_protected_objects():
+    {model, verbose_name, count, objects} per model, with a sample of rows.
+    """
+    by_model = {}
+    for node in iter_plan(plan):
+        if node['action'] not in ('protect', 'restrict'):
+            continue
+        queryset = _blocking_queryset(node, plan)
+        count = queryset.count()
+        if not count:
+            continue
+        model = node['model']
+        entry = by_model.setdefault(model, {
+            'model': model._meta.label_lower,
+            'verbose_name': str(model._meta.verbose_name_plural),
+            'count': 0,
+            'objects': [],
+        })
+        entry['count'] += count
+        sample = PROTECTED_SAMPLE_SIZE - len(entry['objects'])
+        if sample > 0:
+            entry['objects'].extend(str(obj) for obj in queryset[:sample])
+    return list(by_model.values())
+
+
+def delete_queryset_chunked(model, queryset, chunk_size, on_rows=None):
+    """
+    Delete queryset's rows in pk-ordered chunks, one transaction per chunk.
+
+    Args:
+        on_rows: Optional callable(rows) after each chunk
+
+    Returns:
+        int: Rows deleted (cascades of each chunk included)
+    """
+    using = router.db_for_write(model)
+    deleted = 0
+    while True:
+        pks = list(queryset.order_by('pk').values_list('pk', flat=True)[:chunk_size])
+        if not pks:
+            return deleted
+        with transaction.atomic(using=using):
+            collector = deletion.Collector(using=using)
+            collector.collect(model._base_manager.using(using).filter(pk__in=pks))
+            count, _ = collector.delete()
+        if not count:
+            # Nothing removed (e.g. a pre_delete receiver vetoed it): stop, do not spin
+            return deleted
+        deleted += count
+        if on_rows is not None:
+            on_rows(len(pks))
+
+
+def delete_plan_chunked(plan, chunk_size=None, total=0, on_progress=None):
+    """
+    Delete the cascaded rows of a plan bottom-up, in chunks. The root rows
+    are left to the caller.
+
+    Args:
+        total: Expected row count for progress reporting
+        on_progress: Optional callable(done, total) after each chunk
+
+    Returns:
+        int: Rows deleted
+    """
+    chunk_size = chunk_size or djnext_settings.DELETE_CHUNK_SIZE
+    done = 0
+
+    def on_rows(rows):
+        nonlocal done
+        done += rows
+        if on_progress is not None:
+            on_progress(done, max(total, done))
+
+    deleted = 0
+    for node in iter_plan(plan, bottom_up=True):
+        if node['action'] == 'delete':
+            deleted += delete_queryset_chunked(node['model'], node['queryset'], chunk_size, on_rows)
+    return deleted
@@ -0,0 +1,107 @@
+"""
+Lazy per-model routing (LAZY_ROUTING).
+
+Instead of building a ViewSet and its routes for every registered model when
+the URLconf is imported, one dispatcher handles /<app_label>/<model_name>/...
+It looks the model up in the registry index, builds the ViewSet and its
+router patterns on the first request for that model, and caches them.
+URL shapes are the same as with eager routing. Route names are registered for
+list, detail, the extra actions every model ViewSet has (EXTRA_ROUTES) and the
+admin's actions, object tools and custom views, so reverse() works as with
+eager routing.
+"""
+
+import re
+
+from django.http import Http404
+from django.urls import Resolver404, URLResolver
+from django.urls.resolvers import RegexPattern
+from rest_framework.routers import SimpleRouter
+from rest_framework.urlpatterns import format_suffix_patterns
+
+from ..core.factory_cache import FactoryCache
+from ..core.registry import get_model_admin
+from .factory import ViewSetFactory, get_admin_endpoints
+
+
+# (url_name, url_path, detail) of the @action routes of every model ViewSet
+EXTRA_ROUTES = (
+    ('schema', 'schema', False),
+    ('autocomplete', 'autocomplete', False),
+    ('choices', r'choices/(?P<field_name>[^/.]+)', False),
+    ('facets', 'facets', False),
+    ('bulk-update', 'bulk-update', False),
+    ('bulk-create', 'bulk-create', False),
+    ('bulk-delete', 'bulk-delete', False),
+    ('date-hierarchy', 'date-hierarchy', False),
+    ('delete-preview', 'delete-preview', True),
+    ('actions-progress', r'actions/progress/(?P<operation_id>[\w-]+)', False),
+)
+
+
+def get_model_routes(model_admin):
+    """(url_name, url_path, detail) of the @action routes of a model's ViewSet."""
+    return [*EXTRA_ROUTES, *(
+        (attr_name.replace('_', '-'), url_path, detail)
+        for attr_name, url_path, detail, _ in get_admin_endpoints(model_admin)
+    )]
+
+
+def route_template(url_path):
+    """url_path with its named groups as str.format() fields ('choices/{field_name}')."""
+    return re.sub(r'\(\?P<(\w+)>[^)]*\)', r'{\1}', url_path)
+
+
+class LazyModelDispatcher:
+    """
+    View callable that materializes per-model ViewSets on demand.
+    Models are resolved through the registry index (get_model_admin).
+    """
+
+    # CSRF is enforced by DRF's SessionAuthentication inside the resolved view
+    csrf_exempt = True
+
+    def __init__(self):
+        self._resolvers = FactoryCache('routes')
+
+    def __call__(self, request, app_label, model_name, rest='', pk=None, route=None, **route_kwargs):
+        if route is not None:
+            # Named extra-action route: rebuild the path relative to the model
+            rest = route.format(pk=pk, **route_kwargs)
+        elif pk is not None:
+            rest = f'{pk}/'
+        elif rest.startswith('/'):
+            rest = rest[1:]
+
+        resolver = self.get_resolver(app_label, model_name)
+        if resolver is None:
+            raise Http404(f'Model {app_label}.{model_name} is not registered.')
+
+        try:
+            match = resolver.resolve(rest)
+        except Resolver404:
+            raise Http404()
+
+        return match.func(request, *match.args, **match.kwargs)
+
+    def get_resolver(self, app_label, model_name):
+        """URL resolver for one model's ViewSet routes, built on first use."""
+        key = (app_label, model_name)
+        entry = get_model_admin(app_label, model_name)
+        if entry is None:
+            return None
+
+        def build():
+            model, model_admin = entry
+            viewset = ViewSetFactory.create(model, model_admin)
+            # Empty prefix: routes are relative to /<app_label>/<model_name>/
+            router = SimpleRouter()
+            router.register('', viewset, basename=f'{app_label}_{model_name}')
+            patterns = format_suffix_patterns(router.urls)
+            return URLResolver(RegexPattern(r'^'), patterns)
+
+        return self._resolvers.get_or_build(key, build)
+
+    def clear(self):
+        """Forget materialized ViewSet routes."""
+        self._resolvers.clear()
@@ -0,0 +1,176 @@
+"""
+Facet counts for list_filter fields.
+
+For the current filters and search, every list_filter field gets its values
+with row counts from one grouped aggregate query:
+- choices and booleans, labelled from the field
+- relations (FK, M2M), labelled with one pk__in query on the related model
+- dates, bucketed by year
+- anything else, by value
+
+Relations and plain values return the top N by count (has_more tells whether
+there are more); facet_q searches within a facet's values.
+"""
+
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import BooleanField, Count, DateField, Q
+from django.db.models.constants import LOOKUP_SEP
+from django.db.models.functions import ExtractYear
+
+from ..core.registry import get_model_admin
+from .autocomplete import get_autocomplete_search_fields, get_labels
+
+
+FACET_LIMIT = 10
+FACET_MAX_LIMIT = 100
+
+
+def get_facet_fields(model_admin):
+    """Field paths from list_filter; custom filter classes are skipped."""
+    names = []
+    for item in getattr(model_admin, 'list_filter', None) or []:
+        if isinstance(item, (list, tuple)) and item and isinstance(item[0], str):
+            item = item[0]
+        if isinstance(item, str):
+            names.append(item)
+    return names
+
+
+def resolve_field(model, path):
+    """Model field at the end of a lookup path, or None."""
+    field = None
+    for part in path.split(LOOKUP_SEP):
+        if field is not None:
+            if not field.is_relation:
+                return None
+            model = field.related_model
+        try:
+            field = model._meta.get_field(part)
+        except FieldDoesNotExist:
+            return None
+    return field
+
+
+def _grouped(queryset, key, distinct=False, relation=False):
+    """values(key) with row counts, most frequent first."""
+    # Tie-break on the related pk, not the related model's Meta.ordering (no join)
+    tie_break = f'{key}{LOOKUP_SEP}pk' if relation else key
+    return (
+        queryset.order_by()
+        .values(key)
+        .annotate(_djnext_count=Count('pk', distinct=distinct))
+        .order_by('-_djnext_count', tie_break)
+    )
+
+
+def _matches(label, search):
+    return not search or search.casefold() in str(label).casefold()
+
+
+def get_facet(request, queryset, model_admin, name, limit=FACET_LIMIT, search=''):
+    """
+    Counts for one list_filter field.
+
+    Returns:
+        dict: {field, type, values: [{value, label, count}], has_more},
+              or None when the field cannot be resolved
+    """
+    field = resolve_field(queryset.model, name)
+    if field is None:
+        return None
+
+    empty_label = model_admin.get_empty_value_display() if model_admin is not None else '-'
+
+    if field.is_relation and field.related_model is not None:
+        related_model = field.related_model
+        if search:
+            entry = get_model_admin(related_model._meta.app_label, related_model._meta.model_name)
+            search_fields = get_autocomplete_search_fields(
+                related_model, getattr(entry[1], 'search_fields', None) if entry else None
+            )
+            query = Q()
+            for search_field in search_fields:
+                query |= Q(**{f'{name}__{search_field}__icontains': search})
+            queryset = queryset.filter(query)
+        many = field.many_to_many or field.one_to_many
+        rows = list(_grouped(queryset, name, distinct=many, relation=True)[:limit + 1])
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+        labels = get_labels(request, related_model, [r[name] for r in rows if r[name] is not None])
+        values = [
+            {
+                'value': r[name],
+                'label': empty_label if r[name] is None else labels.get(str(r[name]), f'#{r[name]}'),
+                'count': r['_djnext_count'],
+            }
+            for r in rows
+        ]
+        return {'field': name, 'type': 'relation', 'values': values, 'has_more': has_more}
+
+    if field.choices:
+        choice_labels = {value: str(label) for value, label in field.flatchoices}
+        values = [
+            {
+                'value': r[name],
+                'label': empty_label if r[name] is None else choice_labels.get(r[name], str(r[name])),
+                'count': r['_djnext_count'],
+            }
+            for r in _grouped(queryset, name)
+        ]
+        kind = 'choices'
+    elif isinstance(field, BooleanField):
+        bool_labels = {True: 'Yes', False: 'No', None: 'Unknown'}
+        values = [
+            {'value': r[name], 'label': bool_labels[r[name]], 'count': r['_djnext_count']}
+            for r in _grouped(queryset, name)
+        ]
+        kind = 'boolean'
+    elif isinstance(field, DateField):
+        rows = (
+            queryset.order_by()
+            .annotate(_djnext_bucket=ExtractYear(name))
+            .values('_djnext_bucket')
+            .annotate(_djnext_count=Count('pk'))
+            .order_by('-_djnext_bucket')
+        )
+        values = [
+            {
+                'value': r['_djnext_bucket'],
+                'label': empty_label if r['_djnext_bucket'] is None else str(r['_djnext_bucket']),
+                'count': r['_djnext_count'],
+            }
+            for r in rows
+        ]
+        kind = 'date'
+    else:
+        if search:
+            queryset = queryset.filter(**{f'{name}__icontains': search})
+        rows = list(_grouped(queryset, name)[:limit + 1])
+        values = [
+            {
+                'value': r[name],
+                'label': empty_label if r[name] is None else str(r[name]),
+                'count': r['_djnext_count'],
+            }
+            for r in rows
+        ]
+        return {
+            'field': name,
+            'type': 'value',
+            'values': values[:limit],
+            'has_more': len(values) > limit,
+        }
+
+    # Choices, booleans and year buckets are few: search and limit in Python
+    values = [v for v in values if _matches(v['label'], search)]
+    return {'field': name, 'type': kind, 'values': values[:limit], 'has_more': len(values) > limit}
+
+
+def get_facets(request, queryset, model_admin, names, limit=FACET_LIMIT, search=''):
+    """Facets for the given list_filter fields; unresolvable fields are omitted."""
+    facets = []
+    for name in names:
+        facet = get_facet(request, queryset, model_admin, name, limit, search)
+        if facet is not None:
+            facets.append(facet)
+    return facets
@@ -2,16 +2,93 @@
 Factory for creating dynamic ViewSets.
 """
 
+import logging
+
+from django.core.cache import cache
+from django.db.models import ProtectedError, RestrictedError
 from rest_framework import status
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.filters import SearchFilter, OrderingFilter
 
+from . import bulk
+from .actions import ActionFailed, get_action_queryset, run_action
+from .autocomplete import (
+    get_autocomplete_results,
+    get_autocomplete_search_fields,
+    get_choice_field,
+    get_choice_labels,
+    get_choice_results,
+    get_index_results,
+    get_label_fields,
+    get_model_lookup_index,
+    get_page_size,
+)
 from .base import DJNextBaseViewSet
+from .date_hierarchy import (
+    DateHierarchyFilter,
+    filter_date_range,
+    get_date_buckets,
+    get_date_hierarchy_field,
+    parse_date_params,
+)
+from .deletion import build_delete_plan, get_delete_preview, get_protected_objects
+from .facets import FACET_LIMIT, FACET_MAX_LIMIT, get_facet_fields, get_facets
+from ..core.factory_cache import FactoryCache
+from ..core.progress import get_progress
+from ..core.registry import get_registered_models
+from ..exceptions import DeleteProtected
+from ..models import AuditLog
+from ..jobs import JobLimitReached, is_background, job_accepted_response, submit_job
+from ..permissions import compile_object_permission_checks
 from ..serializers.factory import SerializerFactory
-from ..core.introspection import ModelIntrospector
-from ..core.registry import get_model_permissions
 from ..settings import djnext_settings
+from .schema import build_model_schema
+
+
+logger = logging.getLogger('djnext_admin')
+
+# Serializers built for each model by ViewSetFactory.warm_up()
+WARM_UP_SERIALIZER_ACTIONS = ('list', 'retrieve', 'create', 'update', 'partial_update')
+
+
+def _admin_action(func, name, **kwargs):
+    """
+    @action(**kwargs) applied to func under the viewset attribute name: the
+    router maps methods to the function's __name__ when it is decorated.
+    """
+    func.__name__ = name
+    return action(**kwargs)(func)
+
+
+def get_admin_endpoints(model_admin):
+    """
+    (attribute name, url_path, detail, create args) of the endpoints built from
+    the admin's actions, djnext_object_tools and djnext_custom_views.
+    """
+    if model_admin is None:
+        return []
+    endpoints = []
+
+    def items(names):
+        for item in names or []:
+            if callable(item):
+                yield item.__name__, item
+            else:
+                yield item, getattr(model_admin, item, None)
+
+    if djnext_settings.ENABLE_BULK_ACTIONS:
+        for name, func in items(getattr(model_admin, 'actions', [])):
+            if func and name != 'delete_selected':
+                endpoints.append((f'action_{name}', f'actions/{name}', False, ('action', name, func)))
+    for name, func in items(getattr(model_admin, 'djnext_object_tools', [])):
+        if func and callable(func):
+            endpoints.append((f'object_tool_{name}', f'tools/{name}', True, ('object_tool', name, func)))
+    for name, func in items(getattr(model_admin, 'djnext_custom_views', [])):
+        if func and callable(func):
+            detail = getattr(func, 'detail', False)
+            endpoints.append((f'custom_view_{name}', f'views/{name}', detail, ('custom_view', name, func)))
+    return endpoints
 
 
 class ViewSetFactory:
@@ -19,7 +96,7 @@ class ViewSetFactory:
     Creates ViewSet classes dynamically for each model.
     """
 
-    _cache = {}
+    _cache = FactoryCache('viewsets')
 
     @classmethod
     def create(cls, model, model_admin):
@@ -33,12 +110,24 @@ class ViewSetFactory:
         Returns:
             ViewSet class
         """
-        cache_key = model._meta.label
-
-        if cache_key not in cls._cache:
-            cls._cache[cache_key] = cls._create_viewset(model, model_admin)
+        return cls._cache.get_or_build(
+            model._meta.label,
+            lambda: cls._create_viewset(model, model_admin)
+        )
 
-        return cls._cache[cache_key]
+    @classmethod
+    def warm_up(cls):
+        """
+        Build the ViewSet and standard serializers of every registered model,
+        so the first request for a model doesn't pay the construction cost.
+        """
+        for model, model_admin in get_registered_models():
+            try:
+                cls.create(model, model_admin)
+                for action_name in WARM_UP_SERIALIZER_ACTIONS:
+                    SerializerFactory.get_serializer(model, model_admin, action_name)
+            except Exception:
+                logger.exception('DJNext warm-up failed for %s', model._meta.label)
 
     @classmethod
     def _create_viewset(cls, model, model_admin):
@@ -59,12 +148,17 @@ class ViewSetFactory:
             except ImportError:
                 pass
 
+        # date_hierarchy selection as an index-friendly range
+        if model_admin and getattr(model_admin, 'date_hierarchy', None):
+            filter_backends.append(DateHierarchyFilter)
+
         # Create class attributes
         attrs = {
             'model': model,
             'model_admin': model_admin,
             'queryset': model.objects.all(),
             'filter_backends': filter_backends,
+            'object_permission_checks': compile_object_permission_checks(model_admin),
         }
 
         # Add get_serializer_class
@@ -99,26 +193,10 @@ class ViewSetFactory:
         @action(detail=False, methods=['get'])
         def schema(self, request):
             """Return model schema for frontend."""
-            introspector = ModelIntrospector(self.model, self.model_admin)
-            schema_data = introspector.get_schema(request)
-
-            # Add permissions
-            schema_data['permissions'] = get_model_permissions(
-                request.user, self.model
-            )
-
-            # Add endpoints
             api_base = cls._get_api_base(request, self.model)
-            app_label = self.model._meta.app_label
-            model_name = self.model._meta.model_name
-
-            schema_data['endpoints'] = {
-                'list': f'{api_base}{app_label}/{model_name}/',
-                'create': f'{api_base}{app_label}/{model_name}/',
-                'detail': f'{api_base}{app_label}/{model_name}/{{id}}/',
-                'schema': f'{api_base}{app_label}/{model_name}/schema/',
-                'autocomplete': f'{api_base}{app_label}/{model_name}/autocomplete/',
-            }
+            schema_data = build_model_schema(
+                request, self.model, self.model_admin, api_base
+            )
 
             return Response(schema_data)
 
@@ -127,55 +205,94 @@ class ViewSetFactory:
         # Add autocomplete action for relation fields
         @action(detail=False, methods=['get'])
         def autocomplete(self, request):
-            """Return options for select fields. Uses search_fields or fallback text fields."""
-            search = request.query_params.get('q', '').strip()
-            page_size = int(request.query_params.get('page_size', 20))
-
-            qs = self.get_queryset()
-
-            search_fields = getattr(self, 'search_fields', [])
-            if search:
-                from django.db.models import Q
-                if search_fields:
-                    query = Q()
-                    for field in search_fields:
-                        query |= Q(**{f'{field}__icontains': search})
-                    qs = qs.filter(query)
-                else:
-                    # Fallback: try common text field names (e.g. Group.name, Permission.codename)
-                    fallback = []
-                    for f in model._meta.get_fields():
-                        if getattr(f, 'get_internal_type', None) and not getattr(f, 'many_to_many', False) and not getattr(f, 'one_to_many', False):
-                            if f.get_internal_type() in ('CharField', 'TextField', 'SlugField'):
-                                fallback.append(f.name)
-                    if not fallback:
-                        for name in ('name', 'username', 'codename', 'title'):
-                            try:
-                                model._meta.get_field(name)
-                                fallback.append(name)
-                                break
-                            except Exception:
-                                pass
-                    if fallback:
-                        query = Q()
-                        for field_name in fallback[:5]:
-                            query |= Q(**{f'{field_name}__icontains': search})
-                        qs = qs.filter(query)
-
-            qs = qs[:page_size]
-
-            results = [
-                {'id': obj.pk, 'text': str(obj)}
-                for obj in qs
-            ]
-
-            return Response({
-                'results': results,
-                'has_more': len(results) == page_size
-            })
+            """
+            Return options for select fields, prefix matches first.
+            Query params: q, page_size (max 100), cursor (next_cursor of the previous page).
+            """
+            params = request.query_params
+            search = params.get('q', '').strip()
+            page_size = get_page_size(params.get('page_size'))
+
+            index = get_model_lookup_index(self.model, self.model_admin)
+            if index is not None:
+                return Response(get_index_results(
+                    index, self.model, search, page_size, params.get('cursor')
+                ))
+
+            return Response(get_autocomplete_results(
+                self.get_queryset(),
+                search,
+                get_autocomplete_search_fields(self.model, getattr(self, 'search_fields', [])),
+                label_fields=get_label_fields(self.model_admin),
+                page_size=page_size,
+                cursor=params.get('cursor'),
+            ))
 
         attrs['autocomplete'] = autocomplete
 
+        # Add choices action for fields with remote_choices
+        @action(detail=False, methods=['get'], url_path=r'choices/(?P<field_name>[^/.]+)')
+        def choices(self, request, field_name=None):
+            """
+            Search a field's choices, prefix matches first.
+            Query params: q, page_size (max 100), cursor (next_cursor of the previous page);
+            or values (comma-separated) to label given values.
+            """
+            field = get_choice_field(self.model, field_name)
+            if field is None:
+                return Response(
+                    {'error': f'{field_name} is not a field with choices.'},
+                    status=status.HTTP_404_NOT_FOUND
+                )
+
+            params = request.query_params
+            if params.get('values'):
+                return Response(get_choice_labels(field, params['values'].split(',')))
+            return Response(get_choice_results(
+                field,
+                params.get('q', '').strip(),
+                get_page_size(params.get('page_size')),
+                params.get('cursor'),
+            ))
+
+        attrs['choices'] = choices
+
+        # Add facets action for list_filter
+        @action(detail=False, methods=['get'])
+        def facets(self, request):
+            """
+            Value counts for list_filter fields under the current filters and search.
+
+            Query params:
+            - facet_fields: comma-separated subset of list_filter (default: all)
+            - facet_limit: values per facet (default 10, max 100)
+            - facet_q: search within facet values
+            Other params filter the rows exactly as on the list endpoint.
+            """
+            params = request.query_params
+            names = get_facet_fields(self.model_admin)
+            requested = params.get('facet_fields')
+            if requested:
+                requested = set(requested.split(','))
+                names = [name for name in names if name in requested]
+            limit = get_page_size(params.get('facet_limit'), default=FACET_LIMIT, maximum=FACET_MAX_LIMIT)
+            search = params.get('facet_q', '').strip()
+
+            timeout = djnext_settings.FACET_CACHE_TIMEOUT
+            cache_key = f'djnext_admin:facets:{self.get_filter_signature(request)}'
+            if timeout:
+                data = cache.get(cache_key)
+                if data is not None:
+                    return Response(data)
+
+            queryset = self.filter_queryset(self.get_queryset())
+            data = {'facets': get_facets(request, queryset, self.model_admin, names, limit, search)}
+            if timeout:
+                cache.set(cache_key, data, timeout)
+            return Response(data)
+
+        attrs['facets'] = facets
+
         # Add bulk_update action for list_editable
         @action(detail=False, methods=['post'], url_path='bulk-update')
         def bulk_update(self, request):
@@ -184,10 +301,11 @@ class ViewSetFactory:
             Used for list_editable inline editing.
 
             Expects: { "updates": [ {"id": 1, "field1": "value1"}, ... ] }
+            Every row is validated first; nothing is saved if any row fails.
             """
             updates = request.data.get('updates', [])
 
-            if not updates:
+            if not updates or not isinstance(updates, list):
                 return Response(
                     {'error': 'No updates provided.'},
                     status=status.HTTP_400_BAD_REQUEST
@@ -204,177 +322,205 @@ class ViewSetFactory:
                     status=status.HTTP_400_BAD_REQUEST
                 )
 
-            updated_count = 0
-            errors = []
-
-            for update in updates:
-                obj_id = update.get('id') or update.get('pk')
-                if not obj_id:
-                    errors.append({'error': 'Missing id in update'})
-                    continue
-
-                try:
-                    obj = self.get_queryset().get(pk=obj_id)
-                except self.model.DoesNotExist:
-                    errors.append({'id': obj_id, 'error': 'Object not found'})
-                    continue
-
-                # Only allow updating list_editable fields
-                changed = False
-                for field_name in list_editable:
-                    if field_name in update:
-                        setattr(obj, field_name, update[field_name])
-                        changed = True
-
-                if changed:
-                    try:
-                        obj.save(update_fields=list_editable)
-                        updated_count += 1
-                    except Exception as e:
-                        errors.append({'id': obj_id, 'error': str(e)})
+            updated_count, errors = bulk.bulk_update(self, request, updates, list_editable)
+            if errors:
+                return Response(
+                    {
+                        'success': False,
+                        'error': errors[0]['error'] if len(errors) == 1 else f'{len(errors)} rows could not be updated.',
+                        'updated_count': 0,
+                        'errors': errors,
+                    },
+                    status=status.HTTP_400_BAD_REQUEST
+                )
 
             return Response({
                 'success': True,
                 'updated_count': updated_count,
-                'errors': errors if errors else None,
+                'errors': None,
             })
 
         attrs['bulk_update'] = bulk_update
 
+        # Add bulk_create action for pasted/imported rows
+        @action(detail=False, methods=['post'], url_path='bulk-create')
+        def bulk_create(self, request):
+            """
+            Create multiple objects in a single request.
+
+            Expects: { "rows": [ {"field1": "value1", ...}, ... ] }
+            Every row is validated first; nothing is saved if any row fails.
+            """
+            if self.model == AuditLog:
+                return Response(
+                    {'detail': 'Cannot create audit log entries.'},
+                    status=status.HTTP_403_FORBIDDEN
+                )
+            rows = request.data.get('rows', [])
+
+            if not rows or not isinstance(rows, list):
+                return Response(
+                    {'error': 'No rows provided.'},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+
+            objs, errors = bulk.bulk_create(self, request, rows)
+            if errors:
+                return Response(
+                    {
+                        'success': False,
+                        'error': errors[0]['error'] if len(errors) == 1 else f'{len(errors)} rows are invalid.',
+                        'created_count': 0,
+                        'errors': errors,
+                    },
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+
+            return Response(
+                {
+                    'success': True,
+                    'created_count': len(objs),
+                    'ids': [obj.pk for obj in objs],
+                },
+                status=status.HTTP_201_CREATED
+            )
+
+        attrs['bulk_create'] = bulk_create
+
+        # Add bulk_delete action for deleting many rows in one request
+        @action(detail=False, methods=['post'], url_path='bulk-delete')
+        def bulk_delete(self, request):
+            """
+            Delete multiple objects in a single request.
+
+            Expects: { "ids": [...] } or { "select_all_matching": true } with the
+            list's filter/search query params. Nothing is deleted if any row fails.
+            """
+            if self.model == AuditLog:
+                return Response(
+                    {'detail': 'Cannot delete audit log entries.'},
+                    status=status.HTTP_403_FORBIDDEN
+                )
+            queryset = get_action_queryset(self, request)
+            if queryset is None:
+                return Response(
+                    {'error': 'No items selected.'},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+
+            try:
+                deleted_count, errors = bulk.bulk_delete(self, request, queryset)
+            except (ProtectedError, RestrictedError) as e:
+                raise DeleteProtected(get_protected_objects(e))
+            if errors:
+                return Response(
+                    {
+                        'success': False,
+                        'error': errors[0]['error'] if len(errors) == 1 else f'{len(errors)} objects cannot be deleted.',
+                        'deleted_count': 0,
+                        'errors': errors,
+                    },
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+
+            return Response({
+                'success': True,
+                'deleted_count': deleted_count,
+                'message': f'Deleted {deleted_count} {self.model._meta.verbose_name_plural}.',
+            })
+
+        attrs['bulk_delete'] = bulk_delete
+
         # Add date_hierarchy endpoint
         @action(detail=False, methods=['get'], url_path='date-hierarchy')
         def date_hierarchy(self, request):
             """
-            Return available dates for date_hierarchy navigation.
+            Dates with row counts for date_hierarchy navigation.
 
             Query params:
             - year: filter by year (returns months)
             - month: filter by month (returns days, requires year)
+            Other params filter the rows exactly as on the list endpoint.
 
             Returns hierarchy data based on current drill-down level.
             """
-            if not self.model_admin:
-                return Response({'field': None, 'dates': []})
-
-            date_field = getattr(self.model_admin, 'date_hierarchy', None)
+            date_field = get_date_hierarchy_field(self.model_admin)
             if not date_field:
                 return Response({'field': None, 'dates': []})
 
-            from django.db.models.functions import ExtractYear, ExtractMonth, ExtractDay
-
-            year = request.query_params.get('year')
-            month = request.query_params.get('month')
-
-            qs = self.get_queryset()
+            values = parse_date_params(request.query_params)
+            year, month, _ = values or (None, None, None)
 
-            # Apply current filters from request
-            for key, value in request.query_params.items():
-                if key not in ('year', 'month', 'day', 'page', 'page_size', 'search', 'ordering'):
-                    qs = qs.filter(**{key: value})
+            timeout = djnext_settings.DATE_HIERARCHY_CACHE_TIMEOUT
+            cache_key = f'djnext_admin:date_hierarchy:{self.get_filter_signature(request)}'
+            if timeout:
+                data = cache.get(cache_key)
+                if data is not None:
+                    return Response(data)
 
-            if year and month:
-                # Show days in the selected month
-                qs = qs.filter(**{
-                    f'{date_field}__year': int(year),
-                    f'{date_field}__month': int(month),
-                })
-                days = (
-                    qs.annotate(day=ExtractDay(date_field))
-                    .values_list('day', flat=True)
-                    .distinct()
-                    .order_by('day')
-                )
-                return Response({
-                    'field': date_field,
-                    'level': 'day',
-                    'year': int(year),
-                    'month': int(month),
-                    'dates': list(days),
-                })
+            qs = self.filter_queryset(self.get_queryset())
+            if month:
+                level = 'day'
+                qs = filter_date_range(qs, date_field, year, month)
             elif year:
-                # Show months in the selected year
-                qs = qs.filter(**{f'{date_field}__year': int(year)})
-                months = (
-                    qs.annotate(month=ExtractMonth(date_field))
-                    .values_list('month', flat=True)
-                    .distinct()
-                    .order_by('month')
-                )
-                return Response({
-                    'field': date_field,
-                    'level': 'month',
-                    'year': int(year),
-                    'dates': list(months),
-                })
+                level = 'month'
+                qs = filter_date_range(qs, date_field, year)
             else:
-                # Show years
-                years = (
-                    qs.annotate(year=ExtractYear(date_field))
-                    .values_list('year', flat=True)
-                    .distinct()
-                    .order_by('-year')
-                )
-                return Response({
-                    'field': date_field,
-                    'level': 'year',
-                    'dates': list(years),
-                })
+                level = 'year'
+
+            buckets = get_date_buckets(qs, date_field, level)
+            data = {'field': date_field, 'level': level}
+            if year:
+                data['year'] = year
+            if month:
+                data['month'] = month
+            data['dates'] = [bucket['value'] for bucket in buckets]
+            data['buckets'] = buckets
+            if timeout:
+                cache.set(cache_key, data, timeout)
+            return Response(data)
 
         attrs['date_hierarchy'] = date_hierarchy
 
-        # Add bulk actions from admin
-        if model_admin and djnext_settings.ENABLE_BULK_ACTIONS:
-            admin_actions = getattr(model_admin, 'actions', []) or []
-            for action_item in admin_actions:
-                if callable(action_item):
-                    action_func = action_item
-                    action_name = action_func.__name__
-                else:
-                    action_name = action_item
-                    action_func = getattr(model_admin, action_name, None)
-
-                if action_func and action_name != 'delete_selected':
-                    attrs[f'action_{action_name}'] = cls._create_action_endpoint(
-                        action_name,
-                        action_func,
-                        model_admin
-                    )
+        # Add delete preview: rows each relation loses, counted without loading them
+        @action(detail=True, methods=['get'], url_path='delete-preview')
+        def delete_preview(self, request, pk=None):
+            """
+            What deleting the object affects: { object, total, relations: [ { model,
+            verbose_name, field, path, action, count, recursive } ], protected, chunked }.
+            action is 'delete', 'set_null', 'protect', 'restrict' or 'other'; chunked
+            recommends ?chunked=1 (or ?background=1) for the delete.
+            """
+            obj = self.get_object()
+            plan = build_delete_plan(self.model, self.model._base_manager.filter(pk=obj.pk))
+            preview = get_delete_preview(plan)
+            return Response({'object': {'id': obj.pk, 'repr': str(obj)}, **preview})
+
+        attrs['delete_preview'] = delete_preview
+
+        # Add progress endpoint for chunked actions
+        @action(detail=False, methods=['get'], url_path=r'actions/progress/(?P<operation_id>[\w-]+)')
+        def actions_progress(self, request, operation_id=None):
+            """Progress of the user's running action: {status, done, total}."""
+            progress = get_progress(request.user, operation_id)
+            if progress is None:
+                return Response(
+                    {'error': 'Unknown operation.'},
+                    status=status.HTTP_404_NOT_FOUND
+                )
+            return Response(progress)
 
-        # Add object tools (detail-level actions) from admin
-        if model_admin:
-            object_tools = getattr(model_admin, 'djnext_object_tools', []) or []
-            for tool_item in object_tools:
-                if callable(tool_item):
-                    tool_func = tool_item
-                    tool_name = tool_func.__name__
-                else:
-                    tool_name = tool_item
-                    tool_func = getattr(model_admin, tool_name, None)
-
-                if tool_func and callable(tool_func):
-                    attrs[f'object_tool_{tool_name}'] = cls._create_object_tool_endpoint(
-                        tool_name,
-                        tool_func,
-                        model_admin
-                    )
+        attrs['actions_progress'] = actions_progress
 
-        # Add custom views from admin (get_urls equivalent)
-        if model_admin:
-            custom_views = getattr(model_admin, 'djnext_custom_views', []) or []
-            for view_item in custom_views:
-                if callable(view_item):
-                    view_func = view_item
-                    view_name = view_func.__name__
-                else:
-                    view_name = view_item
-                    view_func = getattr(model_admin, view_name, None)
-
-                if view_func and callable(view_func):
-                    attrs[f'custom_view_{view_name}'] = cls._create_custom_view_endpoint(
-                        view_name,
-                        view_func,
-                        model_admin
-                    )
+        # Add bulk actions, object tools (detail-level actions) and custom
+        # views (get_urls equivalent) from admin
+        create_endpoint = {
+            'action': cls._create_action_endpoint,
+            'object_tool': cls._create_object_tool_endpoint,
+            'custom_view': cls._create_custom_view_endpoint,
+        }
+        for attr_name, _, _, (kind, name, func) in get_admin_endpoints(model_admin):
+            attrs[attr_name] = create_endpoint[kind](name, func, model_admin)
 
         # Create ViewSet class
         viewset_class = type(
@@ -399,30 +545,78 @@ class ViewSetFactory:
             return path[:idx]
         return '/'
 
+    @classmethod
+    def _submit_background(cls, view, request, kind, name, func, object_id='', total=0):
+        """Run func(progress) as a background job: 202 with the job id, 429 at the job limit."""
+        # Parse the body now; the job may run after the request stream is gone
+        request.data
+        try:
+            job = submit_job(request, view.model, kind, name, func, object_id=object_id, total=total)
+        except JobLimitReached as e:
+            return Response(
+                {'error': str(e)},
+                status=status.HTTP_429_TOO_MANY_REQUESTS
+            )
+        # With JOB_RUNNER = 'sync' the job may already have run
+        job.refresh_from_db()
+        status_url = f'{cls._get_api_base(request, view.model)}jobs/{job.pk}/'
+        return job_accepted_response(job, status_url)
+
     @classmethod
     def _create_action_endpoint(cls, action_name, action_func, model_admin):
         """Create an action endpoint from admin action."""
 
-        @action(detail=False, methods=['post'], url_path=f'actions/{action_name}')
         def action_endpoint(self, request):
-            """Execute bulk action."""
-            ids = request.data.get('ids', [])
+            """
+            Execute bulk action on { "ids": [...] } or, with
+            { "select_all_matching": true }, on every row matching the
+            filter/search query params. Runs in chunks of ACTION_CHUNK_SIZE;
+            pass "operation_id" to poll actions/progress/<operation_id>/.
+            """
+            queryset = get_action_queryset(self, request)
 
-            if not ids:
+            if queryset is None:
                 return Response(
                     {'error': 'No items selected.'},
                     status=status.HTTP_400_BAD_REQUEST
                 )
 
-            queryset = self.get_queryset().filter(pk__in=ids)
             count = queryset.count()
 
+            if is_background(action_func):
+                base_queryset = self.get_queryset()
+
+                def job(progress):
+                    _, results = run_action(
+                        action_func, model_admin, request, queryset, base_queryset, count,
+                        operation_id=request.data.get('operation_id'), on_progress=progress,
+                    )
+                    # The action's own return value is the job result; one per chunk
+                    # when it ran in several
+                    if len(results) == 1:
+                        return results[0]
+                    data = {'success': True, 'affected_count': count}
+                    if results:
+                        data['results'] = [r.data if isinstance(r, Response) else r for r in results]
+                    return data
+
+                return cls._submit_background(
+                    self, request, 'action', action_name, job, total=count
+                )
+
             # Execute action
             try:
-                result = action_func(model_admin, request, queryset)
-            except Exception as e:
+                run_action(
+                    action_func, model_admin, request, queryset, self.get_queryset(), count,
+                    operation_id=request.data.get('operation_id'),
+                )
+            except ActionFailed as e:
+                # Chunks before the failing one are committed
+                error = str(e)
+                if e.done:
+                    error = f'{error} ({e.done} of {count} items were already processed.)'
                 return Response(
-                    {'error': str(e)},
+                    {'error': error, 'affected_count': e.done, 'total': count},
                     status=status.HTTP_400_BAD_REQUEST
                 )
 
@@ -438,14 +632,15 @@ class ViewSetFactory:
                 'message': f'{description} completed for {count} items.',
             })
 
-        action_endpoint.__name__ = f'action_{action_name}'
-        return action_endpoint
+        return _admin_action(
+            action_endpoint, f'action_{action_name}',
+            detail=False, methods=['post'], url_path=f'actions/{action_name}'
+        )
 
     @classmethod
     def _create_object_tool_endpoint(cls, tool_name, tool_func, model_admin):
         """Create a detail-level action endpoint for object tools."""
 
-        @action(detail=True, methods=['post'], url_path=f'tools/{tool_name}')
         def tool_endpoint(self, request, pk=None):
             """Execute object tool on single object."""
             try:
@@ -456,6 +651,12 @@ class ViewSetFactory:
                     status=status.HTTP_404_NOT_FOUND
                 )
 
+            if is_background(tool_func):
+                return cls._submit_background(
+                    self, request, 'object_tool', tool_name,
+                    lambda progress: tool_func(model_admin, request, obj), object_id=obj.pk
+                )
+
             # Execute tool
             try:
                 result = tool_func(model_admin, request, obj)
@@ -484,8 +685,10 @@ class ViewSetFactory:
                     status=status.HTTP_400_BAD_REQUEST
                 )
 
-        tool_endpoint.__name__ = f'object_tool_{tool_name}'
-        return tool_endpoint
+        return _admin_action(
+            tool_endpoint, f'object_tool_{tool_name}',
+            detail=True, methods=['post'], url_path=f'tools/{tool_name}'
+        )
 
     @classmethod
     def _create_custom_view_endpoint(cls, view_name, view_func, model_admin):
@@ -504,7 +707,6 @@ class ViewSetFactory:
 
         if is_detail:
             # Detail-level view: /api/admin/{app}/{model}/{pk}/views/{view_name}/
-            @action(detail=True, methods=allowed_methods, url_path=f'views/{view_name}')
             def view_endpoint(self, request, pk=None):
                 """Execute custom detail-level view."""
                 try:
@@ -515,6 +717,12 @@ class ViewSetFactory:
                         status=status.HTTP_404_NOT_FOUND
                     )
 
+                if is_background(view_func):
+                    return cls._submit_background(
+                        self, request, 'custom_view', view_name,
+                        lambda progress: view_func(model_admin, request, pk), object_id=obj.pk
+                    )
+
                 try:
                     result = view_func(model_admin, request, pk)
 
@@ -534,13 +742,20 @@ class ViewSetFactory:
                         status=status.HTTP_400_BAD_REQUEST
                     )
 
-            view_endpoint.__name__ = f'custom_view_{view_name}'
-            return view_endpoint
+            return _admin_action(
+                view_endpoint, f'custom_view_{view_name}',
+                detail=True, methods=allowed_methods, url_path=f'views/{view_name}'
+            )
         else:
             # List-level view: /api/admin/{app}/{model}/views/{view_name}/
-            @action(detail=False, methods=allowed_methods, url_path=f'views/{view_name}')
             def view_endpoint(self, request):
                 """Execute custom list-level view."""
+                if is_background(view_func):
+                    return cls._submit_background(
+                        self, request, 'custom_view', view_name,
+                        lambda progress: view_func(model_admin, request)
+                    )
+
                 try:
                     result = view_func(model_admin, request)
 
@@ -560,8 +775,10 @@ class ViewSetFactory:
                         status=status.HTTP_400_BAD_REQUEST
                     )
 
-            view_endpoint.__name__ = f'custom_view_{view_name}'
-            return view_endpoint
+            return _admin_action(
+                view_endpoint, f'custom_view_{view_name}',
+                detail=False, methods=allowed_methods, url_path=f'views/{view_name}'
+            )
 
     @classmethod
     def clear_cache(cls):
@@ -7,19 +7,37 @@ No authentication required so load balancers and k8s can hit it.
 
 from django.http import JsonResponse
 from django.utils import timezone
-from django.views import View
+from rest_framework.views import APIView
 
+from ..core.factory_cache import get_factory_stats
 
-class HealthView(View):
+
+class HealthView(APIView):
     """
     GET <mount>/api/health/ (e.g. /admin/api/health/)
 
     Returns:
         {"status": "ok", "timestamp": "2025-02-07T12:00:00Z"}
+
+    With ?verbose=1 and an active staff user, also returns factory cache
+    counters under "caches":
+        {"viewsets": {"size": 12, "hits": 340, "misses": 12, "build_time_ms": 41.2}, ...}
     """
 
+    permission_classes = []
+    throttle_classes = []
+
+    def perform_authentication(self, request):
+        # Authenticate lazily: only ?verbose=1 looks at the user
+        pass
+
     def get(self, request):
-        return JsonResponse({
+        data = {
             'status': 'ok',
             'timestamp': timezone.now().isoformat(),
-        })
+        }
+        if request.query_params.get('verbose'):
+            user = request.user
+            if user and user.is_active and user.is_staff:
+                data['caches'] = get_factory_stats()
+        return JsonResponse(data)
@@ -0,0 +1,81 @@
+"""
+Background job endpoints (see djnext_admin.jobs).
+
+jobs/: the user's recent jobs. jobs/<id>/: status and progress of one job.
+jobs/<id>/result/: its return value once done. A job is visible to the user
+who started it and to superusers.
+"""
+
+from rest_framework.views import APIView
+from rest_framework.response import Response
+from rest_framework import status
+
+from ..models import Job
+from ..jobs import serialize_job
+from ..permissions import DJNextBasePermission
+
+
+# Jobs returned by the list endpoint
+RECENT_JOBS_LIMIT = 50
+
+
+def get_user_jobs(request):
+    jobs = Job.objects.all()
+    if not request.user.is_superuser:
+        jobs = jobs.filter(user=request.user)
+    return jobs
+
+
+class JobListView(APIView):
+    """
+    GET /api/{path}/jobs/?status=running
+
+    Returns { results: [ job ] } with the user's most recent jobs.
+    """
+
+    permission_classes = [DJNextBasePermission]
+
+    def get(self, request):
+        jobs = get_user_jobs(request)
+        job_status = request.query_params.get('status', '').strip()
+        if job_status:
+            jobs = jobs.filter(status=job_status)
+        jobs = jobs.order_by('-created_at')[:RECENT_JOBS_LIMIT]
+        return Response({'results': [serialize_job(job) for job in jobs]})
+
+
+class JobDetailView(APIView):
+    """
+    GET /api/{path}/jobs/{job_id}/
+
+    Returns the job's status, progress ({ done, total }) and error.
+    """
+
+    permission_classes = [DJNextBasePermission]
+
+    def get(self, request, job_id):
+        job = get_user_jobs(request).filter(pk=job_id).first()
+        if job is None:
+            return Response({'error': 'Job not found.'}, status=status.HTTP_404_NOT_FOUND)
+        return Response(serialize_job(job))
+
+
+class JobResultView(APIView):
+    """
+    GET /api/{path}/jobs/{job_id}/result/
+
+    Returns the job with its result; 409 while the job has not finished.
+    """
+
+    permission_classes = [DJNextBasePermission]
+
+    def get(self, request, job_id):
+        job = get_user_jobs(request).filter(pk=job_id).first()
+        if job is None:
+            return Response({'error': 'Job not found.'}, status=status.HTTP_404_NOT_FOUND)
+        if job.status not in (Job.Status.DONE, Job.Status.FAILED):
+            return Response(
+                {'error': 'Job has not finished.', 'status': job.status},
+                status=status.HTTP_409_CONFLICT
+            )
+        return Response(serialize_job(job, include_result=True))
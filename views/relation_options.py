@@ -1,21 +1,41 @@
 """
-Generic relation options endpoint for relation fields (FK, M2M).
-Use when the related model is not registered with DJNext (e.g. auth.Group, auth.Permission)
-so the normal model autocomplete is not available.
+Generic relation endpoints for relation fields (FK, M2M).
+
+relation-options: search options of any model. Use when the related model is not
+registered with DJNext (e.g. auth.Group, auth.Permission) so the normal model
+autocomplete is not available.
+
+relation-labels: labels of already selected ids across several models.
 """
 
+from django.core.exceptions import ValidationError
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
 
+from ..core.registry import get_model_admin, get_model_permissions
+from ..core.row_scope import apply_row_scope
 from ..permissions import DJNextBasePermission
+from .autocomplete import (
+    get_autocomplete_results,
+    get_autocomplete_search_fields,
+    get_index_results,
+    get_label_fields,
+    get_labels,
+    get_model_lookup_index,
+    get_page_size,
+)
+
+
+# Max ids resolved by one relation-labels request (all models together)
+RELATION_LABELS_MAX_IDS = 1000
 
 
 class RelationOptionsView(APIView):
     """
     GET /api/{path}/relation-options/?app_label=auth&model_name=group&q=...&page_size=20
 
-    Returns { results: [ { id, text } ], has_more } for any Django model.
+    Returns { results: [ { id, text } ], has_more, next_cursor } for any Django model.
     Used by relation fields when the target model may not be registered (e.g. Group, Permission).
     """
 
@@ -25,7 +45,7 @@ class RelationOptionsView(APIView):
         app_label = request.query_params.get('app_label', '').strip()
         model_name = request.query_params.get('model_name', '').strip()
         search = request.query_params.get('q', '').strip()
-        page_size = min(int(request.query_params.get('page_size', 50)), 100)
+        page_size = get_page_size(request.query_params.get('page_size'), default=50)
 
         if not app_label or not model_name:
             return Response(
@@ -42,34 +62,89 @@ class RelationOptionsView(APIView):
                 status=status.HTTP_404_NOT_FOUND
             )
 
+        # Registered models keep their row scope (djnext_row_scope), search fields and labels
+        model_admin = None
+        entry = get_model_admin(model._meta.app_label, model._meta.model_name)
+        if entry is not None:
+            model_admin = entry[1]
+
+        cursor = request.query_params.get('cursor')
+        index = get_model_lookup_index(model, model_admin)
+        if index is not None:
+            return Response(get_index_results(index, model, search, page_size, cursor))
+
         qs = model._default_manager.all()
+        if model_admin is not None:
+            qs = apply_row_scope(qs, request, model_admin)
+
+        return Response(get_autocomplete_results(
+            qs,
+            search,
+            get_autocomplete_search_fields(model, getattr(model_admin, 'search_fields', None)),
+            label_fields=get_label_fields(model_admin),
+            page_size=page_size,
+            cursor=cursor,
+        ))
+
+
+class RelationLabelsView(APIView):
+    """
+    POST /api/{path}/relation-labels/
+
+    Request: { "auth.group": [1, 2], "shop.product": [7] }
+    Response: {
+        "results": { "auth.group": { "1": "Admins", "2": "Staff" }, ... },
+        "denied": [ labels without view permission ],
+        "invalid": [ unknown model labels or malformed id lists ]
+    }
+
+    Resolves the display labels of selected relation values for form
+    hydration: one pk__in query per model (none for indexed lookup tables).
+    Ids that do not exist (or are outside the row scope) are omitted.
+    """
+
+    permission_classes = [DJNextBasePermission]
+
+    def post(self, request):
+        data = request.data
+        if not isinstance(data, dict) or not data:
+            return Response(
+                {'error': 'Expected an object of {"app_label.model_name": [ids]}.'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        total = sum(len(ids) for ids in data.values() if isinstance(ids, list))
+        if total > RELATION_LABELS_MAX_IDS:
+            return Response(
+                {'error': f'At most {RELATION_LABELS_MAX_IDS} ids per request.'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        from django.apps import apps
+
+        results = {}
+        denied = []
+        invalid = []
+        for label, ids in data.items():
+            try:
+                model = apps.get_model(label)
+            except (LookupError, ValueError):
+                invalid.append(label)
+                continue
+            if not isinstance(ids, list):
+                invalid.append(label)
+                continue
+
+            perms = get_model_permissions(request.user, model)
+            if not (perms.get('view') or perms.get('change')):
+                denied.append(label)
+                continue
+
+            pks = set()
+            for value in ids:
+                try:
+                    pks.add(model._meta.pk.to_python(value))
+                except (ValidationError, TypeError):
+                    continue
+            results[label] = get_labels(request, model, pks) if pks else {}
 
-        if search:
-            from django.db.models import Q
-            text_fields = []
-            for f in model._meta.get_fields():
-                if getattr(f, 'concrete', True) and getattr(f, 'get_internal_type', None) and not getattr(f, 'many_to_many', False) and not getattr(f, 'one_to_many', False):
-                    if f.get_internal_type() in ('CharField', 'TextField', 'SlugField'):
-                        text_fields.append(f.name)
-            if not text_fields:
-                for name in ('name', 'username', 'codename', 'title', 'label'):
-                    if hasattr(model._meta, 'get_field'):
-                        try:
-                            model._meta.get_field(name)
-                            text_fields.append(name)
-                            break
-                        except Exception:
-                            pass
-            if text_fields:
-                query = Q()
-                for field_name in text_fields[:5]:
-                    query |= Q(**{f'{field_name}__icontains': search})
-                qs = qs.filter(query)
-
-        qs = qs[:page_size]
-        results = [{'id': obj.pk, 'text': str(obj)} for obj in qs]
-
-        return Response({
-            'results': results,
-            'has_more': len(results) == page_size,
-        })
+        return Response({'results': results, 'denied': denied, 'invalid': invalid})
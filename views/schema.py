@@ -2,27 +2,28 @@
 Schema endpoints - return admin configuration for frontend.
 """
 
+import hashlib
+
+from django.conf import settings as django_settings
+from django.core.cache import cache
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import DateField
 from django.http import JsonResponse
+from django.utils import translation
 from rest_framework.views import APIView
 from rest_framework.permissions import AllowAny
-
-
-def _title_name(s):
-    """Capitalize model/verbose name for display (e.g. 'user address' -> 'User Address')."""
-    if s is None:
-        return ''
-    return str(s).replace('_', ' ').title()
 from rest_framework.response import Response
 
+from ..core.cardinality import get_cardinality
 from ..core.registry import (
     get_models_by_app,
     get_model_admin,
-    get_app_config,
     get_model_permissions,
 )
-from ..core.introspection import ModelIntrospector
+from ..core.schema_cache import get_admin_fingerprint, get_app_skeleton, get_model_schema
 from ..permissions import DJNextBasePermission
 from ..settings import djnext_settings
+from .facets import get_facet_fields
 
 
 def _get_api_base_from_request(request, path_suffix='schema'):
@@ -64,6 +65,83 @@ def build_site_info(request, api_base):
     return info
 
 
+def _add_cardinality(schema, model, model_admin):
+    """
+    Add estimated 'cardinality' and 'options_mode' ('preload' or 'remote',
+    above AUTOCOMPLETE_THRESHOLD) to relation and list_filter fields.
+    """
+    list_filter = set(get_facet_fields(model_admin))
+    fields = []
+    for entry in schema.get('fields') or []:
+        if not entry.get('relation') and entry.get('name') not in list_filter:
+            continue
+        try:
+            field = model._meta.get_field(entry['name'])
+        except FieldDoesNotExist:
+            continue
+        # Dates are filtered by hierarchy/buckets, not option lists
+        if isinstance(field, DateField):
+            continue
+        fields.append(field)
+
+    cardinality = get_cardinality(model, fields)
+    threshold = djnext_settings.AUTOCOMPLETE_THRESHOLD
+    for entry in schema.get('fields') or []:
+        count = cardinality.get(entry.get('name'))
+        if count is not None:
+            entry['cardinality'] = count
+            entry['options_mode'] = 'remote' if count > threshold else 'preload'
+
+
+def build_model_schema(request, model, model_admin, api_base):
+    """
+    Full model schema for a request: the cached, permission-independent schema
+    with the user's permissions, absolute media URLs and endpoints merged on top.
+    Used by ModelSchemaView and the per-model viewset schema action.
+    """
+    schema = get_model_schema(model, model_admin, request)
+    app_label = model._meta.app_label
+    model_name = model._meta.model_name
+
+    # Add permissions
+    schema['permissions'] = get_model_permissions(request.user, model)
+
+    # Cardinality hints: preload options or use server-side autocomplete
+    _add_cardinality(schema, model, model_admin)
+
+    # Per-model custom CSS/JS (like ModelAdmin.media / djnext_media)
+    # Relative URLs (e.g. /static/...) are converted to absolute so the frontend can load them
+    media = getattr(model_admin, 'djnext_media', None)
+    if isinstance(media, dict):
+        def _absolute(u):
+            if u and str(u).startswith('/'):
+                return request.build_absolute_uri(u)
+            return u
+        schema['custom_css'] = [_absolute(u) for u in (media.get('css') or [])]
+        schema['custom_js'] = [_absolute(u) for u in (media.get('js') or [])]
+    else:
+        schema['custom_css'] = []
+        schema['custom_js'] = []
+
+    # Add endpoints
+    schema['endpoints'] = {
+        'list': f'{api_base}{app_label}/{model_name}/',
+        'create': f'{api_base}{app_label}/{model_name}/',
+        'detail': f'{api_base}{app_label}/{model_name}/{{id}}/',
+        'update': f'{api_base}{app_label}/{model_name}/{{id}}/',
+        'delete': f'{api_base}{app_label}/{model_name}/{{id}}/',
+        'schema': f'{api_base}{app_label}/{model_name}/schema/',
+        'autocomplete': f'{api_base}{app_label}/{model_name}/autocomplete/',
+        'facets': f'{api_base}{app_label}/{model_name}/facets/',
+        'choices': f'{api_base}{app_label}/{model_name}/choices/{{field}}/',
+    }
+    for entry in schema.get('fields') or []:
+        if entry.get('remote_choices'):
+            entry['choices_url'] = f'{api_base}{app_label}/{model_name}/choices/{entry["name"]}/'
+
+    return schema
+
+
 class SiteInfoView(APIView):
     """
     Minimal site details for login/branding. No authentication required.
@@ -85,6 +163,9 @@ class GlobalSchemaView(APIView):
     Returns complete admin schema for all registered models.
     Frontend uses this to build the entire admin UI.
 
+    apps/navigation are memoized per permission signature; only the site and
+    user blocks are built for every request.
+
     GET /api/{path}/schema/
     """
 
@@ -92,12 +173,76 @@ class GlobalSchemaView(APIView):
 
     def get(self, request):
         api_base = _get_api_base_from_request(request, 'schema')
-        return Response({
+        accessible = self._get_accessible_models(request)
+        data = {
             'site': build_site_info(request, api_base),
             'user': self._get_user_info(request),
-            'apps': self._get_apps_schema(request, api_base),
-            'navigation': self._get_navigation(request, api_base),
-        })
+        }
+        data.update(self._get_apps_and_navigation(accessible, api_base))
+        return Response(data)
+
+    def _get_apps_and_navigation(self, accessible, api_base):
+        """
+        apps/navigation payload, shared through the Django cache by every user
+        with the same permission signature (see _get_permission_signature).
+        """
+        timeout = djnext_settings.SCHEMA_CACHE_TIMEOUT
+        key = None
+        if timeout:
+            signature = self._get_permission_signature(accessible, api_base)
+            key = f'djnext_admin:global_schema:{signature}'
+            payload = cache.get(key)
+            if payload is not None:
+                return payload
+
+        payload = {
+            'apps': self._get_apps_schema(accessible, api_base),
+            'navigation': self._get_navigation(accessible, api_base),
+        }
+        if key:
+            cache.set(key, payload, timeout)
+        return payload
+
+    def _get_permission_signature(self, accessible, api_base):
+        """
+        Hash of everything apps/navigation depend on: the accessible models with
+        their permissions and admin fingerprints, the API base, the active
+        language, DJNEXT_ADMIN settings and the package version.
+        """
+        from .. import __version__
+        parts = [
+            __version__,
+            api_base,
+            translation.get_language() or '',
+            repr(sorted(getattr(django_settings, 'DJNEXT_ADMIN', {}).items())),
+        ]
+        for app_label, models in accessible:
+            for model, model_admin, permissions in models:
+                parts.append('{}:{}:{}'.format(
+                    model._meta.label_lower,
+                    get_admin_fingerprint(model, model_admin),
+                    ''.join('1' if permissions[p] else '0' for p in ('add', 'change', 'delete', 'view')),
+                ))
+        return hashlib.sha1('|'.join(parts).encode()).hexdigest()
+
+    def _get_accessible_models(self, request):
+        """
+        Registered models the user has any permission for, grouped by app.
+        Permissions are resolved once per model and shared by apps and navigation.
+
+        Returns:
+            list: [(app_label, [(Model, ModelAdmin, permissions), ...]), ...]
+        """
+        accessible = []
+        for app_label, models in get_models_by_app().items():
+            items = []
+            for model, model_admin in models:
+                permissions = get_model_permissions(request.user, model)
+                if any(permissions.values()):
+                    items.append((model, model_admin, permissions))
+            if items:
+                accessible.append((app_label, items))
+        return accessible
 
     def _get_user_info(self, request):
         """Current user information."""
@@ -116,107 +261,82 @@ class GlobalSchemaView(APIView):
             'is_staff': user.is_staff,
         }
 
-    def _get_apps_schema(self, request, api_base):
+    def _get_apps_schema(self, accessible, api_base):
         """Get schema for all apps and their models."""
         apps = []
-        models_by_app = get_models_by_app()
-
-        for app_label, models in models_by_app.items():
-            app_config = get_app_config(app_label)
-
-            app_schema = {
-                'app_label': app_label,
-                'verbose_name': app_config.verbose_name if app_config else app_label.title(),
-                'models': [],
-            }
-
-            for model, model_admin in models:
-                # Check if user has any permission for this model
-                permissions = get_model_permissions(request.user, model)
-                if not any(permissions.values()):
-                    continue
-
-                model_schema = self._get_model_summary(
-                    model, model_admin, permissions, api_base
-                )
-                app_schema['models'].append(model_schema)
-
-            # Only include apps with accessible models
-            if app_schema['models']:
-                apps.append(app_schema)
+        permissions_by_label = self._get_permissions_by_label(accessible)
+
+        for app_entry in get_app_skeleton():
+            models = [
+                self._get_model_summary(entry, permissions_by_label[entry['label']], api_base)
+                for entry in app_entry['models']
+                if entry['label'] in permissions_by_label
+            ]
+            if models:
+                apps.append({
+                    'app_label': app_entry['app_label'],
+                    'verbose_name': app_entry['verbose_name'],
+                    'models': models,
+                })
 
         return apps
 
-    def _get_model_summary(self, model, model_admin, permissions, api_base):
-        """Get summary schema for a model (used in global schema)."""
-        opts = model._meta
-        app_label = opts.app_label
-        model_name = opts.model_name
-
-        # Get list_display from admin
-        list_display = ['id', '__str__']
-        if model_admin:
-            ld = getattr(model_admin, 'list_display', None)
-            if ld:
-                list_display = [f for f in ld if f != '__str__']
-                if 'id' not in list_display:
-                    list_display = ['id'] + list_display
-
+    def _get_model_summary(self, entry, permissions, api_base):
+        """Get summary schema for a model (used in global schema) from its skeleton entry."""
+        app_label, model_name = entry['label'].split('.', 1)
         out = {
-            'name': opts.object_name,
-            'model_name': model_name,
-            'verbose_name': _title_name(opts.verbose_name),
-            'verbose_name_plural': _title_name(opts.verbose_name_plural),
+            'name': entry['name'],
+            'model_name': entry['model_name'],
+            'verbose_name': entry['verbose_name'],
+            'verbose_name_plural': entry['verbose_name_plural'],
             'endpoints': {
                 'list': f'{api_base}{app_label}/{model_name}/',
                 'create': f'{api_base}{app_label}/{model_name}/',
                 'schema': f'{api_base}{app_label}/{model_name}/schema/',
             },
             'permissions': permissions,
-            'list_display': list_display,
+            'list_display': list(entry['list_display']),
         }
-        if model_admin and hasattr(model_admin, 'djnext_icon'):
-            icon = getattr(model_admin, 'djnext_icon', None)
-            if icon:
-                out['icon'] = str(icon)
+        if entry.get('icon'):
+            out['icon'] = entry['icon']
         return out
 
-    def _get_navigation(self, request, api_base):
+    def _get_navigation(self, accessible, api_base):
         """Get navigation structure for sidebar."""
         nav = []
-        models_by_app = get_models_by_app()
+        permissions_by_label = self._get_permissions_by_label(accessible)
 
-        for app_label, models in models_by_app.items():
-            app_config = get_app_config(app_label)
-            app_nav = {
-                'label': app_config.verbose_name if app_config else app_label.title(),
-                'app_label': app_label,
-                'items': [],
-            }
-
-            for model, model_admin in models:
-                permissions = get_model_permissions(request.user, model)
-                if not any(permissions.values()):
+        for app_entry in get_app_skeleton():
+            items = []
+            for entry in app_entry['models']:
+                if entry['label'] not in permissions_by_label:
                     continue
-
-                model_name = model._meta.model_name
+                app_label, model_name = entry['label'].split('.', 1)
                 item = {
-                    'label': _title_name(model._meta.verbose_name_plural),
-                    'model_name': model_name,
+                    'label': entry['verbose_name_plural'],
+                    'model_name': entry['model_name'],
                     'url': f'{api_base}{app_label}/{model_name}/',
                 }
-                # Optional: icon name from admin (e.g. Lucide name: Users, ShoppingCart)
-                if model_admin and hasattr(model_admin, 'djnext_icon'):
-                    icon = getattr(model_admin, 'djnext_icon', None)
-                    if icon:
-                        item['icon'] = str(icon)
-                app_nav['items'].append(item)
+                if entry.get('icon'):
+                    item['icon'] = entry['icon']
+                items.append(item)
 
-            if app_nav['items']:
-                nav.append(app_nav)
+            if items:
+                nav.append({
+                    'label': app_entry['verbose_name'],
+                    'app_label': app_entry['app_label'],
+                    'items': items,
+                })
 
         return nav
 
+    def _get_permissions_by_label(self, accessible):
+        return {
+            model._meta.label_lower: permissions
+            for app_label, models in accessible
+            for model, model_admin, permissions in models
+        }
+
 
 class ModelSchemaView(APIView):
     """
@@ -239,37 +359,7 @@ class ModelSchemaView(APIView):
         # Detect API base
         api_base = self._get_api_base(request, app_label, model_name)
 
-        # Full introspection
-        introspector = ModelIntrospector(model, model_admin)
-        schema = introspector.get_schema(request)
-
-        # Add permissions
-        schema['permissions'] = get_model_permissions(request.user, model)
-
-        # Per-model custom CSS/JS (like ModelAdmin.media / djnext_media)
-        # Relative URLs (e.g. /static/...) are converted to absolute so the frontend can load them
-        media = getattr(model_admin, 'djnext_media', None)
-        if isinstance(media, dict):
-            def _absolute(u):
-                if u and str(u).startswith('/'):
-                    return request.build_absolute_uri(u)
-                return u
-            schema['custom_css'] = [_absolute(u) for u in (media.get('css') or [])]
-            schema['custom_js'] = [_absolute(u) for u in (media.get('js') or [])]
-        else:
-            schema['custom_css'] = []
-            schema['custom_js'] = []
-
-        # Add endpoints
-        schema['endpoints'] = {
-            'list': f'{api_base}{app_label}/{model_name}/',
-            'create': f'{api_base}{app_label}/{model_name}/',
-            'detail': f'{api_base}{app_label}/{model_name}/{{id}}/',
-            'update': f'{api_base}{app_label}/{model_name}/{{id}}/',
-            'delete': f'{api_base}{app_label}/{model_name}/{{id}}/',
-            'schema': f'{api_base}{app_label}/{model_name}/schema/',
-            'autocomplete': f'{api_base}{app_label}/{model_name}/autocomplete/',
-        }
+        schema = build_model_schema(request, model, model_admin, api_base)
 
         return Response(schema)
 
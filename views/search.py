@@ -3,11 +3,15 @@ Global search across all registered models (char/text fields).
 Returns matching records with concatenated display fields for the frontend.
 """
 
-from django.db.models import Q
+from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.db import connections
+from django.db.models import CharField, IntegerField, Q, TextField, Value
+from django.db.models.functions import Cast
 from rest_framework.views import APIView
 from rest_framework.response import Response
 
 from ..core.registry import get_registered_models, get_model_permissions
+from ..core.row_scope import apply_row_scope
 from ..permissions import DJNextBasePermission
 from ..settings import djnext_settings
 
@@ -16,6 +20,8 @@ from ..settings import djnext_settings
 SEARCH_LIMIT_PER_MODEL = 5
 SEARCH_LIMIT_TOTAL = 30
 SEARCH_MIN_QUERY_LENGTH = 2
+# Display columns projected per branch in 'union' search mode
+UNION_DISPLAY_COLUMNS = 5
 
 
 def _get_searchable_field_names(model, model_admin):
@@ -92,6 +98,9 @@ class GlobalSearchView(APIView):
     GET /api/{path}/search/?q=...
 
     Returns records the user can view, with app_label, model_name, id, display.
+
+    With SEARCH_MODE = 'union', the per-model filters are compiled into one
+    UNION ALL query per database alias instead of one query per model.
     """
 
     permission_classes = [DJNextBasePermission]
@@ -101,14 +110,22 @@ class GlobalSearchView(APIView):
         if len(q) < SEARCH_MIN_QUERY_LENGTH:
             return Response({'results': []})
 
+        if djnext_settings.SEARCH_MODE == 'union':
+            results = self._search_union(request, q)
+        else:
+            results = self._search_per_model(request, q)
+
+        # Order: keep by model (already grouped by loop), then by display
+        return Response({'results': results})
+
+    def _get_search_querysets(self, request, q):
+        """
+        Yield (model, model_admin, queryset) for every model the user can view,
+        with the search filter applied (not yet sliced or evaluated).
+        """
         user = request.user
-        results = []
-        total = 0
 
         for model, model_admin in get_registered_models():
-            if total >= SEARCH_LIMIT_TOTAL:
-                break
-
             perms = get_model_permissions(user, model)
             if not perms.get('view'):
                 continue
@@ -131,28 +148,172 @@ class GlobalSearchView(APIView):
                         qs = model_admin.get_queryset(request)
                     except TypeError:
                         pass
-                qs = qs.filter(q_obj)[:SEARCH_LIMIT_PER_MODEL]
+                qs = apply_row_scope(qs, request, model_admin).filter(q_obj)
             except Exception:
                 continue
 
-            app_label = model._meta.app_label
-            model_name = model._meta.model_name
-            model_label = str(model._meta.verbose_name_plural)
+            yield model, model_admin, qs
+
+    def _search_per_model(self, request, q):
+        """One query per model, stopping once SEARCH_LIMIT_TOTAL is reached."""
+        results = []
+
+        for model, model_admin, qs in self._get_search_querysets(request, q):
+            if len(results) >= SEARCH_LIMIT_TOTAL:
+                break
+
+            try:
+                objs = list(qs[:SEARCH_LIMIT_PER_MODEL])
+            except Exception:
+                continue
 
-            for obj in qs:
-                if total >= SEARCH_LIMIT_TOTAL:
+            for obj in objs:
+                if len(results) >= SEARCH_LIMIT_TOTAL:
                     break
                 display = _get_display_string(obj, model, model_admin)
-                if not display:
-                    display = str(obj) if hasattr(obj, '__str__') else f'#{obj.pk}'
-                results.append({
-                    'app_label': app_label,
-                    'model_name': model_name,
-                    'id': obj.pk,
-                    'display': display[:200],
-                    'model_label': model_label,
-                })
-                total += 1
+                results.append(_build_result(model, obj.pk, display or str(obj)))
 
-        # Order: keep by model (already grouped by loop), then by display
-        return Response({'results': results})
+        return results
+
+    def _search_union(self, request, q):
+        """
+        One UNION ALL query per database alias. Each branch projects
+        (model tag, pk, display columns) and is limited to SEARCH_LIMIT_PER_MODEL.
+
+        Display columns are only projected for models whose djnext_display lists
+        plain concrete fields; models displayed via __str__ or admin methods are
+        resolved afterwards with one in_bulk() per model that had hits. When a
+        database rejects the UNION, its branches run one by one instead.
+        """
+        branches_by_db = {}
+        models = []
+
+        for model, model_admin, qs in self._get_search_querysets(request, q):
+            tag = len(models)
+            display_fields = _get_display_columns(model, model_admin)
+            try:
+                branch = _build_union_branch(qs, tag, display_fields)
+            except Exception:
+                continue
+            models.append((model, model_admin, display_fields))
+            branches_by_db.setdefault(qs.db, []).append(branch)
+
+        rows = []
+        for using, branches in branches_by_db.items():
+            combined = branches[0].union(*branches[1:], all=True)
+            try:
+                rows.extend(combined.order_by('_djnext_tag')[:SEARCH_LIMIT_TOTAL])
+                continue
+            except Exception:
+                pass
+            # One failing branch must not drop every hit on this database
+            for branch in branches:
+                try:
+                    rows.extend(branch)
+                except Exception:
+                    continue
+
+        rows.sort(key=lambda row: row[0])
+        rows = rows[:SEARCH_LIMIT_TOTAL]
+
+        # The pk comes back as text (UUIDs without dashes on SQLite and MySQL):
+        # convert it back with the pk field
+        hits = []
+        for row in rows:
+            tag = row[0]
+            try:
+                pk = models[tag][0]._meta.pk.to_python(row[1])
+            except ValidationError:
+                continue
+            hits.append((tag, pk, row))
+
+        # Models without projected display columns need their objects for __str__
+        pending = {}
+        for tag, pk, _ in hits:
+            if models[tag][2] is None:
+                pending.setdefault(tag, []).append(pk)
+
+        objects = {}
+        for tag, pks in pending.items():
+            model, model_admin, _ = models[tag]
+            try:
+                objects[tag] = model._default_manager.in_bulk(pks)
+            except Exception:
+                objects[tag] = {}
+
+        results = []
+        for tag, pk, row in hits:
+            model, model_admin, display_fields = models[tag]
+            if display_fields is None:
+                obj = objects[tag].get(pk)
+                if obj is None:
+                    continue
+                display = _get_display_string(obj, model, model_admin) or str(obj)
+            else:
+                parts = [p for p in row[2:2 + len(display_fields)] if p]
+                display = ' · '.join(parts) or f'#{pk}'
+            results.append(_build_result(model, pk, display))
+
+        return results
+
+
+def _build_result(model, pk, display):
+    """Single search result in the response shape expected by the frontend."""
+    return {
+        'app_label': model._meta.app_label,
+        'model_name': model._meta.model_name,
+        'id': pk,
+        'display': display[:200],
+        'model_label': str(model._meta.verbose_name_plural),
+    }
+
+
+def _get_display_columns(model, model_admin):
+    """
+    Concrete, non-relational field names from djnext_display that can be
+    projected in SQL. None when the display needs Python (__str__, admin or
+    model methods, relations).
+    """
+    display_spec = getattr(model_admin, 'djnext_display', None)
+    if display_spec is None:
+        return None
+
+    names = []
+    for fname in list(display_spec)[:UNION_DISPLAY_COLUMNS]:
+        if fname == '__str__' or callable(getattr(model_admin, fname, None)):
+            return None
+        try:
+            field = model._meta.get_field(fname)
+        except FieldDoesNotExist:
+            return None
+        if not getattr(field, 'concrete', False) or field.is_relation:
+            return None
+        names.append(fname)
+    return names
+
+
+def _build_union_branch(qs, tag, display_fields):
+    """
+    Project a filtered queryset to (tag, pk, d0..dN) for UNION ALL. Every branch
+    has the same column count and types; missing display columns are ''.
+    """
+    display_fields = display_fields or []
+    annotations = {
+        '_djnext_tag': Value(tag, output_field=IntegerField()),
+        '_djnext_pk': Cast('pk', output_field=CharField()),
+    }
+    for i in range(UNION_DISPLAY_COLUMNS):
+        if i < len(display_fields):
+            annotations[f'_djnext_d{i}'] = Cast(display_fields[i], output_field=TextField())
+        else:
+            annotations[f'_djnext_d{i}'] = Value('', output_field=TextField())
+
+    connection = connections[qs.db]
+    if not connection.features.supports_slicing_ordering_in_compound:
+        # LIMIT is not allowed directly inside compound branches (e.g. SQLite);
+        # bound the branch through a sliced pk subquery instead.
+        limited_pks = qs.order_by().values('pk')[:SEARCH_LIMIT_PER_MODEL]
+        qs = qs.model._default_manager.using(qs.db).filter(pk__in=limited_pks)
+        return qs.annotate(**annotations).order_by().values_list(*annotations)
+
+    return qs.annotate(**annotations).values_list(*annotations)[:SEARCH_LIMIT_PER_MODEL]